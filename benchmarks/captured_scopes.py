@@ -0,0 +1,86 @@
+"""Captured scope benchmark – peak memory of keeping many callbacks whose defining frames held a large list.
+
+Usage: python benchmarks/captured_scopes.py [--engine NAME] [callbacks]
+
+Each call to make_callback builds a 10,000-element scratch list and returns
+a closure over a single counter. Only the counter should stay alive.
+"""
+
+import io
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from gladlang.core.util.runner import run
+
+SOURCE = """
+DEF make_callback(seed)
+    LET scratch = [seed] * 10000
+    LET count = LEN(scratch) - 10000 + seed
+
+    DEF tick()
+        count = count + 1
+        RETURN count
+    ENDDEF
+
+    RETURN tick
+ENDDEF
+
+LET callbacks = []
+FOR (LET i = 0; i < {callbacks}; i++)
+    callbacks = callbacks + [make_callback(i)]
+ENDFOR
+
+LET total = 0
+FOR callback IN callbacks
+    total = total + callback()
+ENDFOR
+
+PRINTLN total
+"""
+
+
+def measure(text, engine):
+    original_stdout = sys.stdout
+    sys.stdout = buffer = io.StringIO()
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        _, error = run("<captured_scopes>", text, engine=engine)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        sys.stdout = original_stdout
+
+    if error:
+        raise SystemExit(error.as_string())
+
+    return elapsed, peak, buffer.getvalue().strip()
+
+
+def main():
+    args = sys.argv[1:]
+    engines = ["tree", "vm", "closure", "frames"]
+
+    if len(args) >= 2 and args[0] == "--engine":
+        engines = [args[1]]
+        args = args[2:]
+
+    callbacks = int(args[0]) if args else 200
+
+    sys.stdout.write(f"{'engine':<12}{'time':>10}{'peak':>12}  result\n")
+
+    text = SOURCE.format(callbacks=callbacks)
+    for engine in engines:
+        elapsed, peak, output = measure(text, engine)
+        sys.stdout.write(
+            f"{engine:<12}{elapsed:>9.3f}s{peak / 2**20:>10.1f}MB  {output}\n"
+        )
+
+
+if __name__ == "__main__":
+    main()
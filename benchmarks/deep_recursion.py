@@ -0,0 +1,76 @@
+"""Deep recursion benchmark – runs non-tail recursion over a 100,000-element list on the frames engine.
+
+Usage: python benchmarks/deep_recursion.py [--repeat N] [--stack-memory MB] [depth]
+
+The interpreter-wide Python recursion limit is left at its default, so the
+run only succeeds because FrameVM keeps GladLang frames off the Python stack.
+"""
+
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from gladlang.core.util.runner import run
+
+SOURCE = """
+DEF sum_from(xs, i)
+    IF i >= LEN(xs) THEN
+        RETURN 0
+    ENDIF
+
+    RETURN xs[i] + sum_from(xs, i + 1)
+ENDDEF
+
+LET xs = [1] * {depth}
+PRINTLN sum_from(xs, 0)
+"""
+
+
+def main():
+    args = sys.argv[1:]
+    repeat = 3
+    stack_memory_mb = 256
+
+    while args and args[0] in ("--repeat", "--stack-memory"):
+        if args[0] == "--repeat":
+            repeat = int(args[1])
+        else:
+            stack_memory_mb = int(args[1])
+
+        args = args[2:]
+
+    depth = int(args[0]) if args else 100_000
+    text = SOURCE.format(depth=depth)
+    best = None
+
+    for _ in range(repeat):
+        original_stdout = sys.stdout
+        sys.stdout = buffer = io.StringIO()
+        try:
+            start = time.perf_counter()
+            _, error = run(
+                "<deep_recursion>",
+                text,
+                engine="frames",
+                stack_memory=stack_memory_mb * 1024 * 1024,
+            )
+            elapsed = time.perf_counter() - start
+        finally:
+            sys.stdout = original_stdout
+
+        if error:
+            raise SystemExit(error.as_string())
+
+        best = elapsed if best is None else min(best, elapsed)
+
+    sys.stdout.write(
+        f"depth {depth:,}: {best:.3f}s, result {buffer.getvalue().strip()} "
+        f"(Python recursion limit {sys.getrecursionlimit()})\n"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Engine benchmark – times every benchmarks/*.glad workload under each execution engine.
+
+Usage: python benchmarks/engines.py [--repeat N] [engine ...]
+
+Workloads are sized to take about a second each on the tree-walker, so the
+default run (every engine, best of 3) finishes in a few minutes.
+"""
+
+import io
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+if hasattr(sys, "set_int_max_str_digits"):
+    sys.set_int_max_str_digits(50_000)
+
+sys.setrecursionlimit(20_000)
+
+from gladlang.core.util.runner import run, ENGINES
+
+
+def time_workload(path, engine, repeat):
+    text = path.read_text(encoding="utf-8")
+    best = None
+
+    for _ in range(repeat):
+        original_stdout = sys.stdout
+        sys.stdout = io.StringIO()
+        try:
+            start = time.perf_counter()
+            _, error = run(str(path), text, engine=engine)
+            elapsed = time.perf_counter() - start
+        finally:
+            sys.stdout = original_stdout
+
+        if error:
+            return None, error.as_string()
+
+        best = elapsed if best is None else min(best, elapsed)
+
+    return best, None
+
+
+def main():
+    args = sys.argv[1:]
+    repeat = 3
+
+    if len(args) >= 2 and args[0] == "--repeat":
+        repeat = int(args[1])
+        args = args[2:]
+
+    engines = args or list(ENGINES)
+    workloads = sorted(Path(__file__).parent.glob("*.glad"))
+
+    sys.stdout.write(f"{'workload':<28}" + "".join(f"{e:>16}" for e in engines) + "\n")
+
+    for path in workloads:
+        baseline = None
+        row = f"{path.stem:<28}"
+
+        for engine in engines:
+            elapsed, error = time_workload(path, engine, repeat)
+            if error:
+                sys.stderr.write(f"{path.name} [{engine}]: {error}\n")
+                row += f"{'error':>16}"
+                continue
+
+            if baseline is None:
+                baseline = elapsed
+
+            row += f"{elapsed:>9.3f}s {baseline / elapsed:>4.1f}x"
+
+        sys.stdout.write(row + "\n")
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
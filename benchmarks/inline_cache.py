@@ -0,0 +1,71 @@
+"""Inline cache benchmark – times benchmarks/method_calls.glad per engine and reports call / attribute cache hit rates.
+
+Usage: python benchmarks/inline_cache.py [--repeat N] [engine ...]
+"""
+
+import io
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+sys.setrecursionlimit(20_000)
+
+from gladlang.core.util.runner import run, ENGINES
+from gladlang.runtime.inline_cache import CacheStats
+
+
+def time_script(path, engine, repeat):
+    text = path.read_text(encoding="utf-8")
+    best = None
+    stats = None
+
+    for _ in range(repeat):
+        stats = CacheStats()
+        original_stdout = sys.stdout
+        sys.stdout = io.StringIO()
+        try:
+            start = time.perf_counter()
+            _, error = run(str(path), text, engine=engine, cache_stats=stats)
+            elapsed = time.perf_counter() - start
+        finally:
+            sys.stdout = original_stdout
+
+        if error:
+            raise SystemExit(error.as_string())
+
+        best = elapsed if best is None else min(best, elapsed)
+
+    return best, stats
+
+
+def format_rate(rate):
+    return "-" if rate is None else f"{rate:.1%}"
+
+
+def main():
+    args = sys.argv[1:]
+    repeat = 3
+
+    if len(args) >= 2 and args[0] == "--repeat":
+        repeat = int(args[1])
+        args = args[2:]
+
+    engines = args or list(ENGINES)
+    path = Path(__file__).parent / "method_calls.glad"
+
+    sys.stdout.write(f"{'engine':<12}{'time':>10}{'call hits':>12}{'attr hits':>12}\n")
+
+    for engine in engines:
+        elapsed, stats = time_script(path, engine, repeat)
+        sys.stdout.write(
+            f"{engine:<12}{elapsed:>9.3f}s"
+            f"{format_rate(stats.hit_rate('call')):>12}"
+            f"{format_rate(stats.hit_rate('attr')):>12}\n"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""NumArray benchmark – compares memory and time for a numeric dataset held as a List and as a NUMARRAY.
+
+Usage: python benchmarks/num_array.py [--repeat N] [size]
+
+Time is the best of N untraced runs. Peak memory comes from one more run
+under tracemalloc, which is timed separately because tracing slows every
+allocation, including the Number each NUMARRAY read has to box.
+"""
+
+import io
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from gladlang.core.util.runner import run
+
+SOURCE = """
+LET data = {make}([0] * {size})
+FOR (LET i = 0; i < {size}; i++)
+    data[i] = i * 7919
+ENDFOR
+
+LET total = 0
+FOR (LET pass = 0; pass < 3; pass++)
+    FOR x IN data
+        total = total + x
+    ENDFOR
+ENDFOR
+PRINTLN total
+"""
+
+VARIANTS = {
+    "List": "",
+    "NUMARRAY": "NUMARRAY",
+}
+
+
+def run_quietly(text):
+    original_stdout = sys.stdout
+    sys.stdout = buffer = io.StringIO()
+    try:
+        _, error = run("<num_array>", text)
+    finally:
+        sys.stdout = original_stdout
+
+    if error:
+        raise SystemExit(error.as_string())
+
+    return buffer.getvalue().strip()
+
+
+def measure(text, repeat):
+    best = None
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        output = run_quietly(text)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    tracemalloc.start()
+    try:
+        run_quietly(text)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return best, peak, output
+
+
+def main():
+    args = sys.argv[1:]
+    repeat = 3
+
+    if len(args) >= 2 and args[0] == "--repeat":
+        repeat = int(args[1])
+        args = args[2:]
+
+    size = int(args[0]) if args else 100_000
+
+    sys.stdout.write(f"{'variant':<12}{'time':>10}{'peak':>12}  result\n")
+
+    for name, make in VARIANTS.items():
+        text = SOURCE.format(size=size, make=make)
+        elapsed, peak, output = measure(text, repeat)
+        sys.stdout.write(
+            f"{name:<12}{elapsed:>9.3f}s{peak / 1_000_000:>10.1f}MB  {output}\n"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+"""Signal benchmark – RTResult flag propagation versus the direct-value control-flow signals.
+
+The first table times the two protocols in isolation: a value passed up a
+chain of nested visits, and a loop body that ends in BREAK / CONTINUE / RETURN.
+All three signals raise a preallocated instance; a RETURN directly in a
+function body (or an IF branch of it) skips the signal and hands back its
+RTResult. The last rows run benchmarks/control_flow.glad, a RETURN-heavy
+script and a script that returns from inside a loop under the tree-walker
+(RTResult) and the closure engine (direct values and signals).
+
+Usage: python benchmarks/signals.py [--repeat N]
+"""
+
+import io
+import os
+import sys
+import time
+import timeit
+from functools import partial
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+sys.setrecursionlimit(20_000)
+
+from gladlang.core.util.runner import run
+from gladlang.runtime.rt_result import RTResult
+from gladlang.runtime.signals import (
+    BreakSignal,
+    ContinueSignal,
+    ReturnSignal,
+    raise_break,
+    raise_continue,
+    raise_return,
+)
+
+DEPTH = 8
+ITERATIONS = 20_000
+
+
+def nested_result(depth, value):
+    if depth == 0:
+        return RTResult().success(value)
+
+    res = RTResult()
+    inner = res.register(nested_result(depth - 1, value))
+    if res.should_return:
+        return res
+
+    return res.success(inner)
+
+
+def nested_direct(depth, value):
+    if depth == 0:
+        return value
+
+    return nested_direct(depth - 1, value)
+
+
+def loop_result(flag):
+    for _ in range(ITERATIONS):
+        res = RTResult()
+        body = flag()
+        res.register(body)
+        if res.should_continue:
+            continue
+
+        if res.should_break:
+            continue
+
+        if res.should_return:
+            continue
+
+
+def loop_direct(flag):
+    for _ in range(ITERATIONS):
+        try:
+            flag()
+        except ContinueSignal:
+            continue
+        except BreakSignal:
+            continue
+        except ReturnSignal:
+            continue
+
+
+CASES = (
+    (
+        f"value through {DEPTH} visits",
+        lambda: nested_result(DEPTH, 1),
+        lambda: nested_direct(DEPTH, 1),
+    ),
+    (
+        f"CONTINUE x{ITERATIONS}",
+        lambda: loop_result(lambda: RTResult().success_continue()),
+        lambda: loop_direct(raise_continue),
+    ),
+    (
+        f"BREAK x{ITERATIONS}",
+        lambda: loop_result(lambda: RTResult().success_break()),
+        lambda: loop_direct(raise_break),
+    ),
+    (
+        f"RETURN from loop x{ITERATIONS}",
+        lambda: loop_result(lambda: RTResult().success_return(None)),
+        lambda: loop_direct(partial(raise_return, None)),
+    ),
+)
+
+
+RETURNS = """
+DEF sign(x)
+    IF x < 0 THEN
+        RETURN -1
+    ELSE IF x > 0 THEN
+        RETURN 1
+    ENDIF
+    RETURN 0
+ENDDEF
+
+LET total = 0
+FOR (LET i = 0; i < 20000; i++)
+    total = total + sign(i - 10000)
+ENDFOR
+PRINTLN total
+"""
+
+LOOP_RETURNS = """
+DEF find(limit)
+    FOR (LET i = 0; i < 10; i++)
+        IF i == limit THEN
+            RETURN i
+        ENDIF
+    ENDFOR
+    RETURN -1
+ENDDEF
+
+LET total = 0
+FOR (LET i = 0; i < 20000; i++)
+    total = total + find(i % 3)
+ENDFOR
+PRINTLN total
+"""
+
+
+def time_script(path, engine, repeat, text=None):
+    if text is None:
+        text = path.read_text(encoding="utf-8")
+
+    best = None
+
+    for _ in range(repeat):
+        original_stdout = sys.stdout
+        sys.stdout = io.StringIO()
+        try:
+            start = time.perf_counter()
+            _, error = run(str(path), text, engine=engine)
+            elapsed = time.perf_counter() - start
+        finally:
+            sys.stdout = original_stdout
+
+        if error:
+            raise SystemExit(error.as_string())
+
+        best = elapsed if best is None else min(best, elapsed)
+
+    return best
+
+
+def main():
+    args = sys.argv[1:]
+    repeat = 3
+
+    if len(args) >= 2 and args[0] == "--repeat":
+        repeat = int(args[1])
+
+    sys.stdout.write(f"{'case':<28}{'RTResult':>12}{'signals':>12}{'speedup':>10}\n")
+
+    for name, with_result, with_signals in CASES:
+        number = 2000 if "visits" in name else 5
+        slow = min(timeit.repeat(with_result, number=number, repeat=repeat))
+        fast = min(timeit.repeat(with_signals, number=number, repeat=repeat))
+        sys.stdout.write(f"{name:<28}{slow:>11.4f}s{fast:>11.4f}s{slow / fast:>9.1f}x\n")
+
+    path = Path(__file__).parent / "control_flow.glad"
+    slow = time_script(path, "tree", repeat)
+    fast = time_script(path, "closure", repeat)
+    sys.stdout.write(
+        f"{path.name:<28}{slow:>11.4f}s{fast:>11.4f}s{slow / fast:>9.1f}x\n"
+    )
+
+    slow = time_script(Path("<returns>"), "tree", repeat, RETURNS)
+    fast = time_script(Path("<returns>"), "closure", repeat, RETURNS)
+    sys.stdout.write(
+        f"{'RETURN-heavy calls':<28}{slow:>11.4f}s{fast:>11.4f}s{slow / fast:>9.1f}x\n"
+    )
+
+    slow = time_script(Path("<loop-returns>"), "tree", repeat, LOOP_RETURNS)
+    fast = time_script(Path("<loop-returns>"), "closure", repeat, LOOP_RETURNS)
+    sys.stdout.write(
+        f"{'RETURN from loop calls':<28}{slow:>11.4f}s{fast:>11.4f}s{slow / fast:>9.1f}x\n"
+    )
+
+
+if __name__ == "__main__":
+    main()
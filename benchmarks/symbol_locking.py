@@ -0,0 +1,91 @@
+"""Symbol table locking benchmark – times variable-heavy loops with locked and unlocked symbol tables.
+
+Usage: python benchmarks/symbol_locking.py [--repeat N] [--engine NAME] [iterations]
+"""
+
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from gladlang.core.util.runner import run
+
+SOURCE = """
+LET a = 0
+LET b = 1
+LET total = 0
+
+DEF step(x, y)
+    LET s = x + y
+    RETURN s - y
+ENDDEF
+
+FOR (LET i = 0; i < {iterations}; i++)
+    LET t = a + b
+    a = b
+    b = t - a + 1
+    total = total + step(i, b)
+ENDFOR
+
+PRINTLN total
+"""
+
+MODES = {
+    "locked": True,
+    "unlocked": False,
+}
+
+
+def measure(text, engine, thread_safe, repeat):
+    best = None
+    output = None
+
+    for _ in range(repeat):
+        original_stdout = sys.stdout
+        sys.stdout = buffer = io.StringIO()
+        try:
+            start = time.perf_counter()
+            _, error = run(
+                "<symbol_locking>", text, engine=engine, thread_safe=thread_safe
+            )
+            elapsed = time.perf_counter() - start
+        finally:
+            sys.stdout = original_stdout
+
+        if error:
+            raise SystemExit(error.as_string())
+
+        best = elapsed if best is None else min(best, elapsed)
+        output = buffer.getvalue().strip()
+
+    return best, output
+
+
+def main():
+    args = sys.argv[1:]
+    repeat = 1
+    engines = ["tree", "vm", "closure"]
+
+    while len(args) >= 2 and args[0] in ("--repeat", "--engine"):
+        if args[0] == "--repeat":
+            repeat = int(args[1])
+        else:
+            engines = [args[1]]
+
+        args = args[2:]
+
+    iterations = int(args[0]) if args else 100_000
+
+    sys.stdout.write(f"{'engine':<12}{'mode':<12}{'time':>10}  result\n")
+
+    text = SOURCE.format(iterations=iterations)
+    for engine in engines:
+        for name, thread_safe in MODES.items():
+            elapsed, output = measure(text, engine, thread_safe, repeat)
+            sys.stdout.write(f"{engine:<12}{name:<12}{elapsed:>9.3f}s  {output}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -20,7 +20,8 @@ if hasattr(sys, "setrecursionlimit"):
 
 from gladlang.core.util.global_scope import get_fresh_global_scope
 from gladlang.core.util.memory import set_memory_limit
-from gladlang.core.util.runner import run
+from gladlang.core.util.runner import run, ENGINES
+from gladlang.compiler.optimizer import OPTIMIZE_LEVELS, DEFAULT_LEVEL
 from gladlang.core.util.repl_helpers import is_complete
 from gladlang.runtime.context import Context
 from gladlang.version import __version__
@@ -28,7 +29,7 @@ from gladlang.version import __version__
 
 def main():
     MAX_MEMORY_MB = 512
-    MAX_INSTRUCTIONS = int(sys.maxsize)
+    MAX_INSTRUCTIONS = None
     MAX_SOURCE_BYTES = 1_000_000
     MAX_REPL_BUFFER = 100_000
 
@@ -36,7 +37,22 @@ def main():
 
     GLADLANG_VERSION = str(__version__)
     GLADLANG_HELP = f"""
-Usage: gladlang [command] [filename/code] [args...]
+Usage: gladlang [options] [command] [filename/code] [args...]
+
+Options:
+  --engine <name>          Select the execution engine: tree (default), vm,
+                           frames, closure, or transpile.
+  --stack-memory <MB>      Let the frames engine recurse as deep as MB
+                           megabytes of call frames allow, instead of the
+                           default limit of 2000 nested calls.
+  -O<level>                Optimization level: 0 (off), 1 (constant
+                           folding, default) or 2 (also hoists loop
+                           invariants and strength-reduces loop counters).
+  --dump-ast               Print the optimized syntax tree to stderr before
+                           running.
+  --no-locks               Run with unlocked symbol tables (plain dicts, no
+                           per-access locking). Only safe because the CLI
+                           runs one program on one thread.
 
 Commands:
   <no arguments>           Start the interactive GladLang shell.
@@ -46,15 +62,76 @@ Commands:
   ["code string"] [args]   Execute inline code and pass args to INPUT().
   -h, --help               Show this help message and exit.
   -v, --version            Show the interpreter version and exit.
+  --conformance [dir]      Run every .glad script in dir (default: tests)
+                           under each engine at the selected -O level and
+                           diff against the unoptimized tree-walker.
 """
 
-    if len(sys.argv) == 1:
+    args = sys.argv[1:]
+    engine = "tree"
+    optimize = DEFAULT_LEVEL
+    dump_ast = None
+    stack_memory = None
+    thread_safe = True
+
+    while args and (
+        args[0] in ("--engine", "--dump-ast", "--stack-memory", "--no-locks")
+        or args[0].startswith("-O")
+    ):
+        if args[0] == "--dump-ast":
+            dump_ast = sys.stderr
+            args = args[1:]
+            continue
+
+        if args[0] == "--no-locks":
+            thread_safe = False
+            args = args[1:]
+            continue
+
+        if args[0].startswith("-O"):
+            level = args[0][2:]
+            if not level.isdigit() or int(level) not in OPTIMIZE_LEVELS:
+                sys.stderr.write(
+                    "Error: -O expects one of: "
+                    f"{', '.join(str(n) for n in OPTIMIZE_LEVELS)}\n"
+                )
+                sys.exit(1)
+
+            optimize = int(level)
+            args = args[1:]
+            continue
+
+        if args[0] == "--stack-memory":
+            if len(args) < 2 or not args[1].isdigit() or int(args[1]) == 0:
+                sys.stderr.write(
+                    "Error: --stack-memory expects a positive size in megabytes\n"
+                )
+                sys.exit(1)
+
+            stack_memory = int(args[1]) * 1024 * 1024
+            args = args[2:]
+            continue
+
+        if len(args) < 2 or args[1] not in ENGINES:
+            sys.stderr.write(
+                f"Error: --engine expects one of: {', '.join(ENGINES)}\n"
+            )
+            sys.exit(1)
+
+        engine = args[1]
+        args = args[2:]
+
+    if stack_memory is not None and engine != "frames":
+        sys.stderr.write("Error: --stack-memory requires --engine frames\n")
+        sys.exit(1)
+
+    if not args:
         sys.stdout.write(f"Welcome to GladLang (v{GLADLANG_VERSION})\n")
         sys.stdout.write("Type 'exit' or 'quit' to close the shell.\n")
         sys.stdout.write("--------------------------------------------------\n")
 
         repl_context = Context("<repl>")
-        repl_context.symbol_table = get_fresh_global_scope()
+        repl_context.symbol_table = get_fresh_global_scope(thread_safe)
 
         full_text = ""
 
@@ -149,6 +226,11 @@ Commands:
                                 dropped_source,
                                 repl_context,
                                 instruction_limit=MAX_INSTRUCTIONS,
+                                engine=engine,
+                                optimize=optimize,
+                                dump_ast=dump_ast,
+                                stack_memory=stack_memory,
+                                thread_safe=thread_safe,
                             )
                         finally:
                             sys.stdin = original_stdin
@@ -189,6 +271,11 @@ Commands:
                         full_text,
                         repl_context,
                         instruction_limit=MAX_INSTRUCTIONS,
+                        engine=engine,
+                        optimize=optimize,
+                        dump_ast=dump_ast,
+                        stack_memory=stack_memory,
+                        thread_safe=thread_safe,
                     )
 
                     if error:
@@ -292,8 +379,8 @@ Commands:
                 sys.stdout.write(f"Shell Error: {e}\n")
                 full_text = ""
 
-    elif len(sys.argv) >= 2:
-        arg = sys.argv[1]
+    elif len(args) >= 1:
+        arg = args[0]
 
         if arg == "--help" or arg == "-h":
             sys.stdout.write(GLADLANG_HELP + "\n")
@@ -301,9 +388,18 @@ Commands:
         elif arg == "--version" or arg == "-v":
             sys.stdout.write(f"GladLang v{GLADLANG_VERSION}\n")
 
+        elif arg == "--conformance":
+            from gladlang.compiler.conformance import run_conformance
+
+            directory = args[1] if len(args) > 1 else "tests"
+            mismatches = run_conformance(
+                directory, engines=ENGINES, optimize=optimize
+            )
+            sys.exit(1 if mismatches else 0)
+
         else:
             arg_input = arg
-            script_args = sys.argv[2:]
+            script_args = args[1:]
             try:
                 original_stdin = sys.stdin
                 try:
@@ -367,7 +463,14 @@ Commands:
                         source_name = "<cmdline>"
 
                     result, error = run(
-                        source_name, text, instruction_limit=MAX_INSTRUCTIONS
+                        source_name,
+                        text,
+                        instruction_limit=MAX_INSTRUCTIONS,
+                        engine=engine,
+                        optimize=optimize,
+                        dump_ast=dump_ast,
+                        stack_memory=stack_memory,
+                        thread_safe=thread_safe,
                     )
 
                     if error:
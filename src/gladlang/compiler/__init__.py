@@ -0,0 +1,38 @@
+"""Compile-time passes and alternative engines – scope resolver, string literal pool, frame escape analysis, constant-folding and loop optimizers, bytecode compiler, stack VM and its heap-frame variant, closure compiler, Python transpiler, and the engine conformance runner."""
+
+from .resolver import Resolver, resolve_scopes
+from .literal_pool import LiteralPool, pool_literals
+from .escapes import captures_frame, mark_frame_locals
+from .optimizer import Optimizer, optimize_tree, format_tree
+from .loops import LoopOptimizer, optimize_loops
+from .code_object import CodeObject
+from .compiler import Compiler
+from .vm import VM
+from .frames import FrameVM
+from .closures import ClosureCompiler, ClosureInterpreter
+from .transpiler import Transpiler, TranspilingInterpreter
+from .conformance import run_conformance, run_script
+
+__all__ = [
+    "Resolver",
+    "resolve_scopes",
+    "LiteralPool",
+    "pool_literals",
+    "captures_frame",
+    "mark_frame_locals",
+    "Optimizer",
+    "optimize_tree",
+    "format_tree",
+    "LoopOptimizer",
+    "optimize_loops",
+    "CodeObject",
+    "Compiler",
+    "VM",
+    "FrameVM",
+    "ClosureCompiler",
+    "ClosureInterpreter",
+    "Transpiler",
+    "TranspilingInterpreter",
+    "run_conformance",
+    "run_script",
+]
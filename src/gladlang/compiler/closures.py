@@ -0,0 +1,976 @@
+"""Closure compiler – turns AST nodes into pre-bound Python callables once.
+
+Every compiled node becomes a function ``run(context) -> value`` with its
+operator, constants and child callables already bound, so executing it is
+just nested calls. Values come back directly; errors, RETURN, BREAK and
+CONTINUE travel as the control-flow signals of gladlang.runtime.signals.
+Nodes without a dedicated compiler run through the tree visitors.
+
+Bodies handed to ``visit`` (function bodies and the program) get an
+RTResult-returning form from ``compile_body``, cached per node next to the
+value form. A RETURN written directly in the body, or directly in an IF
+branch of it, hands its value back as the result instead of raising,
+since the caller needs an RTResult there anyway; the statements around it
+reuse their value form. RETURN inside loops and TRY raises the
+preallocated ReturnSignal.
+"""
+
+import sys
+from gladlang.core.constants import (
+    GL_KEYWORD,
+    GL_PLUSPLUS,
+    GL_MINUSMINUS,
+    GL_MINUS,
+    GL_BIT_NOT,
+    GL_EE,
+    GL_NE,
+    GL_LT,
+    GL_GT,
+    GL_LTE,
+    GL_GTE,
+)
+from gladlang.core.errors import RTError
+from gladlang.core.util.final_helpers import is_final_anywhere
+from gladlang.runtime.rt_result import RTResult
+from gladlang.runtime.signals import (
+    ControlSignal,
+    ErrorSignal,
+    ReturnSignal,
+    BreakSignal,
+    ContinueSignal,
+    fail,
+    raise_break,
+    raise_continue,
+    raise_return,
+    raise_result,
+    result_from_signal,
+)
+from gladlang.runtime.context import Context
+from gladlang.runtime.symbol_table import SymbolTable
+from gladlang.values.primitives.number import Number, shared_int
+from gladlang.values.primitives.string import String
+from gladlang.values.primitives.list import List, settle_views
+from gladlang.values.nulls.tailcall import TailCall
+from gladlang.interpreter.interpreter import Interpreter
+from gladlang.parser.ast import (
+    CallNode,
+    VarAccessNode,
+    IfNode,
+    ReturnNode,
+    StatementListNode,
+)
+
+
+def returns_directly(node):
+    bodies = [body for _, body in node.cases]
+    if node.else_case:
+        bodies.append(node.else_case)
+
+    for body in bodies:
+        if type(body) is ReturnNode:
+            return True
+
+        if type(body) is IfNode and returns_directly(body):
+            return True
+
+        if type(body) is StatementListNode and any(
+            type(n) is ReturnNode or (type(n) is IfNode and returns_directly(n))
+            for n in body.statement_nodes
+        ):
+            return True
+
+    return False
+
+
+class ClosureCompiler:
+    CHAIN_OPS = (GL_EE, GL_NE, GL_LT, GL_GT, GL_LTE, GL_GTE)
+
+    def __init__(self, interpreter):
+        self.interpreter = interpreter
+        self.cache = {}
+        self.bodies = {}
+
+    def compile(self, node):
+        fn = self.cache.get(node)
+        if fn is not None:
+            return fn
+
+        method = getattr(self, f"compile_{type(node).__name__}", None)
+        fn = method(node) if method is not None else None
+
+        if fn is None:
+            fn = self.fallback(node)
+
+        self.cache[node] = fn
+        return fn
+
+    def fallback(self, node):
+        interpreter = self.interpreter
+
+        def run(context):
+            res = Interpreter.visit(interpreter, node, context)
+            if (
+                res.error
+                or res.should_return
+                or res.should_break
+                or res.should_continue
+            ):
+                raise_result(res)
+
+            return res.value
+
+        return run
+
+    def metered(self, node, fn):
+        interpreter = self.interpreter
+        budget = interpreter.budget
+        if budget is None:
+            return fn
+
+        def run(context):
+            if budget.charge(node):
+                fail(interpreter.budget_error(node, context))
+
+            return fn(context)
+
+        return run
+
+    def compile_body(self, node):
+        fn = self.bodies.get(node)
+        if fn is None:
+            fn = self.bodies[node] = self.compile_returning(node)
+
+        return fn
+
+    def compile_returning(self, node):
+        if type(node) is ReturnNode:
+            return self.compile_direct_return(node)
+
+        if type(node) is IfNode and returns_directly(node):
+            return self.compile_returning_if(node)
+
+        if type(node) is StatementListNode and node.statement_nodes:
+            return self.compile_returning_statements(node)
+
+        value_fn = self.compile(node)
+
+        def run(context):
+            return RTResult().success(value_fn(context))
+
+        return run
+
+    def compile_returning_statements(self, node):
+        steps = tuple(
+            (self.compile_body(n), True)
+            if type(n) is ReturnNode or (type(n) is IfNode and returns_directly(n))
+            else (self.compile(n), False)
+            for n in node.statement_nodes
+        )
+
+        def run(context):
+            value = None
+            for step_fn, returning in steps:
+                if returning:
+                    res = step_fn(context)
+                    if res.should_return:
+                        return res
+
+                    value = res.value
+                else:
+                    value = step_fn(context)
+
+            return RTResult().success(value)
+
+        return run
+
+    def compile_returning_if(self, node):
+        cases = tuple(
+            (self.compile(condition), self.metered(body, self.compile_body(body)))
+            for condition, body in node.cases
+        )
+        else_fn = (
+            self.metered(node.else_case, self.compile_body(node.else_case))
+            if node.else_case
+            else None
+        )
+
+        def run(context):
+            for condition_fn, body_fn in cases:
+                if condition_fn(context).is_true():
+                    return body_fn(context)
+
+            if else_fn is not None:
+                return else_fn(context)
+
+            return RTResult().success(Number.null.copy())
+
+        return run
+
+    def compile_direct_return(self, node):
+        to_return = node.node_to_return
+        value_fn = self.compile(to_return)
+
+        if not isinstance(to_return, CallNode):
+
+            def run(context):
+                return RTResult().success_return(value_fn(context))
+
+            return run
+
+        callee_fn = self.compile(to_return.node_to_call)
+        arg_fns = tuple(self.compile(n) for n in to_return.arg_nodes)
+
+        def run(context):
+            if getattr(context, "_tco_func", None) is not None:
+                callee = callee_fn(context)
+                args = [arg_fn(context) for arg_fn in arg_fns]
+                return RTResult().success_return(TailCall(callee, args))
+
+            return RTResult().success_return(value_fn(context))
+
+        return run
+
+    def compile_NumberNode(self, node):
+        value = node.tok.value
+
+        shared = shared_int(value)
+        if shared is not None:
+
+            def run(context):
+                return shared
+
+            return run
+
+        def run(context):
+            return Number(value)
+
+        return run
+
+    def compile_StringNode(self, node):
+        value = node.value
+
+        def run(context):
+            return value
+
+        return run
+
+    def compile_VarAccessNode(self, node):
+        var_name = node.var_name_tok.value
+        if var_name in ("THIS", "SUPER"):
+            return None
+
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        if node.scope_kind == "global":
+
+            def run(context):
+                value = context.symbol_table.get_global(var_name, node)
+                if value is None:
+                    fail(
+                        RTError(
+                            pos_start, pos_end, f"'{var_name}' is not defined", context
+                        )
+                    )
+
+                return value
+
+            return run
+
+        def run(context):
+            value = context.symbol_table.get_resolved(var_name, node.scope_depth)
+            if value is None:
+                fail(
+                    RTError(
+                        pos_start, pos_end, f"'{var_name}' is not defined", context
+                    )
+                )
+
+            return value
+
+        return run
+
+    def compile_VarAssignNode(self, node):
+        var_name_tok = node.var_name_tok
+        var_name = var_name_tok.value
+        value_fn = self.compile(node.value_node)
+        visibility = getattr(node, "target_visibility", "PUBLIC")
+        is_declaration = node.is_declaration
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def run(context):
+            value = value_fn(context)
+
+            if is_final_anywhere(context.symbol_table, var_name):
+                fail(
+                    RTError(
+                        var_name_tok.pos_start,
+                        var_name_tok.pos_end,
+                        f"Cannot reassign constant '{var_name}'",
+                        context,
+                    )
+                )
+
+            if is_declaration:
+                context.symbol_table.set(var_name, value, visibility=visibility)
+            else:
+                err = context.symbol_table.update_resolved(
+                    var_name, value, node.scope_depth
+                )
+                if err:
+                    fail(RTError(pos_start, pos_end, err, context))
+
+            return value
+
+        return run
+
+    def compile_StatementListNode(self, node):
+        statement_fns = tuple(self.compile(n) for n in node.statement_nodes)
+
+        if not statement_fns:
+
+            def run(context):
+                return Number.null.copy()
+
+            return run
+
+        if len(statement_fns) == 1:
+            return statement_fns[0]
+
+        def run(context):
+            for statement_fn in statement_fns:
+                value = statement_fn(context)
+
+            return value
+
+        return run
+
+    def compile_BinOpNode(self, node):
+        op_tok = node.op_tok
+        left_fn = self.compile(node.left_node)
+        right_fn = self.compile(node.right_node)
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        if op_tok.matches(GL_KEYWORD, "AND") or op_tok.matches(GL_KEYWORD, "OR"):
+            is_and = op_tok.value == "AND"
+
+            def run(context):
+                left = left_fn(context)
+
+                if bool(left.is_true()) != is_and:
+                    return Number.false_result if is_and else Number.true_result
+
+                right = right_fn(context)
+                if is_and:
+                    result, error = left.anded_by(right)
+                else:
+                    result, error = left.ored_by(right)
+
+                if error:
+                    fail(error.locate(pos_start, pos_end, context))
+
+                return result
+
+            return run
+
+        if op_tok.matches(GL_KEYWORD, "IS") or op_tok.matches(GL_KEYWORD, "INSTANCEOF"):
+            is_is = op_tok.value == "IS"
+
+            def run(context):
+                left = left_fn(context)
+                right = right_fn(context)
+
+                if is_is:
+                    result, error = left.get_comparison_is(right)
+                else:
+                    result, error = left.get_comparison_instanceof(right)
+
+                if error:
+                    fail(error.locate(pos_start, pos_end, context))
+
+                return result
+
+            return run
+
+        op = self.interpreter._binop_dispatch.get(op_tok.type)
+        if op is None:
+            return None
+
+        def run(context):
+            result, error = op(left_fn(context), right_fn(context))
+            if error:
+                error.pos_start = pos_start
+                error.pos_end = pos_end
+                error.context = context
+                fail(error)
+
+            return result
+
+        return run
+
+    def compile_ChainedCompNode(self, node):
+        steps = []
+        for op_tok, right_node in node.ops_and_exprs:
+            if op_tok.matches(GL_KEYWORD, "IS"):
+                op = lambda l, r: l.get_comparison_is(r)
+            elif op_tok.type in self.CHAIN_OPS:
+                op = self.interpreter._binop_dispatch[op_tok.type]
+            else:
+                return None
+
+            steps.append((op, self.compile(right_node)))
+
+        left_fn = self.compile(node.left_node)
+        steps = tuple(steps)
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def run(context):
+            left = left_fn(context)
+
+            for op, right_fn in steps:
+                right = right_fn(context)
+
+                result, error = op(left, right)
+                if error:
+                    fail(error.locate(pos_start, pos_end, context))
+
+                if not result.is_true():
+                    return Number.false_result
+
+                left = right
+
+            return Number.true_result
+
+        return run
+
+    def compile_InvariantNode(self, node):
+        expr_fn = self.compile(node.expr_node)
+        cache_key = node.cache_key
+
+        def run(context):
+            symbols = context.symbol_table.symbols
+            value = symbols.get(cache_key)
+            if value is None:
+                value = symbols[cache_key] = expr_fn(context)
+
+            return value
+
+        return run
+
+    def compile_CounterStepNode(self, node):
+        interpreter = self.interpreter
+        step_fn = self.compile(node.step_node)
+
+        def run(context):
+            symbols = context.symbol_table.symbols
+            value = interpreter.bump_counter(node, symbols)
+            if value is not None:
+                return value
+
+            step_fn(context)
+            return interpreter.claim_counter(node, symbols)
+
+        return run
+
+    def compile_incdec(self, node, is_post):
+        target_node = node.node
+        if not isinstance(target_node, VarAccessNode):
+            return None
+
+        var_name = target_node.var_name_tok.value
+        step = 1 if node.op_tok.type == GL_PLUSPLUS else -1
+        target_start, target_end = target_node.pos_start, target_node.pos_end
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def run(context):
+            if is_final_anywhere(context.symbol_table, var_name):
+                fail(
+                    RTError(
+                        target_start,
+                        target_end,
+                        f"Cannot increment/decrement constant '{var_name}'",
+                        context,
+                    )
+                )
+
+            value = context.symbol_table.get_resolved(
+                var_name, target_node.scope_depth
+            )
+            if value is None:
+                fail(
+                    RTError(
+                        target_start,
+                        target_end,
+                        f"'{var_name}' is not defined",
+                        context,
+                    )
+                )
+
+            if not isinstance(value, Number):
+                fail(
+                    RTError(
+                        target_start, target_end, "Operand must be a number", context
+                    )
+                )
+
+            if step == 1:
+                new_value, error = value.added_to(Number(1))
+            else:
+                new_value, error = value.subbed_by(Number(1))
+
+            if error:
+                fail(error.locate(pos_start, pos_end, context))
+
+            err = context.symbol_table.update_resolved(
+                var_name, new_value, target_node.scope_depth
+            )
+            if err:
+                fail(RTError(target_start, target_end, err, context))
+
+            result = value if is_post else new_value
+            return result.copy()
+
+        return run
+
+    def compile_UnaryOpNode(self, node):
+        op_tok = node.op_tok
+        if op_tok.type in (GL_PLUSPLUS, GL_MINUSMINUS):
+            return self.compile_incdec(node, False)
+
+        operand_fn = self.compile(node.node)
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        if op_tok.type == GL_MINUS:
+
+            def run(context):
+                number = operand_fn(context).copy()
+                if not isinstance(number, Number):
+                    fail(
+                        RTError(
+                            pos_start,
+                            pos_end,
+                            "Unary '-' can only be applied to numbers",
+                            context,
+                        )
+                    )
+
+                number, error = number.multed_by(Number(-1))
+                if error:
+                    error.pos_start = pos_start
+                    error.pos_end = pos_end
+                    error.context = context
+                    fail(error)
+
+                return number
+
+            return run
+
+        if op_tok.matches(GL_KEYWORD, "NOT") or op_tok.type == GL_BIT_NOT:
+            is_not = op_tok.type != GL_BIT_NOT
+
+            def run(context):
+                number = operand_fn(context).copy()
+                if is_not:
+                    number, error = number.notted()
+                else:
+                    number, error = number.bitted_not()
+
+                if error:
+                    error.pos_start = pos_start
+                    error.pos_end = pos_end
+                    error.context = context
+                    fail(error)
+
+                return number
+
+            return run
+
+        def run(context):
+            return operand_fn(context).copy()
+
+        return run
+
+    def compile_PostOpNode(self, node):
+        return self.compile_incdec(node, True)
+
+    def compile_TernaryOpNode(self, node):
+        condition_fn = self.compile(node.condition_node)
+        true_fn = self.compile(node.true_case_node)
+        false_fn = self.compile(node.false_case_node)
+
+        def run(context):
+            if condition_fn(context).is_true():
+                return true_fn(context)
+
+            return false_fn(context)
+
+        return run
+
+    def compile_IfNode(self, node):
+        cases = tuple(
+            (self.compile(condition), self.metered(body, self.compile(body)))
+            for condition, body in node.cases
+        )
+        else_fn = (
+            self.metered(node.else_case, self.compile(node.else_case))
+            if node.else_case
+            else None
+        )
+
+        def run(context):
+            for condition_fn, body_fn in cases:
+                if condition_fn(context).is_true():
+                    return body_fn(context)
+
+            if else_fn is not None:
+                return else_fn(context)
+
+            return Number.null.copy()
+
+        return run
+
+    def compile_WhileNode(self, node):
+        interpreter = self.interpreter
+        budget = interpreter.budget
+        condition_fn = self.compile(node.condition_node)
+        body_fn = self.compile(node.body_node)
+        pos_start = node.pos_start
+
+        def run(context):
+            loop_context = Context("WHILE", context, pos_start)
+            loop_context.symbol_table = SymbolTable(context.symbol_table)
+
+            while True:
+                if budget is not None and budget.charge(node):
+                    fail(interpreter.budget_error(node, loop_context))
+
+                if not condition_fn(loop_context).is_true():
+                    break
+
+                try:
+                    body_fn(loop_context)
+                except ContinueSignal:
+                    continue
+                except BreakSignal:
+                    break
+
+            return Number.null.copy()
+
+        return run
+
+    def compile_CForNode(self, node):
+        interpreter = self.interpreter
+        budget = interpreter.budget
+        init_fn = self.compile(node.init_node) if node.init_node else None
+        condition_fn = self.compile(node.condition_node) if node.condition_node else None
+        step_fn = self.compile(node.step_node) if node.step_node else None
+        body_fn = self.compile(node.body_node)
+        pos_start = node.pos_start
+
+        def run(context):
+            loop_context = Context("C_FOR", context, pos_start)
+            loop_context.symbol_table = SymbolTable(context.symbol_table)
+            loop_context.active_class = context.active_class
+
+            if init_fn is not None:
+                init_fn(loop_context)
+
+            while True:
+                if budget is not None and budget.charge(node):
+                    fail(interpreter.budget_error(node, loop_context))
+
+                if condition_fn is not None and not condition_fn(loop_context).is_true():
+                    break
+
+                try:
+                    body_fn(loop_context)
+                except ContinueSignal:
+                    pass
+                except BreakSignal:
+                    break
+
+                if step_fn is not None:
+                    step_fn(loop_context)
+
+            return Number.null.copy()
+
+        return run
+
+    def compile_ForNode(self, node):
+        interpreter = self.interpreter
+        budget = interpreter.budget
+        iterable_node = node.iterable_node
+        iterable_fn = self.compile(iterable_node)
+        body_fn = self.compile(node.body_node)
+        var_name_toks = node.var_name_toks
+        pos_start = node.pos_start
+
+        def run(context):
+            iterator, error = interpreter.get_iterator(
+                iterable_fn(context),
+                iterable_node.pos_start,
+                iterable_node.pos_end,
+                context,
+            )
+
+            if error:
+                fail(error)
+
+            loop_context = Context("FOR", context, pos_start)
+            loop_context.symbol_table = SymbolTable(context.symbol_table)
+            bind = interpreter.loop_binder(var_name_toks, loop_context)
+
+            for element in iterator:
+                if budget is not None and budget.charge(node):
+                    fail(interpreter.budget_error(node, loop_context))
+
+                error = bind(element)
+                if error:
+                    fail(error)
+
+                try:
+                    body_fn(loop_context)
+                except ContinueSignal:
+                    continue
+                except BreakSignal:
+                    break
+
+            return Number.null.copy()
+
+        return run
+
+    def compile_BreakNode(self, node):
+        def run(context):
+            raise_break()
+
+        return run
+
+    def compile_ContinueNode(self, node):
+        def run(context):
+            raise_continue()
+
+        return run
+
+    def compile_ReturnNode(self, node):
+        to_return = node.node_to_return
+        value_fn = self.compile(to_return)
+
+        if not isinstance(to_return, CallNode):
+
+            def run(context):
+                raise_return(value_fn(context))
+
+            return run
+
+        callee_fn = self.compile(to_return.node_to_call)
+        arg_fns = tuple(self.compile(n) for n in to_return.arg_nodes)
+
+        def run(context):
+            if getattr(context, "_tco_func", None) is not None:
+                callee = callee_fn(context)
+                args = [arg_fn(context) for arg_fn in arg_fns]
+                raise_return(TailCall(callee, args))
+
+            raise_return(value_fn(context))
+
+        return run
+
+    def compile_ThrowNode(self, node):
+        value_fn = self.compile(node.node_to_throw)
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def run(context):
+            value = value_fn(context)
+            fail(RTError(pos_start, pos_end, str(value), context, thrown_value=value))
+
+        return run
+
+    def compile_TryCatchNode(self, node):
+        try_fn = self.compile(node.try_body_node)
+        catch_fn = self.compile(node.catch_body_node) if node.catch_body_node else None
+        finally_fn = (
+            self.compile(node.finally_body_node) if node.finally_body_node else None
+        )
+        catch_var = node.catch_var_node.value if node.catch_var_node else None
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def catch(error, context):
+            catch_context = Context("CATCH", context, pos_start)
+            catch_context.symbol_table = SymbolTable(context.symbol_table)
+
+            if catch_var is not None:
+                val_to_assign = getattr(error, "thrown_value", None)
+                if val_to_assign is None:
+                    val_to_assign = String(error.details)
+
+                catch_context.symbol_table.set(catch_var, val_to_assign)
+
+            catch_fn(catch_context)
+
+        def run(context):
+            pending = None
+            value = None
+
+            try:
+                value = try_fn(context)
+            except ErrorSignal as signal:
+                if catch_fn is None:
+                    pending = signal
+                else:
+                    try:
+                        catch(signal.error, context)
+                    except ControlSignal as inner:
+                        pending = inner
+            except ControlSignal as signal:
+                pending = signal
+            except RecursionError:
+                error = RTError(
+                    pos_start,
+                    pos_end,
+                    "Expression too complex (maximum recursion depth exceeded)",
+                    context,
+                )
+                if catch_fn is None:
+                    pending = ErrorSignal(error)
+                else:
+                    try:
+                        catch(error, context)
+                    except ControlSignal as inner:
+                        pending = inner
+
+            if finally_fn is not None:
+                if type(pending) is ReturnSignal:
+                    returned = pending.value
+                    finally_fn(context)
+                    raise_return(returned)
+
+                finally_fn(context)
+
+            if pending is not None:
+                raise pending.with_traceback(None)
+
+            if value is not None:
+                return value
+
+            return Number.null.copy()
+
+        return run
+
+    def compile_CallNode(self, node):
+        interpreter = self.interpreter
+        callee_fn = self.compile(node.node_to_call)
+        arg_fns = tuple(self.compile(n) for n in node.arg_nodes)
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def run(context):
+            value_to_call = interpreter.prepare_call(node, callee_fn(context), context)
+            args = [arg_fn(context) for arg_fn in arg_fns]
+
+            res = value_to_call.execute(args, interpreter, context)
+            if res.error:
+                fail(res.error.locate(pos_start, pos_end, context))
+
+            return res.value
+
+        return run
+
+    def compile_ListNode(self, node):
+        element_fns = tuple(self.compile(n) for n in node.element_nodes)
+
+        def run(context):
+            elements = [element_fn(context) for element_fn in element_fns]
+            return List(settle_views(elements))
+
+        return run
+
+    def compile_GetAttrNode(self, node):
+        interpreter = self.interpreter
+        object_fn = self.compile(node.object_node)
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def run(context):
+            value, error = interpreter.get_attr_cached(node, object_fn(context), context)
+            if error:
+                fail(error.locate(pos_start, pos_end, context))
+
+            return value
+
+        return run
+
+    def compile_ListAccessNode(self, node):
+        list_fn = self.compile(node.list_node)
+        index_fn = self.compile(node.index_node)
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def run(context):
+            list_val = list_fn(context)
+            element, error = list_val.get_element_at(index_fn(context))
+            if error:
+                error.pos_start = pos_start
+                error.pos_end = pos_end
+                error.context = error.context or context
+                fail(error)
+
+            return element
+
+        return run
+
+    def compile_ListSetNode(self, node):
+        list_fn = self.compile(node.list_node)
+        index_fn = self.compile(node.index_node)
+        value_fn = self.compile(node.value_node)
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def run(context):
+            list_val = list_fn(context)
+            index_val = index_fn(context)
+
+            new_value, error = list_val.set_element_at(index_val, value_fn(context))
+            if error:
+                error.pos_start = pos_start
+                error.pos_end = pos_end
+                error.context = error.context or context
+                fail(error)
+
+            return new_value
+
+        return run
+
+    def compile_PrintNode(self, node):
+        print_fns = tuple(self.compile(n) for n in node.print_nodes)
+        should_newline = node.should_newline
+
+        def run(context):
+            text = " ".join([str(print_fn(context)) for print_fn in print_fns])
+            if should_newline:
+                text += "\n"
+
+            sys.stdout.write(text)
+            if not should_newline:
+                sys.stdout.flush()
+
+            return Number.null.copy()
+
+        return run
+
+
+class ClosureInterpreter(Interpreter):
+    def __init__(self, instruction_limit=None, budget=None, cache_stats=None):
+        super().__init__(
+            instruction_limit=instruction_limit, budget=budget, cache_stats=cache_stats
+        )
+        self.closure_compiler = ClosureCompiler(self)
+
+    def visit(self, node, context):
+        try:
+            return self.closure_compiler.compile_body(node)(context)
+        except ControlSignal as signal:
+            return result_from_signal(signal)
+        except RecursionError:
+            return RTResult().failure(
+                RTError(
+                    node.pos_start,
+                    node.pos_end,
+                    "Expression too complex (maximum recursion depth exceeded)",
+                    context,
+                )
+            )
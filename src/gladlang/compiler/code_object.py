@@ -0,0 +1,83 @@
+"""CodeObject – flat instruction stream with constant pool, name pool, and local slot count."""
+
+from math import copysign
+
+from gladlang.compiler.opcodes import OPCODE_NAMES
+
+
+class CodeObject:
+    __slots__ = (
+        "name",
+        "instructions",
+        "constants",
+        "names",
+        "num_slots",
+        "_constant_index",
+    )
+
+    def __init__(self, name):
+        self.name = name
+        self.instructions = []
+        self.constants = []
+        self.names = []
+        self.num_slots = 0
+        self._constant_index = {}
+
+    def emit(self, op, arg=None, node=None):
+        self.instructions.append((op, arg, node))
+        return len(self.instructions) - 1
+
+    def patch(self, index, arg):
+        op, _, node = self.instructions[index]
+        self.instructions[index] = (op, arg, node)
+
+    def add_constant(self, value):
+        try:
+            if type(value) is float:
+                key = (float, copysign(1.0, value), value)
+            else:
+                key = (type(value), value)
+
+            index = self._constant_index.get(key)
+        except TypeError:
+            key = None
+            index = None
+
+        if index is not None:
+            return index
+
+        self.constants.append(value)
+        index = len(self.constants) - 1
+        if key is not None:
+            self._constant_index[key] = index
+
+        return index
+
+    def add_name(self, name):
+        try:
+            return self.names.index(name)
+        except ValueError:
+            self.names.append(name)
+            return len(self.names) - 1
+
+    def new_slot(self):
+        self.num_slots += 1
+        return self.num_slots - 1
+
+    def disassemble(self):
+        lines = [f"<code {self.name}>"]
+        for i, (op, arg, node) in enumerate(self.instructions):
+            op_name = OPCODE_NAMES.get(op, str(op))
+            line = f"{i:>5} {op_name:<18}"
+            if arg is not None:
+                line += f" {arg!r}"
+
+            if node is not None and getattr(node, "pos_start", None) is not None:
+                line += f"  (line {node.pos_start.ln + 1})"
+
+            lines.append(line)
+
+        return "\n".join(lines)
+
+    def __repr__(self):
+        return f"<code {self.name} ({len(self.instructions)} instructions)>"
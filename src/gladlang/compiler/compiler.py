@@ -0,0 +1,425 @@
+"""Compiler – lowers AST nodes produced by Parser.parse() into flat bytecode.
+
+Nodes without a dedicated lowering are emitted as a single EVAL_NODE
+instruction, which hands the subtree back to the tree-walking visitors so
+that every language feature keeps its exact semantics.
+"""
+
+from gladlang.core.constants import (
+    GL_KEYWORD,
+    GL_MINUS,
+    GL_BIT_NOT,
+    GL_PLUSPLUS,
+    GL_MINUSMINUS,
+    GL_EE,
+    GL_NE,
+    GL_LT,
+    GL_GT,
+    GL_LTE,
+    GL_GTE,
+)
+from gladlang.compiler.code_object import CodeObject
+from gladlang.compiler.opcodes import (
+    OP_LOAD_NUMBER,
+    OP_LOAD_STRING,
+    OP_LOAD_NULL,
+    OP_LOAD_TRUE,
+    OP_LOAD_CONST,
+    OP_LOAD_NAME,
+    OP_STORE_NAME,
+    OP_POP_TOP,
+    OP_BINARY_OP,
+    OP_COMPARE_IS,
+    OP_INSTANCEOF,
+    OP_SHORT_AND,
+    OP_SHORT_OR,
+    OP_LOGIC_AND,
+    OP_LOGIC_OR,
+    OP_UNARY_NEG,
+    OP_UNARY_NOT,
+    OP_UNARY_BIT_NOT,
+    OP_UNARY_PLUS,
+    OP_INCDEC_NAME,
+    OP_JUMP,
+    OP_POP_JUMP_IF_FALSE,
+    OP_PREPARE_CALL,
+    OP_CALL,
+    OP_BUILD_LIST,
+    OP_GET_ATTR,
+    OP_SUBSCR,
+    OP_STORE_SUBSCR,
+    OP_PRINT,
+    OP_PUSH_SCOPE,
+    OP_POP_SCOPE,
+    OP_SETUP_LOOP,
+    OP_POP_BLOCK,
+    OP_BREAK_LOOP,
+    OP_CONTINUE_LOOP,
+    OP_GET_ITER,
+    OP_FOR_ITER,
+    OP_RETURN_VALUE,
+    OP_JUMP_IF_NO_TCO,
+    OP_RETURN_TAILCALL,
+    OP_EVAL_NODE,
+    OP_CHAIN_COMPARE,
+    OP_CHARGE,
+    OP_DICT_KEY,
+    OP_BUILD_DICT,
+    OP_SETUP_TRY,
+    OP_END_FINALLY,
+)
+from gladlang.parser.ast import CallNode, VarAccessNode
+from gladlang.values.primitives.number import shared_int
+
+
+class Compiler:
+    CHAIN_OPS = (GL_EE, GL_NE, GL_LT, GL_GT, GL_LTE, GL_GTE)
+
+    def __init__(self, metered=False):
+        self.code = None
+        self.metered = metered
+
+    def compile(self, node, name="<code>"):
+        self.code = CodeObject(name)
+        self.compile_node(node)
+        return self.code
+
+    def compile_node(self, node):
+        method = getattr(self, f"compile_{type(node).__name__}", None)
+        if method is None or method(node) is False:
+            self.emit_fallback(node)
+
+    def emit_fallback(self, node):
+        self.code.emit(OP_EVAL_NODE, self.code.add_constant(node), node)
+
+    def emit_jump(self, op, node=None):
+        return self.code.emit(op, None, node)
+
+    def emit_charge(self, node):
+        if self.metered:
+            self.code.emit(OP_CHARGE, None, node)
+
+    def here(self):
+        return len(self.code.instructions)
+
+    def patch_here(self, index):
+        self.code.patch(index, self.here())
+
+    def compile_NumberNode(self, node):
+        shared = shared_int(node.tok.value)
+        if shared is not None:
+            self.code.emit(OP_LOAD_CONST, self.code.add_constant(shared), node)
+            return
+
+        self.code.emit(OP_LOAD_NUMBER, self.code.add_constant(node.tok.value), node)
+
+    def compile_StringNode(self, node):
+        self.code.emit(OP_LOAD_STRING, self.code.add_constant(node.value), node)
+
+    def compile_VarAccessNode(self, node):
+        if node.var_name_tok.value in ("THIS", "SUPER"):
+            return False
+
+        self.code.emit(OP_LOAD_NAME, self.code.add_name(node.var_name_tok.value), node)
+
+    def compile_VarAssignNode(self, node):
+        if getattr(node, "target_visibility", "PUBLIC") != "PUBLIC":
+            return False
+
+        self.compile_node(node.value_node)
+        self.code.emit(
+            OP_STORE_NAME,
+            (self.code.add_name(node.var_name_tok.value), node.is_declaration),
+            node,
+        )
+
+    def compile_StatementListNode(self, node):
+        if not node.statement_nodes:
+            self.code.emit(OP_LOAD_NULL, None, node)
+            return
+
+        last = len(node.statement_nodes) - 1
+        for i, statement_node in enumerate(node.statement_nodes):
+            self.compile_node(statement_node)
+            if i != last:
+                self.code.emit(OP_POP_TOP)
+
+    def compile_BinOpNode(self, node):
+        op_tok = node.op_tok
+
+        if op_tok.matches(GL_KEYWORD, "AND") or op_tok.matches(GL_KEYWORD, "OR"):
+            is_and = op_tok.value == "AND"
+            self.compile_node(node.left_node)
+            short_jump = self.emit_jump(OP_SHORT_AND if is_and else OP_SHORT_OR, node)
+            self.compile_node(node.right_node)
+            self.code.emit(OP_LOGIC_AND if is_and else OP_LOGIC_OR, None, node)
+            self.patch_here(short_jump)
+            return
+
+        self.compile_node(node.left_node)
+        self.compile_node(node.right_node)
+
+        if op_tok.matches(GL_KEYWORD, "IS"):
+            self.code.emit(OP_COMPARE_IS, None, node)
+        elif op_tok.matches(GL_KEYWORD, "INSTANCEOF"):
+            self.code.emit(OP_INSTANCEOF, None, node)
+        else:
+            self.code.emit(OP_BINARY_OP, op_tok.type, node)
+
+    def compile_ChainedCompNode(self, node):
+        for op_tok, _ in node.ops_and_exprs:
+            if op_tok.type not in self.CHAIN_OPS and not op_tok.matches(
+                GL_KEYWORD, "IS"
+            ):
+                return False
+
+        self.compile_node(node.left_node)
+
+        exits = []
+        for op_tok, right_node in node.ops_and_exprs:
+            self.compile_node(right_node)
+            op = "IS" if op_tok.type == GL_KEYWORD else op_tok.type
+            exits.append((self.code.emit(OP_CHAIN_COMPARE, None, node), op))
+
+        self.code.emit(OP_POP_TOP)
+        self.code.emit(OP_LOAD_TRUE, None, node)
+
+        end = self.here()
+        for index, op in exits:
+            self.code.patch(index, (op, end))
+
+    def compile_UnaryOpNode(self, node):
+        op_type = node.op_tok.type
+
+        if op_type in (GL_PLUSPLUS, GL_MINUSMINUS):
+            if not isinstance(node.node, VarAccessNode):
+                return False
+
+            self.code.emit(
+                OP_INCDEC_NAME,
+                (node.node.var_name_tok.value, op_type == GL_PLUSPLUS, False),
+                node,
+            )
+            return
+
+        self.compile_node(node.node)
+
+        if op_type == GL_MINUS:
+            self.code.emit(OP_UNARY_NEG, None, node)
+        elif node.op_tok.matches(GL_KEYWORD, "NOT"):
+            self.code.emit(OP_UNARY_NOT, None, node)
+        elif op_type == GL_BIT_NOT:
+            self.code.emit(OP_UNARY_BIT_NOT, None, node)
+        else:
+            self.code.emit(OP_UNARY_PLUS, None, node)
+
+    def compile_PostOpNode(self, node):
+        if not isinstance(node.node, VarAccessNode):
+            return False
+
+        self.code.emit(
+            OP_INCDEC_NAME,
+            (node.node.var_name_tok.value, node.op_tok.type == GL_PLUSPLUS, True),
+            node,
+        )
+
+    def compile_TernaryOpNode(self, node):
+        self.compile_node(node.condition_node)
+        to_false = self.emit_jump(OP_POP_JUMP_IF_FALSE)
+        self.compile_node(node.true_case_node)
+        to_end = self.emit_jump(OP_JUMP)
+        self.patch_here(to_false)
+        self.compile_node(node.false_case_node)
+        self.patch_here(to_end)
+
+    def compile_IfNode(self, node):
+        to_end = []
+        for condition, body in node.cases:
+            self.compile_node(condition)
+            to_next = self.emit_jump(OP_POP_JUMP_IF_FALSE)
+            self.emit_charge(body)
+            self.compile_node(body)
+            to_end.append(self.emit_jump(OP_JUMP))
+            self.patch_here(to_next)
+
+        if node.else_case:
+            self.emit_charge(node.else_case)
+            self.compile_node(node.else_case)
+        else:
+            self.code.emit(OP_LOAD_NULL, None, node)
+
+        for index in to_end:
+            self.patch_here(index)
+
+    def compile_WhileNode(self, node):
+        self.code.emit(OP_PUSH_SCOPE, "WHILE", node)
+        setup = self.code.emit(OP_SETUP_LOOP, None, node)
+
+        loop_start = self.here()
+        self.emit_charge(node)
+        self.compile_node(node.condition_node)
+        to_break = self.emit_jump(OP_POP_JUMP_IF_FALSE)
+
+        self.compile_node(node.body_node)
+
+        self.code.emit(OP_POP_TOP)
+        self.code.emit(OP_JUMP, loop_start)
+
+        self.code.patch(setup, (self.here(), loop_start))
+        self.patch_here(to_break)
+        self.code.emit(OP_POP_BLOCK)
+        self.code.emit(OP_POP_SCOPE)
+        self.code.emit(OP_LOAD_NULL, None, node)
+
+    def compile_CForNode(self, node):
+        self.code.emit(OP_PUSH_SCOPE, "C_FOR", node)
+
+        if node.init_node:
+            self.compile_node(node.init_node)
+            self.code.emit(OP_POP_TOP)
+
+        setup = self.code.emit(OP_SETUP_LOOP, None, node)
+
+        loop_start = self.here()
+        self.emit_charge(node)
+        to_break = None
+        if node.condition_node:
+            self.compile_node(node.condition_node)
+            to_break = self.emit_jump(OP_POP_JUMP_IF_FALSE)
+
+        self.compile_node(node.body_node)
+        self.code.emit(OP_POP_TOP)
+
+        step_start = self.here()
+        if node.step_node:
+            self.compile_node(node.step_node)
+            self.code.emit(OP_POP_TOP)
+
+        self.code.emit(OP_JUMP, loop_start)
+
+        self.code.patch(setup, (self.here(), step_start))
+        if to_break is not None:
+            self.patch_here(to_break)
+
+        self.code.emit(OP_POP_BLOCK)
+        self.code.emit(OP_POP_SCOPE)
+        self.code.emit(OP_LOAD_NULL, None, node)
+
+    def compile_ForNode(self, node):
+        iter_slot = self.code.new_slot()
+
+        self.compile_node(node.iterable_node)
+        self.code.emit(OP_GET_ITER, iter_slot, node.iterable_node)
+        self.code.emit(OP_PUSH_SCOPE, "FOR", node)
+        setup = self.code.emit(OP_SETUP_LOOP, None, node)
+
+        loop_start = self.here()
+        for_iter = self.code.emit(OP_FOR_ITER, None, node)
+        self.emit_charge(node)
+
+        self.compile_node(node.body_node)
+
+        self.code.emit(OP_POP_TOP)
+        self.code.emit(OP_JUMP, loop_start)
+
+        self.code.patch(setup, (self.here(), loop_start))
+        self.code.patch(for_iter, (iter_slot, node.var_name_toks, self.here()))
+        self.code.emit(OP_POP_BLOCK)
+        self.code.emit(OP_POP_SCOPE)
+        self.code.emit(OP_LOAD_NULL, None, node)
+
+    def compile_BreakNode(self, node):
+        self.code.emit(OP_BREAK_LOOP, None, node)
+
+    def compile_ContinueNode(self, node):
+        self.code.emit(OP_CONTINUE_LOOP, None, node)
+
+    def compile_ReturnNode(self, node):
+        to_return = node.node_to_return
+
+        if isinstance(to_return, CallNode):
+            to_plain = self.emit_jump(OP_JUMP_IF_NO_TCO, node)
+            self.compile_node(to_return.node_to_call)
+            for arg_node in to_return.arg_nodes:
+                self.compile_node(arg_node)
+
+            self.code.emit(OP_RETURN_TAILCALL, len(to_return.arg_nodes), node)
+            self.patch_here(to_plain)
+
+        self.compile_node(to_return)
+        self.code.emit(OP_RETURN_VALUE, None, node)
+
+    def compile_TryCatchNode(self, node):
+        finally_slot = self.code.new_slot() if node.finally_body_node else None
+        setup = self.code.emit(OP_SETUP_TRY, None, node)
+
+        self.compile_node(node.try_body_node)
+        self.code.emit(OP_POP_BLOCK)
+        to_finally = self.emit_jump(OP_JUMP)
+
+        catch_target = None
+        if node.catch_body_node:
+            catch_target = self.here()
+            self.compile_node(node.catch_body_node)
+            self.code.emit(OP_POP_TOP)
+            self.code.emit(OP_POP_SCOPE)
+            self.code.emit(OP_LOAD_NULL, None, node)
+            if node.finally_body_node:
+                self.code.emit(OP_POP_BLOCK)
+
+        self.patch_here(to_finally)
+
+        finally_target = None
+        if node.finally_body_node:
+            finally_target = self.here()
+            self.compile_node(node.finally_body_node)
+            self.code.emit(OP_POP_TOP)
+            self.code.emit(OP_END_FINALLY, finally_slot, node)
+
+        self.code.patch(setup, (catch_target, finally_target, finally_slot))
+
+    def compile_CallNode(self, node):
+        self.compile_node(node.node_to_call)
+        self.code.emit(OP_PREPARE_CALL, None, node)
+
+        for arg_node in node.arg_nodes:
+            self.compile_node(arg_node)
+
+        self.code.emit(OP_CALL, len(node.arg_nodes), node)
+
+    def compile_ListNode(self, node):
+        for element_node in node.element_nodes:
+            self.compile_node(element_node)
+
+        self.code.emit(OP_BUILD_LIST, len(node.element_nodes), node)
+
+    def compile_DictNode(self, node):
+        for key_node, value_node in node.key_value_pairs:
+            self.compile_node(key_node)
+            self.compile_node(value_node)
+            self.code.emit(OP_DICT_KEY, None, key_node)
+
+        self.code.emit(OP_BUILD_DICT, len(node.key_value_pairs), node)
+
+    def compile_GetAttrNode(self, node):
+        self.compile_node(node.object_node)
+        self.code.emit(OP_GET_ATTR, node.attr_name_tok, node)
+
+    def compile_ListAccessNode(self, node):
+        self.compile_node(node.list_node)
+        self.compile_node(node.index_node)
+        self.code.emit(OP_SUBSCR, None, node)
+
+    def compile_ListSetNode(self, node):
+        self.compile_node(node.list_node)
+        self.compile_node(node.index_node)
+        self.compile_node(node.value_node)
+        self.code.emit(OP_STORE_SUBSCR, None, node)
+
+    def compile_PrintNode(self, node):
+        for print_node in node.print_nodes:
+            self.compile_node(print_node)
+
+        self.code.emit(
+            OP_PRINT, (len(node.print_nodes), node.should_newline), node
+        )
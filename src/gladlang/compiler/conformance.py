@@ -0,0 +1,149 @@
+"""Conformance – runs every tests/*.glad script under each engine and diffs the output against the unoptimized tree-walker.
+
+A script can ask for run options on a leading comment line, e.g.
+``# conformance: --instruction-limit 500 --instruction-batch 1``. The
+options apply to every run of that script, the reference included, and
+``--no-locks`` runs it with unlocked symbol tables.
+
+Scripts in a subdirectory named after an engine (``tests/frames/``) run on
+that engine only, for options such as ``--stack-memory MB`` that only one
+engine supports. Each is compared with the expected output saved next to it
+(``<name>.expected``) instead of the tree-walker, since no other engine can
+reproduce it.
+
+A script with a ``<name>.ast`` file next to it also has its syntax tree
+after ``-O2``, as ``--dump-ast`` prints it, compared with that file. This
+checks what the optimizer did to the script, not just that its output
+stayed the same.
+"""
+
+import io
+import sys
+import difflib
+from pathlib import Path
+from gladlang.core.util.runner import run, ENGINES
+
+
+HEADER = "# conformance:"
+AST_LEVEL = 2
+
+
+def script_options(text):
+    options = {}
+
+    for line in text.splitlines():
+        if not line.startswith(HEADER):
+            break
+
+        args = line[len(HEADER) :].split()
+        while args:
+            flag = args.pop(0)
+            if flag == "--instruction-limit":
+                options["instruction_limit"] = int(args.pop(0))
+            elif flag == "--instruction-batch":
+                options["instruction_batch"] = int(args.pop(0))
+            elif flag == "--stack-memory":
+                options["stack_memory"] = int(args.pop(0)) * 1024 * 1024
+            elif flag == "--no-locks":
+                options["thread_safe"] = False
+            else:
+                raise ValueError(f"Unknown conformance option '{flag}'")
+
+    return options
+
+
+def run_script(path, engine, stdin_text="", optimize=1, dump_ast=None):
+    path = Path(path)
+    text = path.read_text(encoding="utf-8")
+
+    buffer = io.StringIO()
+    original_stdout = sys.stdout
+    original_stdin = sys.stdin
+
+    try:
+        sys.stdout = buffer
+        sys.stdin = io.StringIO(stdin_text)
+
+        try:
+            options = script_options(text)
+
+            _, error = run(
+                str(path),
+                text,
+                engine=engine,
+                optimize=optimize,
+                dump_ast=dump_ast,
+                **options,
+            )
+            if error:
+                buffer.write(error.as_string() + "\n")
+        except Exception as e:
+            buffer.write(f"An unexpected error occurred: {e}\n")
+    finally:
+        sys.stdout = original_stdout
+        sys.stdin = original_stdin
+
+    return buffer.getvalue()
+
+
+def compare(out, name, label, expected, expected_name, actual):
+    if actual == expected:
+        out.write(f"ok    {name} [{label}]\n")
+        return True
+
+    out.write(f"FAIL  {name} [{label}]\n")
+    out.writelines(
+        difflib.unified_diff(
+            expected.splitlines(keepends=True),
+            actual.splitlines(keepends=True),
+            expected_name,
+            f"{name} ({label})",
+        )
+    )
+    return False
+
+
+def run_conformance(
+    directory="tests", engines=("vm",), reference="tree", out=None, optimize=1
+):
+    out = out or sys.stdout
+    directory = Path(directory)
+    scripts = [(path, None) for path in sorted(directory.glob("*.glad"))]
+    for engine in ENGINES:
+        scripts.extend(
+            (path, engine) for path in sorted((directory / engine).glob("*.glad"))
+        )
+
+    mismatches = 0
+    for path, script_engine in scripts:
+        expected_path = path.with_suffix(".expected")
+
+        if script_engine is None:
+            expected = run_script(path, reference, optimize=0)
+            expected_name = f"{path.name} ({reference})"
+            script_engines = engines
+        elif expected_path.exists():
+            expected = expected_path.read_text(encoding="utf-8")
+            expected_name = expected_path.name
+            script_engines = (script_engine,)
+        else:
+            expected = run_script(path, script_engine, optimize=0)
+            expected_name = f"{path.name} ({script_engine})"
+            script_engines = (script_engine,)
+
+        for engine in script_engines:
+            actual = run_script(path, engine, optimize=optimize)
+            if not compare(out, path.name, engine, expected, expected_name, actual):
+                mismatches += 1
+
+        ast_path = path.with_suffix(".ast")
+        if ast_path.exists():
+            dump = io.StringIO()
+            run_script(path, reference, optimize=AST_LEVEL, dump_ast=dump)
+            expected = ast_path.read_text(encoding="utf-8")
+            actual = dump.getvalue()
+            if not compare(out, path.name, "ast", expected, ast_path.name, actual):
+                mismatches += 1
+
+    out.write(f"{len(scripts)} scripts, {mismatches} mismatches\n")
+    return mismatches
@@ -0,0 +1,90 @@
+"""Frame escape analysis – marks which function bodies let their call frame escape, and which of its names the escaping values use.
+
+A call's SymbolTable outlives the call when the body creates a value that
+keeps it: a nested DEF or anonymous function closes over the frame, a
+CLASS's static scope has the frame's table as its parent, an ENUM is
+bound to the defining context, and a SUPER value reads THIS from the
+context it was made in. A body containing none of these (at any depth)
+gets ``frame_local = True``. Calls to it take their table from the
+interpreter's FramePool (runtime/frame_pool.py) and hand it back on
+return, so this analysis is the only thing that keeps a table in use
+from being recycled.
+
+Every other body gets ``captured_names``: the free names of the functions
+and classes it creates, i.e. every identifier they mention, plus ``THIS``
+(SUPER and static-method checks read it from the frame). Nothing created
+by the body can look up any other name in the frame, so when the call
+returns its table keeps only these (SymbolTable.retain). A closure then
+keeps alive the variables it uses instead of the whole frame it was
+created in. The table itself is still shared, so later writes by the
+closure or by the frame stay visible to both.
+"""
+
+from gladlang.core.constants.token_types import GL_IDENTIFIER
+from gladlang.lexer.token import Token
+from gladlang.compiler.resolver import child_nodes
+from gladlang.parser.ast import FunDefNode, ClassNode, EnumNode, VarAccessNode
+
+CAPTURING_NODES = (FunDefNode, ClassNode, EnumNode)
+CAPTURING_NAMES = frozenset(("SUPER",))
+DYNAMIC_NAMES = frozenset(("THIS",))
+
+
+def captures_frame(body_node):
+    stack = [body_node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, CAPTURING_NODES):
+            return True
+
+        if type(node) is VarAccessNode and node.var_name_tok.value in CAPTURING_NAMES:
+            return True
+
+        stack.extend(child_nodes(node))
+
+    return False
+
+
+def referenced_names(node):
+    names = set()
+    stack = [node]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, (list, tuple)):
+            stack.extend(value)
+        elif isinstance(value, Token):
+            if value.type == GL_IDENTIFIER:
+                names.add(value.value)
+        elif type(value).__module__.startswith("gladlang.parser.ast"):
+            stack.extend(vars(value).values())
+
+    return names
+
+
+def captured_names(body_node):
+    names = set(DYNAMIC_NAMES)
+    stack = [body_node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, (FunDefNode, ClassNode)):
+            names |= referenced_names(node)
+        else:
+            stack.extend(child_nodes(node))
+
+    return frozenset(names)
+
+
+def mark_frame_locals(node):
+    if node is None:
+        return
+
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if type(node) is FunDefNode:
+            body_node = node.body_node
+            body_node.frame_local = not captures_frame(body_node)
+            if not body_node.frame_local:
+                body_node.captured_names = captured_names(body_node)
+
+        stack.extend(child_nodes(node))
@@ -0,0 +1,203 @@
+"""Frame VM – bytecode VM that keeps GladLang call frames on a heap list instead of the Python stack.
+
+The plain VM runs a call by invoking Function.execute, which visits the body
+through a nested VM.execute, so every GladLang call also costs several
+Python frames. FrameVM runs calls to plain Functions (and the FunctionGroup
+variants that call sites resolve to) inside one VM.execute loop. The caller's
+registers (pc, value stack, loop blocks, scope) are saved on a list, and the
+callee's code object becomes current. Returns pop that list. Tail calls
+replace the current activation in place. Recursion depth therefore costs
+heap memory only.
+
+Bound methods of plain Functions run the same way. Their activation keeps
+the instance that BoundMethod.execute would prepend to the arguments, and
+counts its tail calls as one chain (BoundMethod.MAX_TOTAL_RECURSION).
+
+Depth is bounded by ``stack_memory``, a byte budget divided by an estimate of
+what one nested scope costs (``FRAME_BYTES``). It is checked against
+Context.depth, the same measure the tree-walker compares with its default
+limit of 2000. Without a budget FrameVM keeps that limit. ``max_depth`` is
+also what Function.execute and BoundMethod.execute check, so calls that still
+go through execute() share the budget. The tail-call limit
+(Function.MAX_TOTAL_RECURSION) counts the tail calls of one activation per
+function, like the trampoline in Function.execute.
+
+Builtins, classes, and calls made from constructs the compiler leaves to the
+tree-walker (EVAL_NODE) still go through execute(), which nests Python frames.
+Deep recursion through them ends in "Expression too complex" once Python's
+own recursion limit is reached, before the stack-memory budget runs out.
+"""
+
+from gladlang.core.errors import RTError
+from gladlang.values.primitives.number import Number
+from gladlang.values.nulls.tailcall import TailCall
+from gladlang.values.functions.function import Function
+from gladlang.values.functions.function_group import FunctionGroup
+from gladlang.values.functions.bound_method import BoundMethod
+from gladlang.interpreter.interpreter import Interpreter
+from gladlang.interpreter.mixins.base import DEFAULT_MAX_DEPTH
+from gladlang.compiler.vm import VM
+
+FRAME_BYTES = 2048
+
+
+class Activation:
+    __slots__ = (
+        "owner",
+        "calling_context",
+        "tail_calls",
+        "context",
+        "code",
+        "captured",
+        "method",
+        "instance",
+    )
+
+    def __init__(self, owner, calling_context, tail_calls):
+        self.owner = owner
+        self.calling_context = calling_context
+        self.tail_calls = tail_calls
+        self.context = None
+        self.code = None
+        self.captured = None
+        self.method = None
+        self.instance = None
+
+    def finish(self):
+        if self.captured is not None:
+            self.context.symbol_table.retain(self.captured)
+
+
+class FrameVM(VM):
+    heap_frames = True
+
+    def __init__(
+        self, instruction_limit=None, budget=None, cache_stats=None, stack_memory=None
+    ):
+        super().__init__(
+            instruction_limit=instruction_limit, budget=budget, cache_stats=cache_stats
+        )
+        self.stack_memory = stack_memory
+
+        if stack_memory is None:
+            self.max_depth = DEFAULT_MAX_DEPTH
+        else:
+            self.max_depth = max(1, stack_memory // FRAME_BYTES)
+
+    def enter(self, owner, callee, args, calling_context, activation=None):
+        if activation is None:
+            activation = Activation(owner, calling_context, {})
+            first = True
+
+            if type(callee) is BoundMethod:
+                activation.method = callee
+                activation.instance = callee.instance
+                callee = callee.function_to_bind
+        else:
+            first = False
+
+        tail_calls = activation.tail_calls
+        method = activation.method
+
+        if method is None:
+            counter, max_calls = None, Function.MAX_TOTAL_RECURSION
+        else:
+            counter, max_calls = method, BoundMethod.MAX_TOTAL_RECURSION
+
+        while True:
+            if isinstance(callee, BoundMethod) and not first:
+                if method is not None:
+                    activation.instance = callee.instance
+
+                callee = callee.function_to_bind
+
+            if isinstance(callee, FunctionGroup):
+                arity = len(args)
+                if arity not in callee.functions:
+                    return None, None, RTError(
+                        callee.pos_start,
+                        callee.pos_end,
+                        f"No variant of function '{callee.name}' accepts {arity} arguments",
+                        owner.context,
+                    )
+
+                callee = callee.functions[arity]
+
+            if type(callee) is not Function:
+                res = callee.execute(args, self, calling_context)
+                if res.error:
+                    return None, None, res.error.locate(
+                        owner.pos_start, owner.pos_end, calling_context
+                    )
+
+                return None, res.value, None
+
+            new_context = callee.generate_new_context(
+                calling_context if first else None
+            )
+            new_context.active_class = callee.defining_class
+            new_context.is_static = callee.is_static
+
+            key = callee if counter is None else counter
+            calls = tail_calls.get(key, 0) + 1
+            tail_calls[key] = calls
+
+            if calls > max_calls:
+                return None, None, RTError(
+                    callee.pos_start,
+                    callee.pos_end,
+                    f"Total recursion calls exceeded limit ({max_calls})",
+                    new_context,
+                )
+
+            if first:
+                new_context.parent_entry_pos = owner.pos_start
+
+            if new_context.depth > self.max_depth:
+                return None, None, RTError(
+                    callee.pos_start,
+                    callee.pos_end,
+                    "Recursion limit exceeded",
+                    new_context,
+                )
+
+            new_context._tco_func = callee
+
+            if method is not None:
+                args = [activation.instance] + args
+
+            res = callee.check_and_populate_args(callee.arg_names, args, new_context)
+            if res.error:
+                return None, None, res.error
+
+            budget = self.budget
+            if budget is not None and budget.charge(callee.body_node):
+                return None, None, self.budget_error(callee.body_node, new_context)
+
+            captured = getattr(callee.body_node, "captured_names", None)
+
+            code = self.compile(callee.body_node)
+            if code is not False:
+                activation.context = new_context
+                activation.code = code
+                activation.captured = captured
+                return activation, None, None
+
+            value_result = Interpreter.visit(self, callee.body_node, new_context)
+            if value_result.error:
+                return None, None, value_result.error
+
+            if captured is not None:
+                new_context.symbol_table.retain(captured)
+
+            if value_result.should_return:
+                ret_val = value_result.return_value
+                if isinstance(ret_val, TailCall):
+                    callee = ret_val.function
+                    args = ret_val.args
+                    first = False
+                    continue
+
+                return None, ret_val, None
+
+            return None, value_result.value or Number.null.copy(), None
@@ -0,0 +1,50 @@
+"""Literal pool – interns every string literal of a program into one shared String per distinct text.
+
+Runs once per program, after the optimizer (so folded literals are
+included) and before execution. Each StringNode gets a ``value`` attribute
+holding the pooled String, and the text itself goes through sys.intern, so
+equal literals anywhere in the program share one object and one str.
+Strings are immutable (concatenation and slicing always build new values),
+so every engine can hand out the pooled String directly instead of
+allocating a fresh one each time the literal is evaluated.
+
+Like small integers, equal literals may therefore be the same object
+for ``IS``.
+"""
+
+from sys import intern
+
+from gladlang.compiler.resolver import child_nodes
+from gladlang.parser.ast import StringNode
+from gladlang.values.primitives.string import String
+
+
+class LiteralPool:
+    def __init__(self):
+        self.strings = {}
+
+    def string(self, text):
+        value = self.strings.get(text)
+        if value is None:
+            text = intern(text)
+            value = self.strings[text] = String(text)
+
+        return value
+
+    def intern(self, node):
+        if node is None:
+            return self
+
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if type(node) is StringNode:
+                node.value = self.string(node.tok.value)
+            else:
+                stack.extend(child_nodes(node))
+
+        return self
+
+
+def pool_literals(node):
+    return LiteralPool().intern(node)
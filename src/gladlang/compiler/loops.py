@@ -0,0 +1,367 @@
+"""Loop optimizer – loop-invariant code motion and counter strength reduction for WHILE and C-style FOR loops (-O2).
+
+Effect analysis walks the whole loop (init, condition, step and body,
+including nested functions) and records the names it may write, whether it
+may write to lists, dicts or attributes ("heap"), and whether it calls
+anything other than a side-effect-free builtin. Any such call bails out of
+code motion entirely, since a user function may rebind outer variables or
+mutate shared objects. Builtins count as pure only for a fresh program whose
+source never declares their names; REPL inputs reuse a global scope that an
+earlier line may have changed.
+
+Invariant motion wraps the largest side-effect-free subexpressions of the
+condition and step that read no written name (and no heap state if the loop
+writes to the heap) in an InvariantNode. That node is evaluated at its
+original place on the first iteration and then served from the loop scope.
+Errors and evaluation order are therefore unchanged.
+
+Strength reduction turns a C-style FOR step ``i = i + n`` / ``i += n`` /
+``i++`` / ``i--`` on a counter declared by the loop's own ``LET`` into a
+CounterStepNode. That node bumps the Number in place. It does so only when
+every other read of the counter cannot keep a reference to the Number object:
+arithmetic or comparison operands, subscripts and PRINT. It also requires
+that no FINAL anywhere in the program shares the counter's name.
+"""
+
+from itertools import count
+
+from gladlang.core.constants import (
+    GL_KEYWORD,
+    GL_PLUSPLUS,
+    GL_MINUSMINUS,
+    GL_PLUS,
+    GL_MINUS,
+)
+from gladlang.compiler.optimizer import FOLDABLE_BINOPS, is_ast_node
+from gladlang.parser.ast import (
+    NumberNode,
+    StringNode,
+    VarAccessNode,
+    VarAssignNode,
+    FinalVarAssignNode,
+    MultiVarAssignNode,
+    VisibilityStmtNode,
+    FunDefNode,
+    ClassNode,
+    EnumNode,
+    ForNode,
+    WhileNode,
+    CForNode,
+    TryCatchNode,
+    ListCompNode,
+    DictCompNode,
+    BinOpNode,
+    UnaryOpNode,
+    PostOpNode,
+    ChainedCompNode,
+    CallNode,
+    NewInstanceNode,
+    ListAccessNode,
+    ListSetNode,
+    GetAttrNode,
+    SetAttrNode,
+    PrintNode,
+    InvariantNode,
+    CounterStepNode,
+)
+
+PURE_BUILTINS = ("STR", "INT", "FLOAT", "BOOL", "LEN", "LENGTH")
+
+_cache_keys = count()
+
+
+def child_fields(node):
+    try:
+        return list(vars(node).items())
+    except TypeError:
+        return []
+
+
+def walk(value, parent=None, field=None):
+    stack = [(value, parent, field)]
+
+    while stack:
+        value, parent, field = stack.pop()
+
+        if isinstance(value, (list, tuple)):
+            stack.extend((item, parent, field) for item in value)
+            continue
+
+        if not is_ast_node(value):
+            continue
+
+        yield value, parent, field
+
+        for name, child in child_fields(value):
+            if name not in ("pos_start", "pos_end"):
+                stack.append((child, value, name))
+
+
+def is_incdec(node):
+    return isinstance(node, (UnaryOpNode, PostOpNode)) and node.op_tok.type in (
+        GL_PLUSPLUS,
+        GL_MINUSMINUS,
+    )
+
+
+class LoopEffects:
+    __slots__ = ("writes", "heap", "calls")
+
+    def __init__(self):
+        self.writes = set()
+        self.heap = False
+        self.calls = False
+
+
+class LoopOptimizer:
+    def __init__(self, program, fresh_globals=True):
+        self.declared = set()
+        self.finals = set()
+        self.hoisted = 0
+        self.reduced = 0
+
+        for node, _, _ in walk(program):
+            self.declared.update(self.names_written(node))
+
+            if isinstance(node, FinalVarAssignNode):
+                self.finals.add(node.var_name_tok.value)
+            elif isinstance(node, VisibilityStmtNode) and node.is_final:
+                var_name_tok = getattr(node.assign_node, "var_name_tok", None)
+                if var_name_tok is not None:
+                    self.finals.add(var_name_tok.value)
+
+        if fresh_globals:
+            self.pure_callees = set(PURE_BUILTINS) - self.declared
+        else:
+            self.pure_callees = set()
+
+    def names_written(self, node):
+        if isinstance(node, (VarAssignNode, FinalVarAssignNode)):
+            return [node.var_name_tok.value]
+
+        if isinstance(node, (MultiVarAssignNode, ForNode)):
+            return [tok.value for tok in node.var_name_toks]
+
+        if isinstance(node, FunDefNode):
+            names = [tok.value for tok in node.arg_name_toks]
+            if node.var_name_tok:
+                names.append(node.var_name_tok.value)
+
+            return names
+
+        if isinstance(node, ClassNode):
+            return [node.class_name_tok.value]
+
+        if isinstance(node, EnumNode):
+            return [node.enum_name_tok.value]
+
+        if isinstance(node, TryCatchNode) and node.catch_var_node:
+            return [node.catch_var_node.value]
+
+        if isinstance(node, (ListCompNode, DictCompNode)):
+            return [tok.value for var_toks, _, _ in node.iteration_specs for tok in var_toks]
+
+        if is_incdec(node) and isinstance(node.node, VarAccessNode):
+            return [node.node.var_name_tok.value]
+
+        return []
+
+    def is_pure_call(self, node):
+        callee = node.node_to_call
+        return (
+            isinstance(callee, VarAccessNode)
+            and callee.var_name_tok.value in self.pure_callees
+        )
+
+    def effects(self, loop):
+        effects = LoopEffects()
+
+        for node, _, _ in walk(loop):
+            effects.writes.update(self.names_written(node))
+
+            if isinstance(node, (ListSetNode, SetAttrNode)):
+                effects.heap = True
+            elif is_incdec(node) and not isinstance(node.node, VarAccessNode):
+                effects.heap = True
+            elif isinstance(node, NewInstanceNode):
+                effects.calls = True
+            elif isinstance(node, CallNode) and not self.is_pure_call(node):
+                effects.calls = True
+
+        if effects.calls:
+            effects.heap = True
+
+        return effects
+
+    def optimize(self, node):
+        for loop, _, _ in walk(node):
+            if isinstance(loop, (WhileNode, CForNode)):
+                self.optimize_loop(loop)
+
+        return node
+
+    def optimize_loop(self, loop):
+        effects = self.effects(loop)
+
+        if isinstance(loop, CForNode):
+            self.reduce_counter(loop)
+
+        if effects.calls:
+            return
+
+        loop.condition_node = self.hoist(loop.condition_node, effects)
+        if isinstance(loop, CForNode):
+            loop.step_node = self.hoist(loop.step_node, effects)
+
+    def is_invariant(self, node, effects):
+        for inner, _, _ in walk(node):
+            if isinstance(inner, (NumberNode, StringNode)):
+                continue
+
+            if isinstance(inner, VarAccessNode):
+                name = inner.var_name_tok.value
+                if name in ("THIS", "SUPER") or name in effects.writes:
+                    return False
+
+                continue
+
+            if isinstance(inner, BinOpNode):
+                if inner.op_tok.type in FOLDABLE_BINOPS:
+                    continue
+
+                if inner.op_tok.matches(GL_KEYWORD, "AND") or inner.op_tok.matches(
+                    GL_KEYWORD, "OR"
+                ):
+                    continue
+
+                return False
+
+            if isinstance(inner, UnaryOpNode) and not is_incdec(inner):
+                continue
+
+            if isinstance(inner, ChainedCompNode):
+                continue
+
+            if isinstance(inner, CallNode) and self.is_pure_call(inner):
+                if effects.heap:
+                    return False
+
+                continue
+
+            if isinstance(inner, (ListAccessNode, GetAttrNode)):
+                if effects.heap:
+                    return False
+
+                continue
+
+            return False
+
+        return True
+
+    def hoist(self, node, effects):
+        if node is None or isinstance(node, (NumberNode, StringNode, VarAccessNode)):
+            return node
+
+        if isinstance(node, InvariantNode):
+            return node
+
+        if self.is_invariant(node, effects):
+            self.hoisted += 1
+            return InvariantNode(node, f"@invariant{next(_cache_keys)}")
+
+        for name, child in child_fields(node):
+            if name in ("pos_start", "pos_end"):
+                continue
+
+            if is_ast_node(child) and not isinstance(
+                child, (FunDefNode, ListCompNode, DictCompNode)
+            ):
+                setattr(node, name, self.hoist(child, effects))
+
+            elif isinstance(child, list):
+                for index, item in enumerate(child):
+                    if isinstance(item, tuple):
+                        child[index] = tuple(
+                            self.hoist(part, effects) if is_ast_node(part) else part
+                            for part in item
+                        )
+                    elif is_ast_node(item):
+                        child[index] = self.hoist(item, effects)
+
+        return node
+
+    def counter_amount(self, step, var_name):
+        if is_incdec(step):
+            target = step.node
+            if isinstance(target, VarAccessNode) and target.var_name_tok.value == var_name:
+                return 1 if step.op_tok.type == GL_PLUSPLUS else -1
+
+            return None
+
+        if not isinstance(step, VarAssignNode) or step.is_declaration:
+            return None
+
+        if step.var_name_tok.value != var_name:
+            return None
+
+        value = step.value_node
+        if not isinstance(value, BinOpNode) or value.op_tok.type not in (GL_PLUS, GL_MINUS):
+            return None
+
+        left, right = value.left_node, value.right_node
+        if not isinstance(left, VarAccessNode) or left.var_name_tok.value != var_name:
+            return None
+
+        if not isinstance(right, NumberNode) or type(right.tok.value) is not int:
+            return None
+
+        return right.tok.value if value.op_tok.type == GL_PLUS else -right.tok.value
+
+    def reads_escape(self, loop, var_name, step):
+        step_nodes = {id(inner) for inner, _, _ in walk(step)}
+
+        for inner, parent, field in walk(loop):
+            if not isinstance(inner, VarAccessNode) or inner.var_name_tok.value != var_name:
+                continue
+
+            if id(inner) in step_nodes:
+                continue
+
+            if isinstance(parent, BinOpNode) and parent.op_tok.type in FOLDABLE_BINOPS:
+                continue
+
+            if isinstance(parent, ChainedCompNode):
+                continue
+
+            if isinstance(parent, (ListAccessNode, ListSetNode)) and field == "index_node":
+                continue
+
+            if isinstance(parent, PrintNode):
+                continue
+
+            return True
+
+        return False
+
+    def reduce_counter(self, loop):
+        init, step = loop.init_node, loop.step_node
+        if not isinstance(init, VarAssignNode) or not init.is_declaration:
+            return
+
+        var_name = init.var_name_tok.value
+        if var_name in self.finals or step is None:
+            return
+
+        amount = self.counter_amount(step, var_name)
+        if amount is None:
+            return
+
+        if self.reads_escape(loop, var_name, step):
+            return
+
+        self.reduced += 1
+        loop.step_node = CounterStepNode(step, var_name, amount)
+
+
+def optimize_loops(node, fresh_globals=True):
+    return LoopOptimizer(node, fresh_globals).optimize(node)
@@ -0,0 +1,55 @@
+"""Bytecode opcodes – instruction identifiers emitted by the Compiler and executed by the VM."""
+
+OP_LOAD_NUMBER = 0
+OP_LOAD_STRING = 1
+OP_LOAD_NULL = 2
+OP_LOAD_NAME = 3
+OP_STORE_NAME = 4
+OP_POP_TOP = 5
+OP_BINARY_OP = 6
+OP_COMPARE_IS = 7
+OP_INSTANCEOF = 8
+OP_SHORT_AND = 9
+OP_SHORT_OR = 10
+OP_LOGIC_AND = 11
+OP_LOGIC_OR = 12
+OP_UNARY_NEG = 13
+OP_UNARY_NOT = 14
+OP_UNARY_BIT_NOT = 15
+OP_INCDEC_NAME = 16
+OP_JUMP = 17
+OP_POP_JUMP_IF_FALSE = 18
+OP_PREPARE_CALL = 19
+OP_CALL = 20
+OP_BUILD_LIST = 21
+OP_GET_ATTR = 22
+OP_SUBSCR = 23
+OP_STORE_SUBSCR = 24
+OP_PRINT = 25
+OP_PUSH_SCOPE = 26
+OP_POP_SCOPE = 27
+OP_SETUP_LOOP = 28
+OP_POP_BLOCK = 29
+OP_BREAK_LOOP = 30
+OP_CONTINUE_LOOP = 31
+OP_GET_ITER = 32
+OP_FOR_ITER = 33
+OP_RETURN_VALUE = 34
+OP_JUMP_IF_NO_TCO = 35
+OP_RETURN_TAILCALL = 36
+OP_EVAL_NODE = 37
+OP_CHAIN_COMPARE = 38
+OP_LOAD_TRUE = 39
+OP_UNARY_PLUS = 40
+OP_CHARGE = 41
+OP_LOAD_CONST = 42
+OP_DICT_KEY = 43
+OP_BUILD_DICT = 44
+OP_SETUP_TRY = 45
+OP_END_FINALLY = 46
+
+OPCODE_NAMES = {
+    value: name[3:]
+    for name, value in list(globals().items())
+    if name.startswith("OP_") and isinstance(value, int)
+}
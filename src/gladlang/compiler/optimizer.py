@@ -0,0 +1,298 @@
+"""AST optimizer – constant folding over literal subtrees, plus a tree dumper for inspecting the result.
+
+Level 1 folds BinOpNode, UnaryOpNode and TernaryOpNode trees whose operands
+are NumberNode / StringNode literals into a single literal node. Folding
+calls the same Value methods the interpreter uses, so results are identical.
+Anything that would raise (division by zero, the ``Number.MAX_INT_BITS``
+limit, float overflow, type errors) is left in the tree and still fails at
+runtime with the usual position. Results that are not a plain Number or
+String (comparisons that yield TRUE / FALSE copies, logic operators) are not
+folded either, because a literal node could not reproduce their type. Only
+literal operands are considered: operand types are unknown otherwise, so
+identities such as ``X * 1`` are not rewritten.
+
+Level 2 additionally runs the loop pass in compiler/loops.py (invariant
+motion and counter strength reduction) over the folded tree.
+
+format_tree leaves out source positions, resolver annotations and the
+InvariantNode cache keys (numbered per process), and it sorts sets such as
+``captured_names``, so the same script always dumps the same text.
+"""
+
+from gladlang.core.constants import (
+    GL_KEYWORD,
+    GL_PLUS,
+    GL_MINUS,
+    GL_MUL,
+    GL_DIV,
+    GL_MOD,
+    GL_FLOORDIV,
+    GL_POW,
+    GL_EE,
+    GL_NE,
+    GL_LT,
+    GL_GT,
+    GL_LTE,
+    GL_GTE,
+    GL_BIT_AND,
+    GL_BIT_OR,
+    GL_BIT_XOR,
+    GL_LSHIFT,
+    GL_RSHIFT,
+    GL_BIT_NOT,
+    GL_INT,
+    GL_FLOAT,
+    GL_STRING,
+)
+from gladlang.lexer.token import Token
+from gladlang.values.primitives.number import Number, FrozenNumber
+from gladlang.values.primitives.string import String
+from gladlang.parser.ast import NumberNode, StringNode
+
+OPTIMIZE_LEVELS = (0, 1, 2)
+DEFAULT_LEVEL = 1
+
+MAX_FOLDED_STRING = 10_000
+
+FOLDABLE_BINOPS = {
+    GL_PLUS: "added_to",
+    GL_MINUS: "subbed_by",
+    GL_MUL: "multed_by",
+    GL_DIV: "dived_by",
+    GL_MOD: "modded_by",
+    GL_FLOORDIV: "floordived_by",
+    GL_POW: "powed_by",
+    GL_EE: "get_comparison_eq",
+    GL_NE: "get_comparison_ne",
+    GL_LT: "get_comparison_lt",
+    GL_GT: "get_comparison_gt",
+    GL_LTE: "get_comparison_lte",
+    GL_GTE: "get_comparison_gte",
+    GL_BIT_AND: "bitted_and_by",
+    GL_BIT_OR: "bitted_or_by",
+    GL_BIT_XOR: "bitted_xor_by",
+    GL_LSHIFT: "lshifted_by",
+    GL_RSHIFT: "rshifted_by",
+}
+
+LITERAL_NODES = (NumberNode, StringNode)
+
+
+def is_ast_node(value):
+    return type(value).__module__.startswith("gladlang.parser.ast")
+
+
+def literal_value(node):
+    if type(node) is NumberNode:
+        return Number(node.tok.value)
+
+    return String(node.tok.value)
+
+
+def literal_node(value, node):
+    if type(value) in (Number, FrozenNumber):
+        tok_type = GL_FLOAT if isinstance(value.value, float) else GL_INT
+        node_type = NumberNode
+    elif type(value) is String:
+        if len(value.value) > MAX_FOLDED_STRING:
+            return None
+
+        tok_type = GL_STRING
+        node_type = StringNode
+    else:
+        return None
+
+    tok = Token(tok_type, value.value, node.pos_start, node.pos_end)
+    folded = node_type(tok)
+    folded.pos_start = node.pos_start
+    folded.pos_end = node.pos_end
+    return folded
+
+
+class Optimizer:
+    def __init__(self, level=DEFAULT_LEVEL, fresh_globals=True):
+        self.level = level
+        self.fresh_globals = fresh_globals
+        self.folded = 0
+
+    def optimize(self, node):
+        if node is None or self.level <= 0:
+            return node
+
+        try:
+            node = self.transform(node)
+        except RecursionError:
+            return node
+
+        if self.level >= 2:
+            from gladlang.compiler.loops import optimize_loops
+
+            node = optimize_loops(node, self.fresh_globals)
+
+        return node
+
+    def transform(self, value):
+        if isinstance(value, list):
+            for index, item in enumerate(value):
+                value[index] = self.transform(item)
+
+            return value
+
+        if isinstance(value, tuple):
+            return tuple(self.transform(item) for item in value)
+
+        if not is_ast_node(value):
+            return value
+
+        try:
+            fields = vars(value)
+        except TypeError:
+            return value
+
+        for name, child in list(fields.items()):
+            if name in ("pos_start", "pos_end"):
+                continue
+
+            if isinstance(child, (list, tuple)) or is_ast_node(child):
+                setattr(value, name, self.transform(child))
+
+        method = getattr(self, f"fold_{type(value).__name__}", None)
+        if method is None:
+            return value
+
+        folded = method(value)
+        if folded is None:
+            return value
+
+        self.folded += 1
+        return folded
+
+    def fold_BinOpNode(self, node):
+        method_name = FOLDABLE_BINOPS.get(node.op_tok.type)
+        if method_name is None:
+            return None
+
+        if not isinstance(node.left_node, LITERAL_NODES):
+            return None
+
+        if not isinstance(node.right_node, LITERAL_NODES):
+            return None
+
+        left = literal_value(node.left_node)
+        right = literal_value(node.right_node)
+
+        try:
+            result, error = getattr(left, method_name)(right)
+        except Exception:
+            return None
+
+        if error:
+            return None
+
+        return literal_node(result, node)
+
+    def fold_UnaryOpNode(self, node):
+        if not isinstance(node.node, LITERAL_NODES):
+            return None
+
+        op_tok = node.op_tok
+        operand = literal_value(node.node)
+
+        try:
+            if op_tok.type == GL_MINUS:
+                if not isinstance(operand, Number):
+                    return None
+
+                result, error = operand.multed_by(Number(-1))
+            elif op_tok.matches(GL_KEYWORD, "NOT"):
+                result, error = operand.notted()
+            elif op_tok.type == GL_BIT_NOT:
+                result, error = operand.bitted_not()
+            elif op_tok.type == GL_PLUS:
+                result, error = operand.copy(), None
+            else:
+                return None
+        except Exception:
+            return None
+
+        if error:
+            return None
+
+        return literal_node(result, node)
+
+    def fold_TernaryOpNode(self, node):
+        if not isinstance(node.condition_node, LITERAL_NODES):
+            return None
+
+        if literal_value(node.condition_node).is_true():
+            return node.true_case_node
+
+        return node.false_case_node
+
+
+def optimize_tree(node, level=DEFAULT_LEVEL, fresh_globals=True):
+    return Optimizer(level, fresh_globals).optimize(node)
+
+
+def format_tree(node, indent=0):
+    lines = []
+
+    def describe(value):
+        if isinstance(value, LITERAL_NODES):
+            return f"{type(value).__name__} {value.tok.value!r}"
+
+        label = type(value).__name__
+        details = []
+
+        for name, field in vars(value).items():
+            if name in ("pos_start", "pos_end", "cache_key") or field is None:
+                continue
+
+            if isinstance(field, (list, tuple)) or is_ast_node(field):
+                continue
+
+            if name.startswith("scope_"):
+                continue
+
+            if isinstance(field, (set, frozenset)):
+                field = sorted(field)
+
+            details.append(f"{name}={field!r}")
+
+        if details:
+            label += " " + " ".join(details)
+
+        return label
+
+    def walk(value, depth, prefix=""):
+        pad = "  " * depth
+
+        if isinstance(value, (list, tuple)):
+            if not value:
+                lines.append(f"{pad}{prefix}[]")
+                return
+
+            lines.append(f"{pad}{prefix}[")
+            for item in value:
+                walk(item, depth + 1)
+
+            lines.append(f"{pad}]")
+            return
+
+        if not is_ast_node(value):
+            lines.append(f"{pad}{prefix}{value!r}")
+            return
+
+        lines.append(f"{pad}{prefix}{describe(value)}")
+
+        if isinstance(value, LITERAL_NODES):
+            return
+
+        for name, field in vars(value).items():
+            if isinstance(field, (list, tuple)) or is_ast_node(field):
+                walk(field, depth + 1, f"{name}: ")
+
+    if node is not None:
+        walk(node, indent)
+
+    return "\n".join(lines) + "\n"
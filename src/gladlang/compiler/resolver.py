@@ -0,0 +1,281 @@
+"""Scope resolver – classifies every variable reference as local, enclosing or global before execution.
+
+The resolver mirrors the runtime scope chain syntactically: the program,
+every function body, class static block, WHILE / C-style FOR / FOR loop,
+CATCH block and comprehension gets one scope, exactly as the interpreter
+creates one SymbolTable for each. A scope's declarations (LET, FINAL,
+destructuring, DEF, CLASS, ENUM, parameters, loop and catch variables) are
+collected before its body is visited, so a reference can be resolved
+against names declared later in the same scope.
+
+Each VarAccessNode and VarAssignNode is annotated with ``scope_kind`` and
+``scope_depth`` (number of tables to hop). At runtime
+SymbolTable.get_resolved() and update_resolved() hop straight to that
+table and read or write it without probing or locking the tables in
+between, and get_global() serves ``global`` reads from a per-node cache.
+No nearer table can hold the name, because nothing in the scopes in
+between declares it.
+
+Slow path: the runtime falls back to the ordinary SymbolTable.get() /
+update() chain walk whenever the resolved table does not (yet) hold the
+name. This happens with conditional or late declarations, names defined by
+later REPL inputs, builtins shadowed at runtime, and class static blocks
+whose table is detached after initialisation. ``THIS`` and ``SUPER`` are
+never resolved, since instance binding and static-method checks decide them
+at call time.
+"""
+
+from gladlang.parser.ast import (
+    VarAccessNode,
+    VarAssignNode,
+    FinalVarAssignNode,
+    MultiVarAssignNode,
+    VisibilityStmtNode,
+    FunDefNode,
+    ClassNode,
+    EnumNode,
+    WhileNode,
+    CForNode,
+    ForNode,
+    TryCatchNode,
+    ListCompNode,
+    DictCompNode,
+)
+
+DYNAMIC_NAMES = ("THIS", "SUPER")
+
+
+class Scope:
+    __slots__ = ("kind", "parent", "names")
+
+    def __init__(self, kind, parent=None):
+        self.kind = kind
+        self.parent = parent
+        self.names = set()
+
+    def declare(self, name):
+        self.names.add(name)
+
+
+def child_nodes(node):
+    try:
+        items = vars(node).values()
+    except TypeError:
+        return
+
+    stack = list(items)
+    while stack:
+        val = stack.pop()
+        if isinstance(val, (list, tuple)):
+            stack.extend(val)
+        elif type(val).__module__.startswith("gladlang.parser.ast"):
+            yield val
+
+
+class Resolver:
+    SCOPE_NODES = (
+        FunDefNode,
+        ClassNode,
+        WhileNode,
+        CForNode,
+        ForNode,
+        ListCompNode,
+        DictCompNode,
+    )
+
+    def resolve(self, node, scope=None):
+        if node is None:
+            return None
+
+        if scope is None:
+            scope = Scope("global")
+
+        self.collect(node, scope)
+        self.visit(node, scope)
+
+        return scope
+
+    def collect(self, node, scope):
+        if node is None:
+            return
+
+        if isinstance(node, VarAssignNode):
+            if node.is_declaration:
+                scope.declare(node.var_name_tok.value)
+
+        elif isinstance(node, FinalVarAssignNode):
+            scope.declare(node.var_name_tok.value)
+
+        elif isinstance(node, MultiVarAssignNode):
+            for tok in node.var_name_toks:
+                scope.declare(tok.value)
+
+        elif isinstance(node, VisibilityStmtNode):
+            var_name_tok = getattr(node.assign_node, "var_name_tok", None)
+            if var_name_tok is not None:
+                scope.declare(var_name_tok.value)
+
+        elif isinstance(node, FunDefNode):
+            if node.var_name_tok:
+                scope.declare(node.var_name_tok.value)
+
+            return
+
+        elif isinstance(node, ClassNode):
+            scope.declare(node.class_name_tok.value)
+            for superclass_node in node.superclass_nodes:
+                self.collect(superclass_node, scope)
+
+            return
+
+        elif isinstance(node, EnumNode):
+            scope.declare(node.enum_name_tok.value)
+
+        elif isinstance(node, ForNode):
+            self.collect(node.iterable_node, scope)
+            return
+
+        elif isinstance(node, TryCatchNode):
+            self.collect(node.try_body_node, scope)
+            self.collect(node.finally_body_node, scope)
+            return
+
+        elif isinstance(node, self.SCOPE_NODES):
+            return
+
+        for child in child_nodes(node):
+            self.collect(child, scope)
+
+    def lookup(self, scope, name):
+        depth = 0
+        crossed_function = False
+        current = scope
+
+        while True:
+            if name in current.names or current.parent is None:
+                break
+
+            if current.kind == "function":
+                crossed_function = True
+
+            current = current.parent
+            depth += 1
+
+        if current.kind == "global":
+            kind = "global"
+        elif crossed_function:
+            kind = "enclosing"
+        else:
+            kind = "local"
+
+        return kind, depth
+
+    def annotate(self, node, scope, name):
+        if name in DYNAMIC_NAMES:
+            return
+
+        node.scope_kind, node.scope_depth = self.lookup(scope, name)
+
+    def nested(self, kind, scope, declared, nodes):
+        inner = Scope(kind, scope)
+        for name in declared:
+            inner.declare(name)
+
+        for inner_node in nodes:
+            self.collect(inner_node, inner)
+
+        for inner_node in nodes:
+            self.visit(inner_node, inner)
+
+        return inner
+
+    def visit(self, node, scope):
+        if node is None:
+            return
+
+        if isinstance(node, VarAccessNode):
+            self.annotate(node, scope, node.var_name_tok.value)
+            return
+
+        if isinstance(node, VarAssignNode):
+            self.visit(node.value_node, scope)
+            self.annotate(node, scope, node.var_name_tok.value)
+            return
+
+        if isinstance(node, FunDefNode):
+            self.nested(
+                "function",
+                scope,
+                [tok.value for tok in node.arg_name_toks],
+                [node.body_node],
+            )
+            return
+
+        if isinstance(node, ClassNode):
+            for superclass_node in node.superclass_nodes:
+                self.visit(superclass_node, scope)
+
+            self.nested("class", scope, (), node.static_field_nodes)
+
+            for method_node in node.method_nodes:
+                self.visit(method_node, scope)
+
+            return
+
+        if isinstance(node, (WhileNode, CForNode)):
+            nodes = [
+                child
+                for child in (
+                    getattr(node, "init_node", None),
+                    node.condition_node,
+                    getattr(node, "step_node", None),
+                    node.body_node,
+                )
+                if child is not None
+            ]
+            self.nested("block", scope, (), nodes)
+            return
+
+        if isinstance(node, ForNode):
+            self.visit(node.iterable_node, scope)
+            self.nested(
+                "block",
+                scope,
+                [tok.value for tok in node.var_name_toks],
+                [node.body_node],
+            )
+            return
+
+        if isinstance(node, TryCatchNode):
+            self.visit(node.try_body_node, scope)
+
+            if node.catch_body_node:
+                declared = [node.catch_var_node.value] if node.catch_var_node else []
+                self.nested("block", scope, declared, [node.catch_body_node])
+
+            self.visit(node.finally_body_node, scope)
+            return
+
+        if isinstance(node, (ListCompNode, DictCompNode)):
+            declared = []
+            nodes = []
+            for var_toks, iter_node, cond_node in node.iteration_specs:
+                declared.extend(tok.value for tok in var_toks)
+                nodes.append(iter_node)
+                if cond_node:
+                    nodes.append(cond_node)
+
+            if isinstance(node, ListCompNode):
+                nodes.append(node.output_expr_node)
+            else:
+                nodes.extend((node.key_expr_node, node.value_expr_node))
+
+            self.nested("block", scope, declared, nodes)
+            return
+
+        for child in child_nodes(node):
+            self.visit(child, scope)
+
+
+def resolve_scopes(node):
+    return Resolver().resolve(node)
@@ -0,0 +1,833 @@
+"""Transpiler – emits Python source for function bodies and C-style FOR loops and runs it through compile().
+
+Values stay GladLang Values and every operation calls the same Value methods
+the tree visitors use, so overflow checks, error messages and positions are
+unchanged; what disappears is the per-node dispatch. A body containing any
+construct the transpiler does not handle is left to the tree-walker as a
+whole. Each generated line records the AST node it came from so failures
+raised inside generated code are reported against the ``.glad`` source.
+"""
+
+import sys
+from gladlang.core.constants import (
+    GL_KEYWORD,
+    GL_PLUS,
+    GL_MINUS,
+    GL_MUL,
+    GL_DIV,
+    GL_MOD,
+    GL_FLOORDIV,
+    GL_POW,
+    GL_EE,
+    GL_NE,
+    GL_LT,
+    GL_GT,
+    GL_LTE,
+    GL_GTE,
+    GL_BIT_AND,
+    GL_BIT_OR,
+    GL_BIT_XOR,
+    GL_LSHIFT,
+    GL_RSHIFT,
+    GL_PLUSPLUS,
+    GL_MINUSMINUS,
+    GL_BIT_NOT,
+)
+from gladlang.core.errors import RTError
+from gladlang.core.util.final_helpers import is_final_anywhere
+from gladlang.runtime.rt_result import RTResult
+from gladlang.runtime.context import Context
+from gladlang.runtime.symbol_table import SymbolTable
+from gladlang.runtime.signals import ErrorSignal, fail
+from gladlang.values.primitives.number import Number, shared_int
+from gladlang.values.primitives.list import List, settle_views
+from gladlang.values.nulls.tailcall import TailCall
+from gladlang.interpreter.interpreter import Interpreter
+from gladlang.parser.ast import CallNode, CForNode, VarAccessNode
+
+BINOP_METHODS = {
+    GL_PLUS: "added_to",
+    GL_MINUS: "subbed_by",
+    GL_MUL: "multed_by",
+    GL_DIV: "dived_by",
+    GL_MOD: "modded_by",
+    GL_FLOORDIV: "floordived_by",
+    GL_POW: "powed_by",
+    GL_EE: "get_comparison_eq",
+    GL_NE: "get_comparison_ne",
+    GL_LT: "get_comparison_lt",
+    GL_GT: "get_comparison_gt",
+    GL_LTE: "get_comparison_lte",
+    GL_GTE: "get_comparison_gte",
+    GL_BIT_AND: "bitted_and_by",
+    GL_BIT_OR: "bitted_or_by",
+    GL_BIT_XOR: "bitted_xor_by",
+    GL_LSHIFT: "lshifted_by",
+    GL_RSHIFT: "rshifted_by",
+}
+
+CHAIN_METHODS = {
+    GL_EE: "get_comparison_eq",
+    GL_NE: "get_comparison_ne",
+    GL_LT: "get_comparison_lt",
+    GL_GT: "get_comparison_gt",
+    GL_LTE: "get_comparison_lte",
+    GL_GTE: "get_comparison_gte",
+}
+
+
+class Unsupported(Exception):
+    pass
+
+
+def _binop_error(error, node, context):
+    error.pos_start = node.pos_start
+    error.pos_end = node.pos_end
+    error.context = context
+    fail(error)
+
+
+def _load(context, var_name, node):
+    value = context.symbol_table.get_resolved(var_name, node.scope_depth)
+    if value is None:
+        fail(
+            RTError(node.pos_start, node.pos_end, f"'{var_name}' is not defined", context)
+        )
+
+    return value
+
+
+def _load_global(context, var_name, node):
+    value = context.symbol_table.get_global(var_name, node)
+    if value is None:
+        fail(
+            RTError(node.pos_start, node.pos_end, f"'{var_name}' is not defined", context)
+        )
+
+    return value
+
+
+def _assign(context, var_name, value, node, visibility, is_declaration):
+    if is_final_anywhere(context.symbol_table, var_name):
+        fail(
+            RTError(
+                node.var_name_tok.pos_start,
+                node.var_name_tok.pos_end,
+                f"Cannot reassign constant '{var_name}'",
+                context,
+            )
+        )
+
+    if is_declaration:
+        context.symbol_table.set(var_name, value, visibility=visibility)
+    else:
+        err = context.symbol_table.update_resolved(var_name, value, node.scope_depth)
+        if err:
+            fail(RTError(node.pos_start, node.pos_end, err, context))
+
+
+def _incdec(context, var_name, step, is_post, node):
+    target = node.node
+
+    if is_final_anywhere(context.symbol_table, var_name):
+        fail(
+            RTError(
+                target.pos_start,
+                target.pos_end,
+                f"Cannot increment/decrement constant '{var_name}'",
+                context,
+            )
+        )
+
+    value = context.symbol_table.get_resolved(var_name, target.scope_depth)
+    if value is None:
+        fail(
+            RTError(
+                target.pos_start, target.pos_end, f"'{var_name}' is not defined", context
+            )
+        )
+
+    if not isinstance(value, Number):
+        fail(RTError(target.pos_start, target.pos_end, "Operand must be a number", context))
+
+    if step == 1:
+        new_value, error = value.added_to(Number(1))
+    else:
+        new_value, error = value.subbed_by(Number(1))
+
+    if error:
+        fail(error.locate(node.pos_start, node.pos_end, context))
+
+    err = context.symbol_table.update_resolved(var_name, new_value, target.scope_depth)
+    if err:
+        fail(RTError(target.pos_start, target.pos_end, err, context))
+
+    result = value if is_post else new_value
+    return result.copy()
+
+
+def _checked(pair, node, context):
+    result, error = pair
+    if error:
+        fail(error.locate(node.pos_start, node.pos_end, context))
+
+    return result
+
+
+def _unary(value, op_name, node, context):
+    number = value.copy()
+
+    if op_name == "multed_by":
+        if not isinstance(number, Number):
+            fail(
+                RTError(
+                    node.pos_start,
+                    node.pos_end,
+                    "Unary '-' can only be applied to numbers",
+                    context,
+                )
+            )
+
+        number, error = number.multed_by(Number(-1))
+    else:
+        number, error = getattr(number, op_name)()
+
+    if error:
+        _binop_error(error, node, context)
+
+    return number
+
+
+def _prepare_call(interpreter, value_to_call, node, context):
+    return interpreter.prepare_call(node, value_to_call, context)
+
+
+def _call(value_to_call, args, interpreter, node, context):
+    res = value_to_call.execute(args, interpreter, context)
+    if res.error:
+        fail(res.error.locate(node.pos_start, node.pos_end, context))
+
+    return res.value
+
+
+def _subscr(list_val, index_val, node, context):
+    element, error = list_val.get_element_at(index_val)
+    if error:
+        error.pos_start = node.pos_start
+        error.pos_end = node.pos_end
+        error.context = error.context or context
+        fail(error)
+
+    return element
+
+
+def _store_subscr(list_val, index_val, value, node, context):
+    new_value, error = list_val.set_element_at(index_val, value)
+    if error:
+        error.pos_start = node.pos_start
+        error.pos_end = node.pos_end
+        error.context = error.context or context
+        fail(error)
+
+    return new_value
+
+
+def _getattr(interpreter, obj, node, context):
+    value, error = interpreter.get_attr_cached(node, obj, context)
+    if error:
+        fail(error.locate(node.pos_start, node.pos_end, context))
+
+    return value
+
+
+def _print(values, should_newline):
+    text = " ".join([str(value) for value in values])
+    if should_newline:
+        text += "\n"
+
+    sys.stdout.write(text)
+    if not should_newline:
+        sys.stdout.flush()
+
+    return Number.null.copy()
+
+
+def _loop_context(display_name, context, node, inherit_class):
+    loop_context = Context(display_name, context, node.pos_start)
+    loop_context.symbol_table = SymbolTable(context.symbol_table)
+    if inherit_class:
+        loop_context.active_class = context.active_class
+
+    return loop_context
+
+
+def _iterate(interpreter, iterable_val, node, context):
+    iterator, error = interpreter.get_iterator(
+        iterable_val, node.pos_start, node.pos_end, context
+    )
+
+    if error:
+        fail(error)
+
+    return iterator
+
+
+def _bind(bind, element):
+    error = bind(element)
+    if error:
+        fail(error)
+
+
+def _charge(interpreter, node, context):
+    if interpreter.budget.charge(node):
+        fail(interpreter.budget_error(node, context))
+
+
+HELPERS = {
+    "_RTResult": RTResult,
+    "_Number": Number,
+    "_List": List,
+    "_settle_views": settle_views,
+    "_TailCall": TailCall,
+    "_fail": fail,
+    "_binop_error": _binop_error,
+    "_load": _load,
+    "_load_global": _load_global,
+    "_assign": _assign,
+    "_incdec": _incdec,
+    "_checked": _checked,
+    "_unary": _unary,
+    "_prepare_call": _prepare_call,
+    "_call": _call,
+    "_subscr": _subscr,
+    "_store_subscr": _store_subscr,
+    "_getattr": _getattr,
+    "_print": _print,
+    "_loop_context": _loop_context,
+    "_iterate": _iterate,
+    "_bind": _bind,
+    "_charge": _charge,
+}
+
+
+class Kernel:
+    __slots__ = ("name", "filename", "source", "function", "line_nodes")
+
+    def __init__(self, name, filename, source, function, line_nodes):
+        self.name = name
+        self.filename = filename
+        self.source = source
+        self.function = function
+        self.line_nodes = line_nodes
+
+    def node_at_line(self, lineno):
+        if 0 < lineno <= len(self.line_nodes):
+            return self.line_nodes[lineno - 1]
+
+        return None
+
+    def __repr__(self):
+        return f"<kernel {self.name} ({len(self.line_nodes)} lines)>"
+
+
+class Transpiler:
+    def __init__(self, interpreter):
+        self.interpreter = interpreter
+        self.kernel_count = 0
+
+    def transpile(self, node, name="<kernel>"):
+        self.lines = []
+        self.line_nodes = []
+        self.namespace = dict(HELPERS)
+        self.namespace["_interp"] = self.interpreter
+        self.refs = {}
+        self.temp_count = 0
+        self.loop_depth = 0
+        self.indent = 0
+        self.budgeted = self.interpreter.budget is not None
+
+        try:
+            self.line("def kernel(_c0):", node)
+            self.indent += 1
+            result = self.emit(node, "_c0")
+            self.line(f"return _RTResult().success({result})", node)
+        except Unsupported:
+            return None
+
+        self.kernel_count += 1
+        filename = f"<gladlang-kernel {self.kernel_count}: {name}>"
+        source = "\n".join(self.lines) + "\n"
+
+        try:
+            code = compile(source, filename, "exec")
+        except (SyntaxError, RecursionError, MemoryError):
+            return None
+
+        exec(code, self.namespace)
+        return Kernel(name, filename, source, self.namespace["kernel"], self.line_nodes)
+
+    def line(self, text, node):
+        self.lines.append("    " * self.indent + text)
+        self.line_nodes.append(node)
+
+    def temp(self):
+        self.temp_count += 1
+        return f"_t{self.temp_count}"
+
+    def ref(self, value):
+        key = id(value)
+        name = self.refs.get(key)
+        if name is None:
+            name = f"_r{len(self.refs)}"
+            self.refs[key] = name
+            self.namespace[name] = value
+
+        return name
+
+    def charge(self, node, ctx):
+        if self.budgeted:
+            self.line(f"_charge(_interp, {self.ref(node)}, {ctx})", node)
+
+    def emit(self, node, ctx):
+        method = getattr(self, f"emit_{type(node).__name__}", None)
+        if method is None:
+            raise Unsupported(type(node).__name__)
+
+        return method(node, ctx)
+
+    def emit_NumberNode(self, node, ctx):
+        shared = shared_int(node.tok.value)
+        if shared is not None:
+            return self.ref(shared)
+
+        t = self.temp()
+        self.line(f"{t} = _Number({self.ref(node.tok.value)})", node)
+        return t
+
+    def emit_StringNode(self, node, ctx):
+        return self.ref(node.value)
+
+    def emit_VarAccessNode(self, node, ctx):
+        var_name = node.var_name_tok.value
+        if var_name in ("THIS", "SUPER"):
+            raise Unsupported(var_name)
+
+        load = "_load_global" if node.scope_kind == "global" else "_load"
+        t = self.temp()
+        self.line(f"{t} = {load}({ctx}, {var_name!r}, {self.ref(node)})", node)
+        return t
+
+    def emit_VarAssignNode(self, node, ctx):
+        value = self.emit(node.value_node, ctx)
+        visibility = getattr(node, "target_visibility", "PUBLIC")
+        self.line(
+            f"_assign({ctx}, {node.var_name_tok.value!r}, {value}, {self.ref(node)}, "
+            f"{visibility!r}, {bool(node.is_declaration)})",
+            node,
+        )
+        return value
+
+    def emit_StatementListNode(self, node, ctx):
+        if not node.statement_nodes:
+            t = self.temp()
+            self.line(f"{t} = _Number.null.copy()", node)
+            return t
+
+        for statement_node in node.statement_nodes:
+            value = self.emit(statement_node, ctx)
+
+        return value
+
+    def emit_BinOpNode(self, node, ctx):
+        op_tok = node.op_tok
+        n = self.ref(node)
+
+        if op_tok.matches(GL_KEYWORD, "AND") or op_tok.matches(GL_KEYWORD, "OR"):
+            is_and = op_tok.value == "AND"
+            left = self.emit(node.left_node, ctx)
+            t = self.temp()
+
+            self.line(f"if {'not ' if is_and else ''}{left}.is_true():", node)
+            self.indent += 1
+            short = "false" if is_and else "true"
+            self.line(f"{t} = _Number.{short}_result", node)
+            self.indent -= 1
+            self.line("else:", node)
+            self.indent += 1
+            right = self.emit(node.right_node, ctx)
+            method = "anded_by" if is_and else "ored_by"
+            self.line(f"{t} = _checked({left}.{method}({right}), {n}, {ctx})", node)
+            self.indent -= 1
+            return t
+
+        if op_tok.matches(GL_KEYWORD, "IS") or op_tok.matches(GL_KEYWORD, "INSTANCEOF"):
+            method = (
+                "get_comparison_is" if op_tok.value == "IS" else "get_comparison_instanceof"
+            )
+            left = self.emit(node.left_node, ctx)
+            right = self.emit(node.right_node, ctx)
+            t = self.temp()
+            self.line(f"{t} = _checked({left}.{method}({right}), {n}, {ctx})", node)
+            return t
+
+        method = BINOP_METHODS.get(op_tok.type)
+        if method is None:
+            raise Unsupported(op_tok.type)
+
+        left = self.emit(node.left_node, ctx)
+        right = self.emit(node.right_node, ctx)
+        t = self.temp()
+        self.line(f"{t}, _e = {left}.{method}({right})", node)
+        self.line(f"if _e: _binop_error(_e, {n}, {ctx})", node)
+        return t
+
+    def emit_ChainedCompNode(self, node, ctx):
+        methods = []
+        for op_tok, _ in node.ops_and_exprs:
+            if op_tok.matches(GL_KEYWORD, "IS"):
+                methods.append("get_comparison_is")
+            elif op_tok.type in CHAIN_METHODS:
+                methods.append(CHAIN_METHODS[op_tok.type])
+            else:
+                raise Unsupported(op_tok.type)
+
+        n = self.ref(node)
+        t = self.temp()
+        left = self.emit(node.left_node, ctx)
+        base_indent = self.indent
+
+        for method, (_, right_node) in zip(methods, node.ops_and_exprs):
+            right = self.emit(right_node, ctx)
+            self.line(
+                f"if not _checked({left}.{method}({right}), {n}, {ctx}).is_true():",
+                node,
+            )
+            self.indent += 1
+            self.line(f"{t} = _Number.false_result", node)
+            self.indent -= 1
+            self.line("else:", node)
+            self.indent += 1
+            left = right
+
+        self.line(f"{t} = _Number.true_result", node)
+        self.indent = base_indent
+        return t
+
+    def emit_InvariantNode(self, node, ctx):
+        t = self.temp()
+        key = node.cache_key
+        self.line(f"{t} = {ctx}.symbol_table.symbols.get({key!r})", node)
+        self.line(f"if {t} is None:", node)
+        self.indent += 1
+        value = self.emit(node.expr_node, ctx)
+        self.line(f"{t} = {ctx}.symbol_table.symbols[{key!r}] = {value}", node)
+        self.indent -= 1
+        return t
+
+    def emit_CounterStepNode(self, node, ctx):
+        t = self.temp()
+        n = self.ref(node)
+        self.line(f"{t} = _interp.bump_counter({n}, {ctx}.symbol_table.symbols)", node)
+        self.line(f"if {t} is None:", node)
+        self.indent += 1
+        self.emit(node.step_node, ctx)
+        self.line(f"{t} = _interp.claim_counter({n}, {ctx}.symbol_table.symbols)", node)
+        self.indent -= 1
+        return t
+
+    def emit_incdec(self, node, ctx, is_post):
+        if not isinstance(node.node, VarAccessNode):
+            raise Unsupported("increment target")
+
+        step = 1 if node.op_tok.type == GL_PLUSPLUS else -1
+        t = self.temp()
+        self.line(
+            f"{t} = _incdec({ctx}, {node.node.var_name_tok.value!r}, {step}, "
+            f"{is_post}, {self.ref(node)})",
+            node,
+        )
+        return t
+
+    def emit_UnaryOpNode(self, node, ctx):
+        op_tok = node.op_tok
+        if op_tok.type in (GL_PLUSPLUS, GL_MINUSMINUS):
+            return self.emit_incdec(node, ctx, False)
+
+        value = self.emit(node.node, ctx)
+        n = self.ref(node)
+        t = self.temp()
+
+        if op_tok.type == GL_MINUS:
+            op_name = "multed_by"
+        elif op_tok.matches(GL_KEYWORD, "NOT"):
+            op_name = "notted"
+        elif op_tok.type == GL_BIT_NOT:
+            op_name = "bitted_not"
+        else:
+            self.line(f"{t} = {value}.copy()", node)
+            return t
+
+        self.line(f"{t} = _unary({value}, {op_name!r}, {n}, {ctx})", node)
+        return t
+
+    def emit_PostOpNode(self, node, ctx):
+        return self.emit_incdec(node, ctx, True)
+
+    def emit_TernaryOpNode(self, node, ctx):
+        t = self.temp()
+        condition = self.emit(node.condition_node, ctx)
+
+        self.line(f"if {condition}.is_true():", node)
+        self.indent += 1
+        self.line(f"{t} = {self.emit(node.true_case_node, ctx)}", node)
+        self.indent -= 1
+        self.line("else:", node)
+        self.indent += 1
+        self.line(f"{t} = {self.emit(node.false_case_node, ctx)}", node)
+        self.indent -= 1
+        return t
+
+    def emit_IfNode(self, node, ctx):
+        t = self.temp()
+        base_indent = self.indent
+
+        for condition_node, body_node in node.cases:
+            condition = self.emit(condition_node, ctx)
+            self.line(f"if {condition}.is_true():", node)
+            self.indent += 1
+            self.charge(body_node, ctx)
+            self.line(f"{t} = {self.emit(body_node, ctx)}", node)
+            self.indent -= 1
+            self.line("else:", node)
+            self.indent += 1
+
+        if node.else_case:
+            self.charge(node.else_case, ctx)
+            self.line(f"{t} = {self.emit(node.else_case, ctx)}", node)
+        else:
+            self.line(f"{t} = _Number.null.copy()", node)
+
+        self.indent = base_indent
+        return t
+
+    def emit_loop_body(self, node, body_node, loop_ctx, emit_header):
+        self.loop_depth += 1
+        self.indent += 1
+
+        self.charge(node, loop_ctx)
+        emit_header()
+        self.emit(body_node, loop_ctx)
+
+        self.indent -= 1
+        self.loop_depth -= 1
+
+    def emit_WhileNode(self, node, ctx):
+        loop_ctx = self.temp()
+        self.line(f"{loop_ctx} = _loop_context('WHILE', {ctx}, {self.ref(node)}, False)", node)
+        self.line("while True:", node)
+
+        def header():
+            condition = self.emit(node.condition_node, loop_ctx)
+            self.line(f"if not {condition}.is_true(): break", node)
+
+        self.emit_loop_body(node, node.body_node, loop_ctx, header)
+
+        t = self.temp()
+        self.line(f"{t} = _Number.null.copy()", node)
+        return t
+
+    def emit_CForNode(self, node, ctx):
+        loop_ctx = self.temp()
+        self.line(f"{loop_ctx} = _loop_context('C_FOR', {ctx}, {self.ref(node)}, True)", node)
+
+        if node.init_node:
+            self.emit(node.init_node, loop_ctx)
+
+        stepped = self.temp()
+        self.line(f"{stepped} = False", node)
+        self.line("while True:", node)
+
+        def header():
+            if node.step_node:
+                self.line(f"if {stepped}:", node)
+                self.indent += 1
+                self.emit(node.step_node, loop_ctx)
+                self.indent -= 1
+                self.line(f"{stepped} = True", node)
+
+            if node.condition_node:
+                condition = self.emit(node.condition_node, loop_ctx)
+                self.line(f"if not {condition}.is_true(): break", node)
+
+        self.emit_loop_body(node, node.body_node, loop_ctx, header)
+
+        t = self.temp()
+        self.line(f"{t} = _Number.null.copy()", node)
+        return t
+
+    def emit_ForNode(self, node, ctx):
+        iterable = self.emit(node.iterable_node, ctx)
+        iterator = self.temp()
+        self.line(
+            f"{iterator} = _iterate(_interp, {iterable}, "
+            f"{self.ref(node.iterable_node)}, {ctx})",
+            node,
+        )
+
+        loop_ctx = self.temp()
+        binder = self.temp()
+        element = self.temp()
+        self.line(f"{loop_ctx} = _loop_context('FOR', {ctx}, {self.ref(node)}, False)", node)
+        self.line(
+            f"{binder} = _interp.loop_binder({self.ref(node.var_name_toks)}, {loop_ctx})",
+            node,
+        )
+        self.line(f"for {element} in {iterator}:", node)
+
+        def header():
+            self.line(f"_bind({binder}, {element})", node)
+
+        self.emit_loop_body(node, node.body_node, loop_ctx, header)
+
+        t = self.temp()
+        self.line(f"{t} = _Number.null.copy()", node)
+        return t
+
+    def emit_BreakNode(self, node, ctx):
+        if not self.loop_depth:
+            raise Unsupported("BREAK outside loop")
+
+        self.line("break", node)
+        return "None"
+
+    def emit_ContinueNode(self, node, ctx):
+        if not self.loop_depth:
+            raise Unsupported("CONTINUE outside loop")
+
+        self.line("continue", node)
+        return "None"
+
+    def emit_ReturnNode(self, node, ctx):
+        to_return = node.node_to_return
+
+        if isinstance(to_return, CallNode):
+            self.line(f"if getattr({ctx}, '_tco_func', None) is not None:", node)
+            self.indent += 1
+            callee = self.emit(to_return.node_to_call, ctx)
+            args = [self.emit(arg_node, ctx) for arg_node in to_return.arg_nodes]
+            self.line(
+                f"return _RTResult().success_return(_TailCall({callee}, [{', '.join(args)}]))",
+                node,
+            )
+            self.indent -= 1
+
+        value = self.emit(to_return, ctx)
+        self.line(f"return _RTResult().success_return({value})", node)
+        return "None"
+
+    def emit_CallNode(self, node, ctx):
+        callee = self.emit(node.node_to_call, ctx)
+        value_to_call = self.temp()
+        self.line(
+            f"{value_to_call} = _prepare_call(_interp, {callee}, {self.ref(node)}, {ctx})",
+            node,
+        )
+
+        args = [self.emit(arg_node, ctx) for arg_node in node.arg_nodes]
+        t = self.temp()
+        self.line(
+            f"{t} = _call({value_to_call}, [{', '.join(args)}], _interp, "
+            f"{self.ref(node)}, {ctx})",
+            node,
+        )
+        return t
+
+    def emit_ListNode(self, node, ctx):
+        elements = [self.emit(element_node, ctx) for element_node in node.element_nodes]
+        t = self.temp()
+        self.line(f"{t} = _List(_settle_views([{', '.join(elements)}]))", node)
+        return t
+
+    def emit_GetAttrNode(self, node, ctx):
+        obj = self.emit(node.object_node, ctx)
+        t = self.temp()
+        self.line(f"{t} = _getattr(_interp, {obj}, {self.ref(node)}, {ctx})", node)
+        return t
+
+    def emit_ListAccessNode(self, node, ctx):
+        list_val = self.emit(node.list_node, ctx)
+        index_val = self.emit(node.index_node, ctx)
+        t = self.temp()
+        self.line(
+            f"{t} = _subscr({list_val}, {index_val}, {self.ref(node)}, {ctx})", node
+        )
+        return t
+
+    def emit_ListSetNode(self, node, ctx):
+        list_val = self.emit(node.list_node, ctx)
+        index_val = self.emit(node.index_node, ctx)
+        value = self.emit(node.value_node, ctx)
+        t = self.temp()
+        self.line(
+            f"{t} = _store_subscr({list_val}, {index_val}, {value}, {self.ref(node)}, {ctx})",
+            node,
+        )
+        return t
+
+    def emit_PrintNode(self, node, ctx):
+        values = [self.emit(print_node, ctx) for print_node in node.print_nodes]
+        t = self.temp()
+        self.line(f"{t} = _print([{', '.join(values)}], {bool(node.should_newline)})", node)
+        return t
+
+
+class TranspilingInterpreter(Interpreter):
+    def __init__(self, instruction_limit=None, budget=None, cache_stats=None):
+        super().__init__(
+            instruction_limit=instruction_limit, budget=budget, cache_stats=cache_stats
+        )
+        self.transpiler = Transpiler(self)
+        self.kernels = {}
+
+    def is_kernel_root(self, node, context):
+        if type(node) is CForNode:
+            return True
+
+        func = getattr(context, "_tco_func", None)
+        return func is not None and getattr(func, "body_node", None) is node
+
+    def visit(self, node, context):
+        if not self.is_kernel_root(node, context):
+            return super().visit(node, context)
+
+        kernel = self.kernels.get(node, False)
+        if kernel is False:
+            func = getattr(context, "_tco_func", None)
+            name = func.name if func is not None and type(node) is not CForNode else "C_FOR"
+            kernel = self.transpiler.transpile(node, name or "<anonymous>")
+            self.kernels[node] = kernel
+
+        if kernel is None:
+            return super().visit(node, context)
+
+        try:
+            return kernel.function(context)
+        except ErrorSignal as signal:
+            return RTResult().failure(signal.error)
+        except RecursionError as e:
+            failing_node = node
+            tb = e.__traceback__
+            while tb is not None:
+                if tb.tb_frame.f_code.co_filename == kernel.filename:
+                    failing_node = kernel.node_at_line(tb.tb_lineno) or failing_node
+
+                tb = tb.tb_next
+
+            return RTResult().failure(
+                RTError(
+                    failing_node.pos_start,
+                    failing_node.pos_end,
+                    "Expression too complex (maximum recursion depth exceeded)",
+                    context,
+                )
+            )
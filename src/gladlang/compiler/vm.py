@@ -0,0 +1,869 @@
+"""VM – stack machine that executes CodeObjects with the same semantics as the Interpreter.
+
+The VM is a drop-in replacement for the tree-walking Interpreter: it is
+passed to Function.execute() and friends as the ``interpreter`` argument, so
+function bodies are compiled on first call and cached per AST node.
+
+Subclasses that set ``heap_frames`` (FrameVM in compiler/frames.py) run calls
+to plain Functions inside the same execute() loop. The caller's registers
+are saved on a list, and a returning activation leaves its result on the
+stack and jumps past its last instruction.
+"""
+
+import sys
+from gladlang.core.errors import RTError
+from gladlang.core.util.final_helpers import is_final_anywhere
+from gladlang.runtime.rt_result import RTResult
+from gladlang.runtime.context import Context
+from gladlang.runtime.symbol_table import SymbolTable
+from gladlang.runtime.signals import ErrorSignal, fail
+from gladlang.values.primitives.number import Number
+from gladlang.values.primitives.string import String
+from gladlang.values.primitives.list import List, settle_views
+from gladlang.values.primitives.dict import Dict, stored_key
+from gladlang.values.nulls.tailcall import TailCall
+from gladlang.values.functions.function import Function
+from gladlang.values.functions.bound_method import BoundMethod
+from gladlang.interpreter.interpreter import Interpreter
+from gladlang.compiler.compiler import Compiler
+from gladlang.compiler.opcodes import (
+    OP_LOAD_NUMBER,
+    OP_LOAD_STRING,
+    OP_LOAD_NULL,
+    OP_LOAD_TRUE,
+    OP_LOAD_CONST,
+    OP_LOAD_NAME,
+    OP_STORE_NAME,
+    OP_POP_TOP,
+    OP_BINARY_OP,
+    OP_COMPARE_IS,
+    OP_INSTANCEOF,
+    OP_SHORT_AND,
+    OP_SHORT_OR,
+    OP_LOGIC_AND,
+    OP_LOGIC_OR,
+    OP_UNARY_NEG,
+    OP_UNARY_NOT,
+    OP_UNARY_BIT_NOT,
+    OP_UNARY_PLUS,
+    OP_INCDEC_NAME,
+    OP_JUMP,
+    OP_POP_JUMP_IF_FALSE,
+    OP_PREPARE_CALL,
+    OP_CALL,
+    OP_BUILD_LIST,
+    OP_GET_ATTR,
+    OP_SUBSCR,
+    OP_STORE_SUBSCR,
+    OP_PRINT,
+    OP_PUSH_SCOPE,
+    OP_POP_SCOPE,
+    OP_SETUP_LOOP,
+    OP_POP_BLOCK,
+    OP_BREAK_LOOP,
+    OP_CONTINUE_LOOP,
+    OP_GET_ITER,
+    OP_FOR_ITER,
+    OP_RETURN_VALUE,
+    OP_JUMP_IF_NO_TCO,
+    OP_RETURN_TAILCALL,
+    OP_EVAL_NODE,
+    OP_CHAIN_COMPARE,
+    OP_CHARGE,
+    OP_DICT_KEY,
+    OP_BUILD_DICT,
+    OP_SETUP_TRY,
+    OP_END_FINALLY,
+)
+
+_EXHAUSTED = object()
+
+BLOCK_LOOP = 0
+BLOCK_TRY = 1
+
+UNWIND_ERROR = 0
+UNWIND_RETURN = 1
+UNWIND_BREAK = 2
+UNWIND_CONTINUE = 3
+
+
+def signal_result(action, value):
+    if action == UNWIND_RETURN:
+        return RTResult().success_return(value)
+
+    if action == UNWIND_BREAK:
+        return RTResult().success_break()
+
+    return RTResult().success_continue()
+
+
+class VM(Interpreter):
+    heap_frames = False
+
+    def __init__(self, instruction_limit=None, budget=None, cache_stats=None):
+        super().__init__(
+            instruction_limit=instruction_limit, budget=budget, cache_stats=cache_stats
+        )
+        self.compiler = Compiler(metered=self.budget is not None)
+        self.code_cache = {}
+
+    def compile(self, node):
+        code = self.code_cache.get(node)
+        if code is None:
+            code = self.compiler.compile(node, type(node).__name__)
+            instructions = code.instructions
+            if len(instructions) == 1 and instructions[0][0] == OP_EVAL_NODE:
+                code = False
+
+            self.code_cache[node] = code
+
+        return code
+
+    def visit(self, node, context):
+        code = self.compile(node)
+        if code is False:
+            return Interpreter.visit(self, node, context)
+
+        return self.execute(code, context)
+
+    def unwind(self, blocks, stack, slots, action, payload):
+        while blocks:
+            block = blocks[-1]
+
+            if block[0] == BLOCK_LOOP:
+                if action == UNWIND_BREAK or action == UNWIND_CONTINUE:
+                    _, height, context, break_target, continue_target = block
+                    del stack[height:]
+
+                    if action == UNWIND_BREAK:
+                        return break_target, context
+
+                    return continue_target, context
+
+                blocks.pop()
+                continue
+
+            _, height, context, catch_target, finally_target, slot, node = blocks.pop()
+            del stack[height:]
+
+            if action == UNWIND_ERROR and catch_target is not None:
+                if finally_target is not None:
+                    blocks.append(
+                        (BLOCK_TRY, height, context, None, finally_target, slot, node)
+                    )
+
+                catch_context = Context("CATCH", context, node.pos_start)
+                catch_context.symbol_table = SymbolTable(context.symbol_table)
+
+                if node.catch_var_node:
+                    val_to_assign = getattr(payload, "thrown_value", None)
+                    if val_to_assign is None:
+                        val_to_assign = String(payload.details)
+
+                    catch_context.symbol_table.set(
+                        node.catch_var_node.value, val_to_assign
+                    )
+
+                return catch_target, catch_context
+
+            if finally_target is not None:
+                if payload is None:
+                    payload = Number.null.copy()
+
+                stack.append(Number.null.copy())
+                slots[slot] = (action, payload)
+                return finally_target, context
+
+        return None
+
+    def execute(self, code, context):
+        instructions = code.instructions
+        consts = code.constants
+        names = code.names
+        slots = [None] * code.num_slots
+        binop_dispatch = self._binop_dispatch
+
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        blocks = []
+
+        pc = 0
+        node = None
+
+        heap_frames = self.heap_frames
+        frames = []
+        activation = None
+
+        while True:
+            try:
+                while True:
+                    op, arg, node = instructions[pc]
+                    pc += 1
+
+                    if op == OP_LOAD_NAME:
+                        var_name = names[arg]
+                        if node.scope_kind == "global":
+                            value = context.symbol_table.get_global(var_name, node)
+                        else:
+                            value = context.symbol_table.get_resolved(
+                                var_name, node.scope_depth
+                            )
+
+                        if value is None:
+                            fail(
+                                RTError(
+                                    node.pos_start,
+                                    node.pos_end,
+                                    f"'{var_name}' is not defined",
+                                    context,
+                                )
+                            )
+
+                        push(value)
+
+                    elif op == OP_LOAD_CONST:
+                        push(consts[arg])
+
+                    elif op == OP_LOAD_NUMBER:
+                        push(Number(consts[arg]))
+
+                    elif op == OP_BINARY_OP:
+                        right = pop()
+                        left = pop()
+
+                        operation = binop_dispatch.get(arg)
+                        if operation is None:
+                            fail(
+                                RTError(
+                                    node.op_tok.pos_start,
+                                    node.op_tok.pos_end,
+                                    f"Unsupported operator '{arg}'",
+                                    context,
+                                )
+                            )
+
+                        result, error = operation(left, right)
+                        if error:
+                            error.pos_start = node.pos_start
+                            error.pos_end = node.pos_end
+                            error.context = context
+                            fail(error)
+
+                        push(result)
+
+                    elif op == OP_POP_JUMP_IF_FALSE:
+                        if not pop().is_true():
+                            pc = arg
+
+                    elif op == OP_JUMP:
+                        pc = arg
+
+                    elif op == OP_CHARGE:
+                        if self.budget.charge(node):
+                            fail(self.budget_error(node, context))
+
+                    elif op == OP_POP_TOP:
+                        pop()
+
+                    elif op == OP_STORE_NAME:
+                        name_index, is_declaration = arg
+                        var_name = names[name_index]
+                        value = stack[-1]
+
+                        if is_final_anywhere(context.symbol_table, var_name):
+                            fail(
+                                RTError(
+                                    node.var_name_tok.pos_start,
+                                    node.var_name_tok.pos_end,
+                                    f"Cannot reassign constant '{var_name}'",
+                                    context,
+                                )
+                            )
+
+                        if is_declaration:
+                            context.symbol_table.set(
+                                var_name, value, visibility="PUBLIC"
+                            )
+                        else:
+                            err = context.symbol_table.update_resolved(
+                                var_name, value, node.scope_depth
+                            )
+                            if err:
+                                fail(
+                                    RTError(node.pos_start, node.pos_end, err, context)
+                                )
+
+                    elif op == OP_INCDEC_NAME:
+                        var_name, is_increment, is_post = arg
+                        target_node = node.node
+
+                        if is_final_anywhere(context.symbol_table, var_name):
+                            fail(
+                                RTError(
+                                    target_node.pos_start,
+                                    target_node.pos_end,
+                                    f"Cannot increment/decrement constant '{var_name}'",
+                                    context,
+                                )
+                            )
+
+                        old_value = context.symbol_table.get_resolved(
+                            var_name, target_node.scope_depth
+                        )
+                        if old_value is None:
+                            fail(
+                                RTError(
+                                    target_node.pos_start,
+                                    target_node.pos_end,
+                                    f"'{var_name}' is not defined",
+                                    context,
+                                )
+                            )
+
+                        if not isinstance(old_value, Number):
+                            fail(
+                                RTError(
+                                    target_node.pos_start,
+                                    target_node.pos_end,
+                                    "Operand must be a number",
+                                    context,
+                                )
+                            )
+
+                        if is_increment:
+                            new_value, error = old_value.added_to(Number(1))
+                        else:
+                            new_value, error = old_value.subbed_by(Number(1))
+
+                        if error:
+                            fail(
+                                error.locate(node.pos_start, node.pos_end, context)
+                            )
+
+                        err = context.symbol_table.update_resolved(
+                            var_name, new_value, target_node.scope_depth
+                        )
+                        if err:
+                            fail(
+                                RTError(
+                                    target_node.pos_start,
+                                    target_node.pos_end,
+                                    err,
+                                    context,
+                                )
+                            )
+
+                        result = old_value if is_post else new_value
+                        push(result.copy())
+
+                    elif op == OP_PREPARE_CALL:
+                        stack[-1] = self.prepare_call(node, stack[-1], context)
+
+                    elif op == OP_CALL:
+                        if arg:
+                            args = stack[-arg:]
+                            del stack[-arg:]
+                        else:
+                            args = []
+
+                        value_to_call = pop()
+                        callee_type = type(value_to_call)
+                        if not heap_frames or not (
+                            callee_type is Function
+                            or callee_type is BoundMethod
+                            and type(value_to_call.function_to_bind) is Function
+                        ):
+                            call_res = value_to_call.execute(args, self, context)
+                            if call_res.error:
+                                fail(
+                                    call_res.error.locate(
+                                        node.pos_start, node.pos_end, context
+                                    )
+                                )
+
+                            push(call_res.value)
+                        else:
+                            activated, value, error = self.enter(
+                                value_to_call, value_to_call, args, context
+                            )
+                            if error:
+                                fail(error)
+
+                            if activated is None:
+                                push(value)
+                            else:
+                                frames.append(
+                                    (
+                                        instructions,
+                                        consts,
+                                        names,
+                                        slots,
+                                        stack,
+                                        blocks,
+                                        pc,
+                                        context,
+                                        activation,
+                                    )
+                                )
+                                activation = activated
+                                context = activation.context
+                                code = activation.code
+                                instructions = code.instructions
+                                consts = code.constants
+                                names = code.names
+                                slots = [None] * code.num_slots
+                                stack, blocks, pc = [], [], 0
+                                push, pop = stack.append, stack.pop
+
+                    elif op == OP_SUBSCR:
+                        index_val = pop()
+                        list_val = pop()
+
+                        element, error = list_val.get_element_at(index_val)
+                        if error:
+                            error.pos_start = node.pos_start
+                            error.pos_end = node.pos_end
+                            error.context = error.context or context
+                            fail(error)
+
+                        push(element)
+
+                    elif op == OP_LOAD_STRING:
+                        push(consts[arg])
+
+                    elif op == OP_LOAD_NULL:
+                        push(Number.null.copy())
+
+                    elif op == OP_LOAD_TRUE:
+                        push(Number.true_result)
+
+                    elif op == OP_SHORT_AND:
+                        if not stack[-1].is_true():
+                            stack[-1] = Number.false_result
+                            pc = arg
+
+                    elif op == OP_SHORT_OR:
+                        if stack[-1].is_true():
+                            stack[-1] = Number.true_result
+                            pc = arg
+
+                    elif op == OP_LOGIC_AND or op == OP_LOGIC_OR:
+                        right = pop()
+                        left = pop()
+
+                        if op == OP_LOGIC_AND:
+                            result, error = left.anded_by(right)
+                        else:
+                            result, error = left.ored_by(right)
+
+                        if error:
+                            fail(
+                                error.locate(node.pos_start, node.pos_end, context)
+                            )
+
+                        push(result)
+
+                    elif op == OP_CHAIN_COMPARE:
+                        compare_op, end = arg
+                        right = pop()
+                        left = pop()
+
+                        if compare_op == "IS":
+                            result, error = left.get_comparison_is(right)
+                        else:
+                            result, error = binop_dispatch[compare_op](left, right)
+
+                        if error:
+                            fail(
+                                error.locate(node.pos_start, node.pos_end, context)
+                            )
+
+                        if not result.is_true():
+                            push(Number.false_result)
+                            pc = end
+                        else:
+                            push(right)
+
+                    elif op == OP_COMPARE_IS or op == OP_INSTANCEOF:
+                        right = pop()
+                        left = pop()
+
+                        if op == OP_COMPARE_IS:
+                            result, error = left.get_comparison_is(right)
+                        else:
+                            result, error = left.get_comparison_instanceof(right)
+
+                        if error:
+                            fail(
+                                error.locate(node.pos_start, node.pos_end, context)
+                            )
+
+                        push(result)
+
+                    elif (
+                        op == OP_UNARY_NEG
+                        or op == OP_UNARY_NOT
+                        or op == OP_UNARY_BIT_NOT
+                        or op == OP_UNARY_PLUS
+                    ):
+                        number = pop().copy()
+                        error = None
+
+                        if op == OP_UNARY_NEG:
+                            if isinstance(number, Number):
+                                number, error = number.multed_by(Number(-1))
+                                if error:
+                                    error.pos_start = node.pos_start
+                                    error.pos_end = node.pos_end
+                                    error.context = context
+                            else:
+                                error = RTError(
+                                    node.pos_start,
+                                    node.pos_end,
+                                    "Unary '-' can only be applied to numbers",
+                                    context,
+                                )
+
+                        elif op == OP_UNARY_NOT or op == OP_UNARY_BIT_NOT:
+                            if op == OP_UNARY_NOT:
+                                number, error = number.notted()
+                            else:
+                                number, error = number.bitted_not()
+
+                            if error:
+                                error.pos_start = node.pos_start
+                                error.pos_end = node.pos_end
+                                error.context = context
+
+                        if error:
+                            fail(error)
+
+                        push(number)
+
+                    elif op == OP_DICT_KEY:
+                        hash_key = stored_key(stack[-2])
+                        if hash_key is None:
+                            fail(
+                                RTError(
+                                    node.pos_start,
+                                    node.pos_end,
+                                    "Dictionary key must be a Number, a String, or a List of those",
+                                    context,
+                                )
+                            )
+
+                        stack[-2] = hash_key
+
+                    elif op == OP_BUILD_DICT:
+                        elements = {}
+                        if arg:
+                            items = stack[-2 * arg :]
+                            del stack[-2 * arg :]
+
+                            for index in range(0, 2 * arg, 2):
+                                elements[items[index]] = items[index + 1]
+
+                        settle_views(elements.values())
+                        push(Dict(elements))
+
+                    elif op == OP_BUILD_LIST:
+                        if arg:
+                            elements = stack[-arg:]
+                            del stack[-arg:]
+                        else:
+                            elements = []
+
+                        push(List(settle_views(elements)))
+
+                    elif op == OP_GET_ATTR:
+                        obj = pop()
+
+                        value, error = self.get_attr_cached(node, obj, context)
+                        if error:
+                            fail(
+                                error.locate(node.pos_start, node.pos_end, context)
+                            )
+
+                        push(value)
+
+                    elif op == OP_STORE_SUBSCR:
+                        value_to_set = pop()
+                        index_val = pop()
+                        list_val = pop()
+
+                        new_value, error = list_val.set_element_at(
+                            index_val, value_to_set
+                        )
+                        if error:
+                            error.pos_start = node.pos_start
+                            error.pos_end = node.pos_end
+                            error.context = error.context or context
+                            fail(error)
+
+                        push(new_value)
+
+                    elif op == OP_PRINT:
+                        count, should_newline = arg
+                        values = stack[-count:]
+                        del stack[-count:]
+
+                        text = " ".join([str(value) for value in values])
+                        if should_newline:
+                            text += "\n"
+
+                        sys.stdout.write(text)
+                        if not should_newline:
+                            sys.stdout.flush()
+
+                        push(Number.null.copy())
+
+                    elif op == OP_PUSH_SCOPE:
+                        loop_context = Context(arg, context, node.pos_start)
+                        loop_context.symbol_table = SymbolTable(context.symbol_table)
+                        context = loop_context
+
+                    elif op == OP_POP_SCOPE:
+                        context = context.parent
+
+                    elif op == OP_SETUP_LOOP:
+                        break_target, continue_target = arg
+                        blocks.append(
+                            (
+                                BLOCK_LOOP,
+                                len(stack),
+                                context,
+                                break_target,
+                                continue_target,
+                            )
+                        )
+
+                    elif op == OP_SETUP_TRY:
+                        catch_target, finally_target, finally_slot = arg
+                        blocks.append(
+                            (
+                                BLOCK_TRY,
+                                len(stack),
+                                context,
+                                catch_target,
+                                finally_target,
+                                finally_slot,
+                                node,
+                            )
+                        )
+
+                        if finally_slot is not None:
+                            slots[finally_slot] = None
+
+                    elif op == OP_END_FINALLY:
+                        pending = slots[arg]
+                        if pending is not None:
+                            slots[arg] = None
+                            action, payload = pending
+                            if action == UNWIND_ERROR:
+                                fail(payload)
+
+                            target = self.unwind(blocks, stack, slots, action, payload)
+                            if target is not None:
+                                pc, context = target
+                            elif activation is not None:
+                                stack[:] = [payload]
+                                pc = len(instructions)
+                            else:
+                                return signal_result(action, payload)
+
+                    elif op == OP_POP_BLOCK:
+                        blocks.pop()
+
+                    elif op == OP_BREAK_LOOP or op == OP_CONTINUE_LOOP:
+                        if op == OP_BREAK_LOOP:
+                            action = UNWIND_BREAK
+                        else:
+                            action = UNWIND_CONTINUE
+
+                        target = self.unwind(blocks, stack, slots, action, None)
+                        if target is not None:
+                            pc, context = target
+                        elif activation is not None:
+                            stack[:] = [Number.null.copy()]
+                            pc = len(instructions)
+                        else:
+                            return signal_result(action, None)
+
+                    elif op == OP_GET_ITER:
+                        iterator, error = self.get_iterator(
+                            pop(), node.pos_start, node.pos_end, context
+                        )
+
+                        if error:
+                            fail(error)
+
+                        slots[arg] = (iter(iterator), None)
+
+                    elif op == OP_FOR_ITER:
+                        slot, var_name_toks, end = arg
+
+                        iterator, bind = slots[slot]
+                        element = next(iterator, _EXHAUSTED)
+                        if element is _EXHAUSTED:
+                            slots[slot] = None
+                            pc = end
+                            continue
+
+                        if bind is None:
+                            bind = self.loop_binder(var_name_toks, context)
+                            slots[slot] = (iterator, bind)
+
+                        error = bind(element)
+                        if error:
+                            fail(error)
+
+                    elif op == OP_RETURN_VALUE:
+                        value = pop()
+                        target = None
+                        if blocks:
+                            target = self.unwind(
+                                blocks, stack, slots, UNWIND_RETURN, value
+                            )
+
+                        if target is not None:
+                            pc, context = target
+                        elif activation is None:
+                            return RTResult().success_return(value)
+                        else:
+                            stack[:] = [value]
+                            pc = len(instructions)
+
+                    elif op == OP_JUMP_IF_NO_TCO:
+                        if getattr(context, "_tco_func", None) is None:
+                            pc = arg
+
+                    elif op == OP_RETURN_TAILCALL:
+                        if arg:
+                            args = stack[-arg:]
+                            del stack[-arg:]
+                        else:
+                            args = []
+
+                        value = TailCall(pop(), args)
+                        target = None
+                        if blocks:
+                            target = self.unwind(
+                                blocks, stack, slots, UNWIND_RETURN, value
+                            )
+
+                        if target is not None:
+                            pc, context = target
+                        elif activation is None:
+                            return RTResult().success_return(value)
+                        else:
+                            stack[:] = [value]
+                            pc = len(instructions)
+
+                    elif op == OP_EVAL_NODE:
+                        res = Interpreter.visit(self, consts[arg], context)
+                        if res.error:
+                            fail(res.error)
+
+                        if res.should_return or res.should_break or res.should_continue:
+                            if res.should_return:
+                                action, payload = UNWIND_RETURN, res.return_value
+                            else:
+                                if res.should_break:
+                                    action = UNWIND_BREAK
+                                else:
+                                    action = UNWIND_CONTINUE
+
+                                payload = res.value or Number.null.copy()
+
+                            target = self.unwind(blocks, stack, slots, action, payload)
+                            if target is not None:
+                                pc, context = target
+                            elif activation is not None:
+                                stack[:] = [payload]
+                                pc = len(instructions)
+                            else:
+                                return res
+
+                        else:
+                            push(res.value)
+
+                    while activation is not None and pc >= len(instructions):
+                        result = stack[-1] if stack else Number.null.copy()
+                        activation.finish()
+
+                        if type(result) is TailCall:
+                            activated, result, error = self.enter(
+                                activation.owner,
+                                result.function,
+                                result.args,
+                                activation.calling_context,
+                                activation,
+                            )
+                            if error:
+                                fail(error)
+
+                            if activated is not None:
+                                context = activation.context
+                                code = activation.code
+                                instructions = code.instructions
+                                consts = code.constants
+                                names = code.names
+                                slots = [None] * code.num_slots
+                                stack, blocks, pc = [], [], 0
+                                push, pop = stack.append, stack.pop
+                                break
+
+                        (
+                            instructions,
+                            consts,
+                            names,
+                            slots,
+                            stack,
+                            blocks,
+                            pc,
+                            context,
+                            activation,
+                        ) = frames.pop()
+                        push, pop = stack.append, stack.pop
+                        push(result)
+
+                    if pc >= len(instructions):
+                        break
+
+                break
+
+            except ErrorSignal as signal:
+                error = signal.error
+
+            except RecursionError:
+                error = RTError(
+                    node.pos_start if node is not None else None,
+                    node.pos_end if node is not None else None,
+                    "Expression too complex (maximum recursion depth exceeded)",
+                    context,
+                )
+
+            while True:
+                target = self.unwind(blocks, stack, slots, UNWIND_ERROR, error)
+                if target is not None:
+                    pc, context = target
+                    break
+
+                if activation is None:
+                    return RTResult().failure(error)
+
+                (
+                    instructions,
+                    consts,
+                    names,
+                    slots,
+                    stack,
+                    blocks,
+                    pc,
+                    context,
+                    activation,
+                ) = frames.pop()
+                push, pop = stack.append, stack.pop
+
+        return RTResult().success(stack[-1] if stack else Number.null.copy())
@@ -13,6 +13,16 @@ class RTError(Error):
         self.context = context
         self.thrown_value = thrown_value
 
+    def locate(self, pos_start, pos_end, context):
+        if self.pos_start is None:
+            self.pos_start = pos_start
+            self.pos_end = pos_end
+
+        if self.context is None:
+            self.context = context
+
+        return self
+
     def as_string(self):
         result = self.generate_traceback()
         result += f"{self.error_name}: {self.details}"
@@ -4,7 +4,7 @@ from .final_helpers import is_final_anywhere
 from .global_scope import get_fresh_global_scope
 from .memory import start_memory_watchdog, set_memory_limit
 from .source_detach import detach_value, detach_source_from_node
-from .runner import run
+from .runner import run, RunResult
 from .repl_helpers import strip_double_quoted, is_complete
 from .locking import _NoLock
 
@@ -16,6 +16,7 @@ __all__ = [
     "detach_value",
     "detach_source_from_node",
     "run",
+    "RunResult",
     "strip_double_quoted",
     "is_complete",
     "_NoLock",
@@ -1,13 +1,14 @@
 """Fresh global scope factory – initialises a new symbol table with built-in values."""
 
 
-def get_fresh_global_scope():
+def get_fresh_global_scope(thread_safe=True):
     from gladlang.runtime.symbol_table import SymbolTable
     from gladlang.values.primitives.number import Number
     from gladlang.values.functions.built_in_function import BuiltInFunction
     from gladlang.values.classes.type_ import Type
+    from gladlang.values.primitives.vector import VECTOR_BUILTINS
 
-    scope = SymbolTable()
+    scope = SymbolTable(locking=thread_safe)
 
     scope.set("NULL", Number.null.copy())
     scope.set("FALSE", Number.false.copy())
@@ -29,5 +30,9 @@ def get_fresh_global_scope():
 
     scope.set("LEN", BuiltInFunction("LEN"))
     scope.set("LENGTH", BuiltInFunction("LEN"))
+    scope.set("NUMARRAY", BuiltInFunction("NUMARRAY"))
+
+    for name in VECTOR_BUILTINS:
+        scope.set(name, BuiltInFunction(name))
 
     return scope
@@ -1,20 +1,117 @@
 """Interpreter runner – orchestrates lexing, parsing, and execution in one call."""
 
+ENGINES = ("tree", "vm", "frames", "closure", "transpile")
 
-def run(fn, text, context=None, instruction_limit=None):
+
+class RunResult(tuple):
+    """The ``(value, error)`` pair returned by run(), unpacking like a plain tuple.
+
+    ``instructions_used`` is the number of instructions the run consumed,
+    or None when it ran without a limit or budget.
+    """
+
+    def __new__(cls, value, error, budget=None):
+        result = super().__new__(cls, (value, error))
+        result.instructions_used = budget.consumed if budget is not None else None
+        return result
+
+    @property
+    def value(self):
+        return self[0]
+
+    @property
+    def error(self):
+        return self[1]
+
+
+def make_interpreter(
+    engine="tree",
+    instruction_limit=None,
+    budget=None,
+    cache_stats=None,
+    stack_memory=None,
+):
+    if engine == "tree":
+        from gladlang.interpreter.interpreter import Interpreter
+
+        return Interpreter(
+            instruction_limit=instruction_limit, budget=budget, cache_stats=cache_stats
+        )
+
+    if engine == "vm":
+        from gladlang.compiler.vm import VM
+
+        return VM(
+            instruction_limit=instruction_limit, budget=budget, cache_stats=cache_stats
+        )
+
+    if engine == "frames":
+        from gladlang.compiler.frames import FrameVM
+
+        return FrameVM(
+            instruction_limit=instruction_limit,
+            budget=budget,
+            cache_stats=cache_stats,
+            stack_memory=stack_memory,
+        )
+
+    if engine == "closure":
+        from gladlang.compiler.closures import ClosureInterpreter
+
+        return ClosureInterpreter(
+            instruction_limit=instruction_limit, budget=budget, cache_stats=cache_stats
+        )
+
+    if engine == "transpile":
+        from gladlang.compiler.transpiler import TranspilingInterpreter
+
+        return TranspilingInterpreter(
+            instruction_limit=instruction_limit, budget=budget, cache_stats=cache_stats
+        )
+
+    raise ValueError(
+        f"Unknown engine '{engine}' (expected one of: {', '.join(ENGINES)})"
+    )
+
+
+def run(
+    fn,
+    text,
+    context=None,
+    instruction_limit=None,
+    engine="tree",
+    budget=None,
+    instruction_batch=None,
+    optimize=1,
+    dump_ast=None,
+    cache_stats=None,
+    stack_memory=None,
+    thread_safe=True,
+):
     from gladlang.lexer.lexer import Lexer
     from gladlang.parser.parser import Parser
-    from gladlang.interpreter.interpreter import Interpreter
     from gladlang.runtime.context import Context
     from gladlang.core.errors import InvalidSyntaxError
     from gladlang.core.util.source_detach import detach_source_from_node
     from gladlang.core.util.global_scope import get_fresh_global_scope
+    from gladlang.compiler.resolver import resolve_scopes
+    from gladlang.compiler.literal_pool import pool_literals
+    from gladlang.compiler.escapes import mark_frame_locals
+    from gladlang.compiler.optimizer import optimize_tree, format_tree
+    from gladlang.runtime.budget import InstructionBudget, DEFAULT_BATCH
+
+    if budget is None and instruction_limit is not None:
+        budget = InstructionBudget(instruction_limit, instruction_batch or DEFAULT_BATCH)
+
+    interpreter = make_interpreter(
+        engine, budget=budget, cache_stats=cache_stats, stack_memory=stack_memory
+    )
 
     lexer = Lexer(fn, text)
 
     tokens, error = lexer.make_tokens()
     if error:
-        return None, error
+        return RunResult(None, error, budget)
 
     parser = Parser(tokens)
 
@@ -24,27 +121,42 @@ def run(fn, text, context=None, instruction_limit=None):
         first = tokens[0] if tokens else None
         last = tokens[-1] if tokens else first
 
-        return None, InvalidSyntaxError(
-            first.pos_start if first else None,
-            last.pos_end if last else None,
-            "Expression too complex (maximum recursion depth exceeded during parsing)",
+        return RunResult(
+            None,
+            InvalidSyntaxError(
+                first.pos_start if first else None,
+                last.pos_end if last else None,
+                "Expression too complex (maximum recursion depth exceeded during parsing)",
+            ),
+            budget,
         )
 
     if ast.error:
-        return None, ast.error
+        return RunResult(None, ast.error, budget)
 
     if ast.node:
         detach_source_from_node(ast.node)
+        ast.node = optimize_tree(ast.node, optimize, fresh_globals=context is None)
+        resolve_scopes(ast.node)
+        pool_literals(ast.node)
+        mark_frame_locals(ast.node)
 
-    interpreter = Interpreter(instruction_limit=instruction_limit)
+        if dump_ast is not None:
+            dump_ast.write(format_tree(ast.node))
 
     if context is None:
         context = Context("<program>")
-        context.symbol_table = get_fresh_global_scope()
+        context.symbol_table = get_fresh_global_scope(thread_safe)
+
+    if budget is not None and ast.node is not None and budget.charge(ast.node):
+        return RunResult(None, interpreter.budget_error(ast.node, context), budget)
 
-    result = interpreter.visit(ast.node, context)
+    try:
+        result = interpreter.visit(ast.node, context)
+    finally:
+        interpreter.release_caches()
 
     if result.should_return:
-        return result.return_value, result.error
+        return RunResult(result.return_value, result.error, budget)
 
-    return result.value, result.error
+    return RunResult(result.value, result.error, budget)
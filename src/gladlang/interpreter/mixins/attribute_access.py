@@ -1,8 +1,12 @@
-"""Visitors for attribute, list element, and instance creation."""
+"""Visitors for attribute (with its inline cache), list element, and instance creation."""
 
 from gladlang.core.errors import RTError
 from gladlang.runtime.rt_result import RTResult
 from gladlang.values.classes.class_ import Class
+from gladlang.values.classes.instance import Instance
+from gladlang.values.functions.function import Function
+from gladlang.values.functions.function_group import FunctionGroup
+from gladlang.values.functions.bound_method import BoundMethod
 
 
 class InterpreterAttributeAccess:
@@ -13,11 +17,78 @@ class InterpreterAttributeAccess:
         if res.error:
             return res
 
-        value, error = obj.get_attr(node.attr_name_tok, context)
+        value, error = self.get_attr_cached(node, obj, context)
         if error:
             return res.failure(error)
 
-        return res.success(value.set_pos(node.pos_start, node.pos_end))
+        return res.success(value)
+
+    def get_attr_cached(self, node, obj, context):
+        entry = node.attr_cache
+        if (
+            entry is not None
+            and type(obj) is Instance
+            and obj.class_ref is entry[0]
+            and context.active_class is entry[1]
+        ):
+            symbols = obj.symbol_table.symbols
+            for cls, epoch in entry[2]:
+                if cls.epoch != epoch:
+                    break
+            else:
+                for guard in entry[3]:
+                    if symbols.get(guard) is not None:
+                        break
+                else:
+                    self.cache_stats.attr_hits += 1
+                    method = entry[4]
+                    if type(method) is FunctionGroup:
+                        method = method.copy()
+
+                    return BoundMethod(method.name, method, obj), None
+
+        value, error = obj.get_attr(node.attr_name_tok, context)
+        if error or type(obj) is not Instance:
+            return value, error
+
+        if type(value) is not BoundMethod or value.instance is not obj:
+            return value, None
+
+        method = value.function_to_bind
+        if type(method) not in (Function, FunctionGroup) or method.is_static:
+            return value, None
+
+        active_class = context.active_class
+        if value.visibility != "PUBLIC" and (
+            active_class is None or method.defining_class not in active_class.mro
+        ):
+            return value, None
+
+        name = node.attr_name_tok.value
+        guards = [name]
+        if active_class is not None:
+            guards.append(f"_{active_class.name}__{name}")
+
+        guards.extend(f"_{cls.name}__{name}" for cls in obj.class_ref.mro)
+        guards = tuple(dict.fromkeys(guards))
+
+        symbols = obj.symbol_table.symbols
+        if any(symbols.get(guard) is not None for guard in guards):
+            return value, None
+
+        self.cache_stats.attr_misses += 1
+        if node.attr_cache is None:
+            self.cached_nodes.append((node, "attr_cache"))
+
+        node.attr_cache = (
+            obj.class_ref,
+            active_class,
+            tuple((cls, cls.epoch) for cls in obj.class_ref.mro),
+            guards,
+            method.copy(),
+        )
+
+        return value, None
 
     def visit_SetAttrNode(self, node, context):
         res = RTResult()
@@ -51,9 +122,10 @@ class InterpreterAttributeAccess:
         if error:
             error.pos_start = node.pos_start
             error.pos_end = node.pos_end
+            error.context = error.context or context
             return res.failure(error)
 
-        return res.success(element.set_pos(node.pos_start, node.pos_end))
+        return res.success(element)
 
     def visit_ListSetNode(self, node, context):
         res = RTResult()
@@ -74,6 +146,7 @@ class InterpreterAttributeAccess:
         if error:
             error.pos_start = node.pos_start
             error.pos_end = node.pos_end
+            error.context = error.context or context
             return res.failure(error)
 
         return res.success(new_value)
@@ -123,6 +196,4 @@ class InterpreterAttributeAccess:
         if res.error:
             return res
 
-        return res.success(
-            instance.set_pos(node.pos_start, node.pos_end).set_context(context)
-        )
+        return res.success(instance)
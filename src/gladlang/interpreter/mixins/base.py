@@ -22,13 +22,25 @@ from gladlang.core.constants import (
 )
 from gladlang.core.errors import RTError
 from gladlang.runtime.rt_result import RTResult
+from gladlang.runtime.budget import InstructionBudget
+from gladlang.runtime.inline_cache import CacheStats
+from gladlang.runtime.frame_pool import FramePool
+
+DEFAULT_MAX_DEPTH = 2000
 
 
 class InterpreterBase:
-    def __init__(self, instruction_limit=None):
+    def __init__(self, instruction_limit=None, budget=None, cache_stats=None):
         self.dispatch_cache = {}
+        self.cache_stats = cache_stats if cache_stats is not None else CacheStats()
+        self.cached_nodes = []
+        self.frame_pool = FramePool()
+        self.max_depth = DEFAULT_MAX_DEPTH
+
+        if budget is None and instruction_limit is not None:
+            budget = InstructionBudget(instruction_limit)
 
-        self.instruction_limit = instruction_limit
+        self.budget = budget
 
         self._binop_dispatch = {
             GL_PLUS: lambda l, r: l.added_to(r),
@@ -51,19 +63,28 @@ class InterpreterBase:
             GL_RSHIFT: lambda l, r: l.rshifted_by(r),
         }
 
-    def visit(self, node, context):
-        if self.instruction_limit is not None:
-            self.instruction_limit -= 1
-            if self.instruction_limit <= 0:
-                return RTResult().failure(
-                    RTError(
-                        node.pos_start,
-                        node.pos_end,
-                        "Instruction budget exceeded",
-                        context,
-                    )
-                )
+    @property
+    def instructions_used(self):
+        if self.budget is None:
+            return None
+
+        return self.budget.consumed
 
+    def release_caches(self):
+        for node, slot in self.cached_nodes:
+            setattr(node, slot, None)
+
+        self.cached_nodes.clear()
+
+    def budget_error(self, node, context):
+        return RTError(
+            node.pos_start,
+            node.pos_end,
+            "Instruction budget exceeded",
+            context,
+        )
+
+    def visit(self, node, context):
         node_type = type(node)
         method = self.dispatch_cache.get(node_type)
 
@@ -84,13 +105,8 @@ class InterpreterBase:
                 )
             )
 
-        if isinstance(result, RTResult) and (
-            result.should_return
-            or result.should_break
-            or result.should_continue
-            or result.error
-        ):
-            return result
+        if isinstance(result, RTResult) and result.error:
+            result.error.locate(node.pos_start, node.pos_end, context)
 
         return result
 
@@ -78,6 +78,7 @@ class InterpreterClasses:
                 return res
 
         static_table.parent = None
+        static_table.root = static_table
 
         methods = {}
         for method_node in node.method_nodes:
@@ -135,7 +136,7 @@ class InterpreterClasses:
                     )
 
         class_value.methods = methods
-        class_value._method_cache.clear()
+        class_value.invalidate()
 
         existing = context.symbol_table.get(class_name)
         if existing is not None and isinstance(existing, Class):
@@ -35,7 +35,7 @@ class InterpreterEnums:
                     current_val = int(val.value)
 
             else:
-                val = Number(current_val).set_context(context)
+                val = Number(current_val)
             elements_dict[case_name] = val
             if isinstance(val, Number):
                 current_val += 1
@@ -1,4 +1,4 @@
-"""Visitors for binary, unary, ternary, chained, call, and post‑operations."""
+"""Visitors for binary, unary, ternary, chained, call (with its inline cache), and post‑operations, plus the loop-optimizer nodes."""
 
 from gladlang.core.constants import (
     GL_KEYWORD,
@@ -18,6 +18,9 @@ from gladlang.core.util.final_helpers import is_final_anywhere
 from gladlang.runtime.rt_result import RTResult
 from gladlang.values.primitives.number import Number
 from gladlang.values.classes.class_ import Class
+from gladlang.values.functions.function import Function
+from gladlang.values.functions.function_group import FunctionGroup
+from gladlang.values.functions.built_in_function import BuiltInFunction
 from gladlang.parser.ast import (
     VarAccessNode,
     GetAttrNode,
@@ -35,11 +38,7 @@ class InterpreterExpressions:
 
         if node.op_tok.matches(GL_KEYWORD, "AND"):
             if not left.is_true():
-                return res.success(
-                    Number.false.copy()
-                    .set_pos(node.pos_start, node.pos_end)
-                    .set_context(context)
-                )
+                return res.success(Number.false_result)
 
             right = res.register(self.visit(node.right_node, context))
             if res.error:
@@ -49,15 +48,11 @@ class InterpreterExpressions:
             if error:
                 return res.failure(error)
 
-            return res.success(result.set_pos(node.pos_start, node.pos_end))
+            return res.success(result)
 
         elif node.op_tok.matches(GL_KEYWORD, "OR"):
             if left.is_true():
-                return res.success(
-                    Number.true.copy()
-                    .set_pos(node.pos_start, node.pos_end)
-                    .set_context(context)
-                )
+                return res.success(Number.true_result)
 
             right = res.register(self.visit(node.right_node, context))
             if res.error:
@@ -67,7 +62,7 @@ class InterpreterExpressions:
             if error:
                 return res.failure(error)
 
-            return res.success(result.set_pos(node.pos_start, node.pos_end))
+            return res.success(result)
 
         right = res.register(self.visit(node.right_node, context))
         if res.error:
@@ -78,14 +73,14 @@ class InterpreterExpressions:
             if error:
                 return res.failure(error)
 
-            return res.success(result.set_pos(node.pos_start, node.pos_end))
+            return res.success(result)
 
         elif node.op_tok.matches(GL_KEYWORD, "INSTANCEOF"):
             result, error = left.get_comparison_instanceof(right)
             if error:
                 return res.failure(error)
 
-            return res.success(result.set_pos(node.pos_start, node.pos_end))
+            return res.success(result)
 
         op = self._binop_dispatch.get(node.op_tok.type)
         if op is None:
@@ -106,7 +101,7 @@ class InterpreterExpressions:
 
             return res.failure(error)
 
-        return res.success(result.set_pos(node.pos_start, node.pos_end))
+        return res.success(result)
 
     def visit_UnaryOpNode(self, node, context):
         res = RTResult()
@@ -125,7 +120,9 @@ class InterpreterExpressions:
                         )
                     )
 
-                value = context.symbol_table.get(var_name)
+                value = context.symbol_table.get_resolved(
+                    var_name, target_node.scope_depth
+                )
                 if value is None:
                     return res.failure(
                         RTError(
@@ -156,6 +153,7 @@ class InterpreterExpressions:
 
                 value, error = list_val.get_element_at(index_val)
                 if error:
+                    error.context = error.context or context
                     return res.failure(error)
 
             else:
@@ -187,7 +185,9 @@ class InterpreterExpressions:
                 return res.failure(error)
 
             if isinstance(target_node, VarAccessNode):
-                err = context.symbol_table.update(var_name, new_value)
+                err = context.symbol_table.update_resolved(
+                    var_name, new_value, target_node.scope_depth
+                )
                 if err:
                     return res.failure(
                         RTError(
@@ -203,9 +203,10 @@ class InterpreterExpressions:
             elif isinstance(target_node, ListAccessNode):
                 _, error = list_val.set_element_at(index_val, new_value)
                 if error:
+                    error.context = error.context or context
                     return res.failure(error)
 
-            return res.success(new_value.copy().set_pos(node.pos_start, node.pos_end))
+            return res.success(new_value.copy())
 
         number = res.register(self.visit(node.node, context))
         if res.error:
@@ -246,7 +247,7 @@ class InterpreterExpressions:
         if error:
             return res.failure(error)
 
-        return res.success(number.set_pos(node.pos_start, node.pos_end))
+        return res.success(number)
 
     def visit_TernaryOpNode(self, node, context):
         res = RTResult()
@@ -265,6 +266,50 @@ class InterpreterExpressions:
 
         return res.success(result)
 
+    def visit_InvariantNode(self, node, context):
+        symbols = context.symbol_table.symbols
+        value = symbols.get(node.cache_key)
+        if value is not None:
+            return RTResult().success(value)
+
+        res = RTResult()
+        value = res.register(self.visit(node.expr_node, context))
+        if res.error:
+            return res
+
+        symbols[node.cache_key] = value
+        return res.success(value)
+
+    def bump_counter(self, node, symbols):
+        value = symbols.get(node.var_name)
+        if value is None or value is not node.owned or type(value.value) is not int:
+            return None
+
+        new_value = value.value + node.amount
+        if new_value.bit_length() > Number.MAX_INT_BITS:
+            return None
+
+        value.value = new_value
+        return value
+
+    def claim_counter(self, node, symbols):
+        value = symbols.get(node.var_name)
+        node.owned = value if type(value) is Number else None
+        return value
+
+    def visit_CounterStepNode(self, node, context):
+        symbols = context.symbol_table.symbols
+        value = self.bump_counter(node, symbols)
+        if value is not None:
+            return RTResult().success(value)
+
+        res = RTResult()
+        res.register(self.visit(node.step_node, context))
+        if res.error:
+            return res
+
+        return res.success(self.claim_counter(node, symbols))
+
     def visit_ChainedCompNode(self, node, context):
         res = RTResult()
 
@@ -299,11 +344,11 @@ class InterpreterExpressions:
                 return res.failure(error)
 
             if not result.is_true():
-                return res.success(Number.false.copy())
+                return res.success(Number.false_result)
 
             left_val = right_val
 
-        return res.success(Number.true.copy())
+        return res.success(Number.true_result)
 
     def visit_PostOpNode(self, node, context):
         res = RTResult()
@@ -321,7 +366,9 @@ class InterpreterExpressions:
                     )
                 )
 
-            old_value = context.symbol_table.get(var_name)
+            old_value = context.symbol_table.get_resolved(
+                var_name, target_node.scope_depth
+            )
             if old_value is None:
                 return res.failure(
                     RTError(
@@ -352,6 +399,7 @@ class InterpreterExpressions:
 
             old_value, error = list_val.get_element_at(index_val)
             if error:
+                error.context = error.context or context
                 return res.failure(error)
 
         else:
@@ -383,7 +431,9 @@ class InterpreterExpressions:
             return res.failure(error)
 
         if isinstance(target_node, VarAccessNode):
-            err = context.symbol_table.update(var_name, new_value)
+            err = context.symbol_table.update_resolved(
+                var_name, new_value, target_node.scope_depth
+            )
             if err:
                 return res.failure(
                     RTError(target_node.pos_start, target_node.pos_end, err, context)
@@ -397,9 +447,49 @@ class InterpreterExpressions:
         elif isinstance(target_node, ListAccessNode):
             _, error = list_val.set_element_at(index_val, new_value)
             if error:
+                error.context = error.context or context
                 return res.failure(error)
 
-        return res.success(old_value.copy().set_pos(node.pos_start, node.pos_end))
+        return res.success(old_value.copy())
+
+    def prepare_call(self, node, value_to_call, context):
+        value_to_call.set_pos(node.pos_start, node.pos_end)
+
+        entry = node.call_cache
+        if entry is not None and entry[0] is value_to_call:
+            self.cache_stats.call_hits += 1
+            target = entry[1]
+            if target is not value_to_call:
+                target.set_pos(node.pos_start, node.pos_end)
+
+            return target
+
+        callee_type = type(value_to_call)
+        target = None
+
+        if callee_type is Function and value_to_call.context is not None:
+            target = value_to_call
+        elif callee_type is BuiltInFunction and value_to_call.context is None:
+            target = value_to_call
+        elif callee_type is FunctionGroup and value_to_call.context is not None:
+            target = value_to_call.functions.get(len(node.arg_nodes))
+            if target is not None:
+                target.set_pos(node.pos_start, node.pos_end)
+
+        if target is None:
+            if value_to_call.context is None or isinstance(value_to_call, Class):
+                value_to_call = value_to_call.copy()
+                value_to_call.set_pos(node.pos_start, node.pos_end)
+                value_to_call.set_context(context)
+
+            return value_to_call
+
+        self.cache_stats.call_misses += 1
+        if node.call_cache is None:
+            self.cached_nodes.append((node, "call_cache"))
+
+        node.call_cache = (value_to_call, target)
+        return target
 
     def visit_CallNode(self, node, context):
         res = RTResult()
@@ -409,10 +499,7 @@ class InterpreterExpressions:
         if res.error:
             return res
 
-        value_to_call = value_to_call.set_pos(node.pos_start, node.pos_end)
-        if value_to_call.context is None or isinstance(value_to_call, Class):
-            value_to_call = value_to_call.copy()
-            value_to_call.set_context(context)
+        value_to_call = self.prepare_call(node, value_to_call, context)
 
         for arg_node in node.arg_nodes:
             args.append(res.register(self.visit(arg_node, context)))
@@ -4,26 +4,21 @@ from gladlang.core.errors import RTError
 from gladlang.runtime.rt_result import RTResult
 from gladlang.runtime.context import Context
 from gladlang.runtime.symbol_table import SymbolTable
-from gladlang.values.primitives.number import Number
-from gladlang.values.primitives.string import String
-from gladlang.values.primitives.list import List
-from gladlang.values.primitives.dict import Dict
+from gladlang.values.primitives.number import Number, shared_int
+from gladlang.values.primitives.list import List, settle_views
+from gladlang.values.primitives.dict import Dict, stored_key
 
 
 class InterpreterLiterals:
     def visit_NumberNode(self, node, context):
-        return RTResult().success(
-            Number(node.tok.value)
-            .set_context(context)
-            .set_pos(node.pos_start, node.pos_end)
-        )
+        shared = shared_int(node.tok.value)
+        if shared is not None:
+            return RTResult().success(shared)
+
+        return RTResult().success(Number(node.tok.value))
 
     def visit_StringNode(self, node, context):
-        return RTResult().success(
-            String(node.tok.value)
-            .set_context(context)
-            .set_pos(node.pos_start, node.pos_end)
-        )
+        return RTResult().success(node.value)
 
     def visit_ListNode(self, node, context):
         res = RTResult()
@@ -34,9 +29,7 @@ class InterpreterLiterals:
             if res.error:
                 return res
 
-        return res.success(
-            List(elements).set_context(context).set_pos(node.pos_start, node.pos_end)
-        )
+        return res.success(List(settle_views(elements)))
 
     def visit_DictNode(self, node, context):
         res = RTResult()
@@ -51,24 +44,25 @@ class InterpreterLiterals:
             if res.error:
                 return res
 
-            if isinstance(key, (Number, String)):
-                elements[key.value] = value
-            else:
+            hash_key = stored_key(key)
+            if hash_key is None:
                 return res.failure(
                     RTError(
                         key_node.pos_start,
                         key_node.pos_end,
-                        "Dictionary key must be a Number or String",
+                        "Dictionary key must be a Number, a String, or a List of those",
                         context,
                     )
                 )
 
-        return res.success(
-            Dict(elements).set_context(context).set_pos(node.pos_start, node.pos_end)
-        )
+            elements[hash_key] = value
+
+        settle_views(elements.values())
+        return res.success(Dict(elements))
 
     def visit_ListCompNode(self, node, context):
         res = RTResult()
+        budget = self.budget
 
         output_list = []
         comp_context = Context("LIST_COMPREHENSION", context, node.pos_start)
@@ -95,12 +89,15 @@ class InterpreterLiterals:
                 res.failure(error)
                 return
 
+            bind = self.loop_binder(var_toks, comp_context)
             for element in iterator:
-                for tok in var_toks:
-                    comp_context.symbol_table.remove(tok.value)
+                if budget is not None and budget.charge(node):
+                    res.failure(self.budget_error(node, comp_context))
+                    return
 
-                self.unpack_and_set(var_toks, element, comp_context, res)
-                if res.error:
+                error = bind(element)
+                if error:
+                    res.failure(error)
                     return
 
                 if cond_node:
@@ -119,12 +116,11 @@ class InterpreterLiterals:
         if res.error:
             return res
 
-        return res.success(
-            List(output_list).set_context(context).set_pos(node.pos_start, node.pos_end)
-        )
+        return res.success(List(settle_views(output_list)))
 
     def visit_DictCompNode(self, node, context):
         res = RTResult()
+        budget = self.budget
 
         output_dict = {}
         comp_context = Context("DICT_COMPREHENSION", context, node.pos_start)
@@ -140,17 +136,19 @@ class InterpreterLiterals:
                 if res.error:
                     return
 
-                if isinstance(key_val, (Number, String)):
-                    output_dict[key_val.value] = val_val
-                else:
+                hash_key = stored_key(key_val)
+                if hash_key is None:
                     res.failure(
                         RTError(
                             node.key_expr_node.pos_start,
                             node.key_expr_node.pos_end,
-                            "Dictionary key must be a Number or String",
+                            "Dictionary key must be a Number, a String, or a List of those",
                             comp_context,
                         )
                     )
+                    return
+
+                output_dict[hash_key] = val_val
                 return
 
             var_toks, iter_node, cond_node = node.iteration_specs[spec_index]
@@ -166,12 +164,15 @@ class InterpreterLiterals:
                 res.failure(error)
                 return
 
+            bind = self.loop_binder(var_toks, comp_context)
             for element in iterator:
-                for tok in var_toks:
-                    comp_context.symbol_table.remove(tok.value)
+                if budget is not None and budget.charge(node):
+                    res.failure(self.budget_error(node, comp_context))
+                    return
 
-                self.unpack_and_set(var_toks, element, comp_context, res)
-                if res.error:
+                error = bind(element)
+                if error:
+                    res.failure(error)
                     return
 
                 if cond_node:
@@ -190,6 +191,5 @@ class InterpreterLiterals:
         if res.error:
             return res
 
-        return res.success(
-            Dict(output_dict).set_context(context).set_pos(node.pos_start, node.pos_end)
-        )
+        settle_views(output_dict.values())
+        return res.success(Dict(output_dict))
@@ -51,25 +51,14 @@ class InterpreterSlices:
 
             end_idx = int(end_val.value)
 
-        if isinstance(obj, List):
-            new_elements = [e.copy() for e in obj.elements[start_idx:end_idx]]
-            return res.success(
-                List(new_elements)
-                .set_context(context)
-                .set_pos(node.pos_start, node.pos_end)
-            )
-        elif isinstance(obj, String):
-            return res.success(
-                String(obj.value[start_idx:end_idx])
-                .set_context(context)
-                .set_pos(node.pos_start, node.pos_end)
-            )
+        if isinstance(obj, (List, String)):
+            return res.success(obj.get_slice(start_idx, end_idx))
         else:
             return res.failure(
                 RTError(
                     node.pos_start,
                     node.pos_end,
-                    f"Type {type(obj).__name__} is not sliceable",
+                    f"Type {obj.type_name()} is not sliceable",
                     context,
                 )
             )
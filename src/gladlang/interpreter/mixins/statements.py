@@ -2,6 +2,7 @@
 
 import sys
 from gladlang.core.errors import RTError
+from gladlang.core.util.final_helpers import is_final_anywhere
 from gladlang.runtime.rt_result import RTResult
 from gladlang.runtime.context import Context
 from gladlang.runtime.symbol_table import SymbolTable
@@ -34,6 +35,7 @@ class InterpreterStatements:
 
     def visit_IfNode(self, node, context):
         res = RTResult()
+        budget = self.budget
 
         for condition, body in node.cases:
             condition_value = res.register(self.visit(condition, context))
@@ -41,6 +43,9 @@ class InterpreterStatements:
                 return res
 
             if condition_value.is_true():
+                if budget is not None and budget.charge(body):
+                    return res.failure(self.budget_error(body, context))
+
                 expr_value = res.register(self.visit(body, context))
                 if res.error:
                     return res
@@ -51,6 +56,9 @@ class InterpreterStatements:
                 return res.success(expr_value)
 
         if node.else_case:
+            if budget is not None and budget.charge(node.else_case):
+                return res.failure(self.budget_error(node.else_case, context))
+
             expr_value = res.register(self.visit(node.else_case, context))
             if res.error:
                 return res
@@ -62,94 +70,73 @@ class InterpreterStatements:
 
         return res.success(Number.null.copy())
 
-    def unpack_and_set(self, var_toks, element, context, res):
+    def loop_binder(self, var_toks, context):
+        table = context.symbol_table
+        symbols = table.symbols
+
+        blocked = None
+        for tok in var_toks:
+            if is_final_anywhere(table, tok.value):
+                blocked = RTError(
+                    tok.pos_start,
+                    tok.pos_end,
+                    f"Cannot use constant '{tok.value}' as loop variable",
+                    context,
+                )
+                break
+
         if len(var_toks) == 1:
             var_name = var_toks[0].value
-            curr_table = context.symbol_table
-            while curr_table:
-                if var_name in curr_table.finals:
-                    return res.failure(
-                        RTError(
-                            var_toks[0].pos_start,
-                            var_toks[0].pos_end,
-                            f"Cannot use constant '{var_name}' as loop variable",
-                            context,
-                        )
-                    )
 
-                curr_table = curr_table.parent
+            def bind(element):
+                if blocked is not None:
+                    return blocked
+
+                symbols[var_name] = element
+                return None
 
-            context.symbol_table.set(var_name, element)
+            return bind
 
-            return True
+        names = [tok.value for tok in var_toks]
+        count = len(names)
+        pos_start, pos_end = var_toks[0].pos_start, var_toks[-1].pos_end
 
-        if not isinstance(element, List):
-            return res.failure(
-                RTError(
-                    var_toks[0].pos_start,
-                    var_toks[-1].pos_end,
-                    f"Cannot unpack type '{type(element).__name__}' (expected List)",
+        def bind(element):
+            if not isinstance(element, List):
+                return RTError(
+                    pos_start,
+                    pos_end,
+                    f"Cannot unpack type '{element.type_name()}' (expected List)",
                     context,
                 )
-            )
 
-        if len(element.elements) != len(var_toks):
-            return res.failure(
-                RTError(
-                    var_toks[0].pos_start,
-                    var_toks[-1].pos_end,
-                    f"ValueError: expected {len(var_toks)} values to unpack, got {len(element.elements)}",
+            elements = element.elements
+            if len(elements) != count:
+                return RTError(
+                    pos_start,
+                    pos_end,
+                    f"ValueError: expected {count} values to unpack, got {len(elements)}",
                     context,
                 )
-            )
 
-        for i, tok in enumerate(var_toks):
-            var_name = tok.value
-            curr_table = context.symbol_table
-            while curr_table:
-                if var_name in curr_table.finals:
-                    return res.failure(
-                        RTError(
-                            tok.pos_start,
-                            tok.pos_end,
-                            f"Cannot use constant '{var_name}' as loop variable",
-                            context,
-                        )
-                    )
+            if blocked is not None:
+                return blocked
 
-                curr_table = curr_table.parent
+            symbols.update(zip(names, elements))
+            return None
 
-            context.symbol_table.set(var_name, element.elements[i])
-
-        return True
+        return bind
 
     def get_iterator(self, iterable_val, pos_start, pos_end, context):
-        if isinstance(iterable_val, List):
-            return iterable_val.elements[:], None
+        if isinstance(iterable_val, (List, Dict)):
+            return iterable_val.iterate(), None
         elif isinstance(iterable_val, String):
-
-            def string_iter(s, ctx, ps, pe):
-                for char in s:
-                    yield String(char).set_context(ctx).set_pos(ps, pe)
-
-            return string_iter(iterable_val.value, context, pos_start, pos_end), None
-        elif isinstance(iterable_val, Dict):
-            keys = []
-            for k in iterable_val.elements.keys():
-                if isinstance(k, (int, float)):
-                    keys.append(
-                        Number(k).set_context(context).set_pos(pos_start, pos_end)
-                    )
-                else:
-                    keys.append(
-                        String(k).set_context(context).set_pos(pos_start, pos_end)
-                    )
-            return keys, None
+            return map(String, iterable_val.chars()), None
 
         return None, RTError(
             pos_start,
             pos_end,
-            f"Type '{type(iterable_val).__name__}' is not iterable (Expected List, String, or Dict)",
+            f"Type '{iterable_val.type_name()}' is not iterable (Expected List, String, or Dict)",
             context,
         )
 
@@ -173,13 +160,16 @@ class InterpreterStatements:
         loop_context = Context("FOR", context, node.pos_start)
         loop_context.symbol_table = SymbolTable(context.symbol_table)
 
+        budget = self.budget
+        bind = self.loop_binder(node.var_name_toks, loop_context)
+
         for element in iterator:
-            for tok in node.var_name_toks:
-                loop_context.symbol_table.remove(tok.value)
+            if budget is not None and budget.charge(node):
+                return res.failure(self.budget_error(node, loop_context))
 
-            self.unpack_and_set(node.var_name_toks, element, loop_context, res)
-            if res.error:
-                return res
+            error = bind(element)
+            if error:
+                return res.failure(error)
 
             value = res.register(self.visit(node.body_node, loop_context))
             if res.error:
@@ -203,8 +193,12 @@ class InterpreterStatements:
 
         loop_context = Context("WHILE", context, node.pos_start)
         loop_context.symbol_table = SymbolTable(context.symbol_table)
+        budget = self.budget
 
         while True:
+            if budget is not None and budget.charge(node):
+                return res.failure(self.budget_error(node, loop_context))
+
             condition_value = res.register(
                 self.visit(node.condition_node, loop_context)
             )
@@ -244,7 +238,12 @@ class InterpreterStatements:
             if res.error:
                 return res
 
+        budget = self.budget
+
         while True:
+            if budget is not None and budget.charge(node):
+                return res.failure(self.budget_error(node, loop_context))
+
             if node.condition_node:
                 condition_value = res.register(
                     self.visit(node.condition_node, loop_context)
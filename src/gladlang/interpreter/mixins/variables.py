@@ -71,7 +71,11 @@ class InterpreterVariables:
                     )
                 )
 
-        value = context.symbol_table.get(var_name)
+        if node.scope_kind == "global":
+            value = context.symbol_table.get_global(var_name, node)
+        else:
+            value = context.symbol_table.get_resolved(var_name, node.scope_depth)
+
         if value is None:
             return res.failure(
                 RTError(
@@ -116,7 +120,9 @@ class InterpreterVariables:
         if node.is_declaration:
             context.symbol_table.set(var_name, value, visibility=visibility)
         else:
-            err = context.symbol_table.update(var_name, value)
+            err = context.symbol_table.update_resolved(
+                var_name, value, node.scope_depth
+            )
             if err:
                 return res.failure(RTError(node.pos_start, node.pos_end, err, context))
 
@@ -134,17 +140,18 @@ class InterpreterVariables:
                 RTError(
                     node.pos_start,
                     node.pos_end,
-                    f"Cannot unpack type '{type(list_val).__name__}' (expected List)",
+                    f"Cannot unpack type '{list_val.type_name()}' (expected List)",
                     context,
                 )
             )
 
-        if len(node.var_name_toks) != len(list_val.elements):
+        elements = list_val.elements
+        if len(node.var_name_toks) != len(elements):
             return res.failure(
                 RTError(
                     node.pos_start,
                     node.pos_end,
-                    f"ValueError: too many/not enough values to unpack (expected {len(node.var_name_toks)}, got {len(list_val.elements)})",
+                    f"ValueError: too many/not enough values to unpack (expected {len(node.var_name_toks)}, got {len(elements)})",
                     context,
                 )
             )
@@ -161,7 +168,7 @@ class InterpreterVariables:
                     )
                 )
 
-            context.symbol_table.set(var_name, list_val.elements[i])
+            context.symbol_table.set(var_name, elements[i])
         return res.success(list_val)
 
     def visit_FinalVarAssignNode(self, node, context):
@@ -1,4 +1,4 @@
-"""Expression nodes – literals, variables, operators, calls, and new instance."""
+"""Expression nodes – literals, variables, operators, calls, new instance, and cached loop invariants."""
 
 from .number_node import NumberNode
 from .string_node import StringNode
@@ -12,6 +12,7 @@ from .chained_comp_node import ChainedCompNode
 from .call_node import CallNode
 from .post_op_node import PostOpNode
 from .new_instance_node import NewInstanceNode
+from .invariant_node import InvariantNode
 
 __all__ = [
     "NumberNode",
@@ -26,4 +27,5 @@ __all__ = [
     "CallNode",
     "PostOpNode",
     "NewInstanceNode",
+    "InvariantNode",
 ]
@@ -5,6 +5,7 @@ class CallNode:
     def __init__(self, node_to_call, arg_nodes):
         self.node_to_call = node_to_call
         self.arg_nodes = arg_nodes
+        self.call_cache = None
         self.pos_start = self.node_to_call.pos_start
 
         if len(self.arg_nodes) > 0:
@@ -0,0 +1,12 @@
+"""InvariantNode – a loop-invariant expression evaluated once per loop entry and cached in the loop scope."""
+
+
+class InvariantNode:
+    def __init__(self, expr_node, cache_key):
+        self.expr_node = expr_node
+        self.cache_key = cache_key
+        self.pos_start = expr_node.pos_start
+        self.pos_end = expr_node.pos_end
+
+    def __repr__(self):
+        return f"(INVARIANT {self.expr_node})"
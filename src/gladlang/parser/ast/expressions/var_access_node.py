@@ -6,3 +6,6 @@ class VarAccessNode:
         self.var_name_tok = var_name_tok
         self.pos_start = self.var_name_tok.pos_start
         self.pos_end = self.var_name_tok.pos_end
+        self.scope_kind = None
+        self.scope_depth = None
+        self.global_cache = None
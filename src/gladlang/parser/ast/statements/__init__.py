@@ -14,6 +14,7 @@ from .switch_node import SwitchNode
 from .print_node import PrintNode
 from .multi_var_assign_node import MultiVarAssignNode
 from .var_assign_node import VarAssignNode
+from .counter_step_node import CounterStepNode
 
 __all__ = [
     "StatementListNode",
@@ -30,4 +31,5 @@ __all__ = [
     "PrintNode",
     "MultiVarAssignNode",
     "VarAssignNode",
+    "CounterStepNode",
 ]
@@ -0,0 +1,14 @@
+"""CounterStepNode – a C-style FOR step (i = i + n, i += n, i++) strength-reduced to an in-place integer counter."""
+
+
+class CounterStepNode:
+    def __init__(self, step_node, var_name, amount):
+        self.step_node = step_node
+        self.var_name = var_name
+        self.amount = amount
+        self.owned = None
+        self.pos_start = step_node.pos_start
+        self.pos_end = step_node.pos_end
+
+    def __repr__(self):
+        return f"(COUNTER {self.var_name} {self.amount:+d})"
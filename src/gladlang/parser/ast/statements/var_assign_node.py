@@ -8,3 +8,5 @@ class VarAssignNode:
         self.is_declaration = is_declaration
         self.pos_start = self.var_name_tok.pos_start
         self.pos_end = self.value_node.pos_end
+        self.scope_kind = None
+        self.scope_depth = None
@@ -1,7 +1,29 @@
-"""Runtime package – exposes Context, RTResult, and SymbolTable."""
+"""Runtime package – exposes Context, RTResult, SymbolTable, the call frame pool, the instruction budget, inline cache statistics, and the control-flow signals."""
 
 from .context import Context
 from .rt_result import RTResult
 from .symbol_table import SymbolTable
+from .frame_pool import FramePool
+from .budget import InstructionBudget
+from .inline_cache import CacheStats
+from .signals import (
+    ControlSignal,
+    ErrorSignal,
+    ReturnSignal,
+    BreakSignal,
+    ContinueSignal,
+)
 
-__all__ = ["Context", "RTResult", "SymbolTable"]
+__all__ = [
+    "Context",
+    "RTResult",
+    "SymbolTable",
+    "FramePool",
+    "InstructionBudget",
+    "CacheStats",
+    "ControlSignal",
+    "ErrorSignal",
+    "ReturnSignal",
+    "BreakSignal",
+    "ContinueSignal",
+]
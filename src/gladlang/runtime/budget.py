@@ -0,0 +1,107 @@
+"""Instruction budget – amortised metering at loop back-edges, function entries and IF branches.
+
+Instead of counting every node visit, the engines charge the budget once per
+loop iteration, once per function entry and once per IF branch taken. Each
+charge is weighted by the static size of the loop, function or branch body
+(its AST node count, not descending into nested loops, functions,
+comprehensions or IF branches, which meter themselves), so ``consumed``
+tracks the work actually done closely enough for billing. Charges are
+accumulated in ``pending`` and only compared with ``limit`` once at least
+``batch`` instructions have built up, so a script may overrun the limit by
+less than one batch before it is stopped. Once exhausted, every further
+charge fails, so a CATCH around the offending loop cannot keep it alive.
+
+No budget means no metering: interpreters keep ``budget = None`` and every
+charge site is a single ``is not None`` test.
+"""
+
+DEFAULT_BATCH = 1024
+
+BARRIER_NODES = (
+    "FunDefNode",
+    "ClassNode",
+    "WhileNode",
+    "CForNode",
+    "ForNode",
+    "ListCompNode",
+    "DictCompNode",
+)
+
+
+def node_weight(node):
+    weight = 0
+    stack = [node]
+
+    while stack:
+        val = stack.pop()
+        if isinstance(val, (list, tuple)):
+            stack.extend(val)
+            continue
+
+        if not type(val).__module__.startswith("gladlang.parser.ast"):
+            continue
+
+        weight += 1
+        if type(val).__name__ == "IfNode":
+            stack.extend(condition for condition, _ in val.cases)
+            continue
+
+        if val is not node and type(val).__name__ in BARRIER_NODES:
+            continue
+
+        try:
+            stack.extend(vars(val).values())
+        except TypeError:
+            pass
+
+    return max(weight, 1)
+
+
+class InstructionBudget:
+    __slots__ = ("limit", "batch", "used", "pending", "weights")
+
+    def __init__(self, limit=None, batch=DEFAULT_BATCH):
+        self.limit = limit
+        self.batch = max(1, int(batch))
+        self.used = 0
+        self.pending = 0
+        self.weights = {}
+
+    @property
+    def consumed(self):
+        return self.used + self.pending
+
+    @property
+    def remaining(self):
+        if self.limit is None:
+            return None
+
+        return max(self.limit - self.consumed, 0)
+
+    def weight(self, node):
+        weight = self.weights.get(node)
+        if weight is None:
+            weight = self.weights[node] = node_weight(node)
+
+        return weight
+
+    def charge(self, node):
+        weight = self.weights.get(node)
+        if weight is None:
+            weight = self.weight(node)
+
+        self.pending += weight
+        if self.pending < self.batch:
+            return False
+
+        return self.flush()
+
+    def flush(self):
+        self.used += self.pending
+        self.pending = 0
+
+        if self.limit is None or self.used <= self.limit:
+            return False
+
+        self.batch = 1
+        return True
@@ -0,0 +1,58 @@
+"""FramePool – recycles the SymbolTable of finished calls whose frame did not escape.
+
+Only calls to function bodies marked ``frame_local`` by the escape
+analysis in compiler/escapes.py use the pool. Those bodies never create a
+closure, class, enum or SUPER value, which are the only values that keep
+a call's table after it returns. release() trusts that analysis and
+takes the table back without checking for other references.
+
+Each call still gets a fresh Context. A Context can outlive its call in
+ways the analysis cannot see, e.g. as the ``parent`` of a callee's
+Context that a closure kept, and tracebacks walk that chain. Contexts
+are cheap to build, so only the table (four containers and a lock) is
+reused. Frames are never released on the error path.
+
+Each interpreter owns its pool, matching the one-interpreter-per-thread
+contract of unlocked symbol tables.
+"""
+
+from gladlang.runtime.context import Context
+from gladlang.runtime.symbol_table import SymbolTable
+
+
+class FramePool:
+    MAX_FREE = 64
+
+    __slots__ = ("free",)
+
+    def __init__(self):
+        self.free = []
+
+    def acquire(self, display_name, parent, parent_entry_pos, table_parent):
+        context = Context(display_name, parent, parent_entry_pos)
+
+        free = self.free
+        if free and free[-1].locking == table_parent.locking:
+            table = free.pop()
+            table.parent = table_parent
+            table.root = table_parent.root
+        else:
+            table = SymbolTable(table_parent)
+
+        context.symbol_table = table
+        return context
+
+    def release(self, context):
+        if len(self.free) >= self.MAX_FREE:
+            return
+
+        table = context.symbol_table
+        table.symbols.clear()
+        table.finals.clear()
+        table.visibilities.clear()
+        table.defining_classes.clear()
+        table._finals_count = 0
+        table.parent = None
+        table.root = table
+
+        self.free.append(table)
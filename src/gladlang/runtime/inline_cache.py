@@ -0,0 +1,58 @@
+"""Inline cache statistics – hit and miss counters for the per-node call and attribute caches.
+
+CallNode and GetAttrNode each keep a one-entry (monomorphic) cache filled by
+the interpreter. A call site caches the callee it last saw together with the
+concrete Function resolved for its arity. An attribute site caches the
+method an instance of a given class resolves to from a given active class,
+and it caches that only when the visibility decision follows from those two
+classes alone. Call entries are keyed on callee identity, so rebinding a
+name simply misses. Attribute entries also record the ``epoch`` of every
+class in the instance's MRO; Class.set_attr and class definitions bump
+the epoch of the class they change. A hit binds the cached method to the
+instance without copying it.
+
+The interpreter remembers which nodes it filled and clears them when the
+run ends (InterpreterBase.release_caches), so the AST does not keep callees
+and classes of a finished run alive.
+
+Sites that never see a cacheable callee (bound methods, classes) are not
+counted, so the rates describe the sites the caches can serve.
+"""
+
+
+class CacheStats:
+    __slots__ = ("call_hits", "call_misses", "attr_hits", "attr_misses")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.call_hits = 0
+        self.call_misses = 0
+        self.attr_hits = 0
+        self.attr_misses = 0
+
+    def hit_rate(self, kind):
+        hits = getattr(self, f"{kind}_hits")
+        total = hits + getattr(self, f"{kind}_misses")
+        if total == 0:
+            return None
+
+        return hits / total
+
+    def summary(self):
+        lines = []
+        for kind in ("call", "attr"):
+            hits = getattr(self, f"{kind}_hits")
+            misses = getattr(self, f"{kind}_misses")
+            rate = self.hit_rate(kind)
+            shown = "-" if rate is None else f"{rate:.1%}"
+            lines.append(f"{kind:<6}{hits:>10} hits {misses:>10} misses {shown:>8}")
+
+        return "\n".join(lines) + "\n"
+
+    def __repr__(self):
+        return (
+            f"<CacheStats call {self.call_hits}/{self.call_hits + self.call_misses}, "
+            f"attr {self.attr_hits}/{self.attr_hits + self.attr_misses}>"
+        )
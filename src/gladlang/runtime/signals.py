@@ -0,0 +1,87 @@
+"""Control-flow signals – exception protocol used by direct-value execution modes.
+
+The tree-walker wraps every value in an RTResult and tests its flags after
+each visit. Direct-value modes (the closure and transpile engines) return
+plain values instead and only pay for control flow when it happens: errors
+are raised as ``ErrorSignal`` carrying the RTError, and RETURN, BREAK and
+CONTINUE raise the preallocated ``RETURN`` / ``BREAK`` / ``CONTINUE``
+instances. ``raise_return`` stores the value (or TailCall) on ``RETURN``
+before raising it, so a handler must read ``signal.value`` before running
+any code that could RETURN again (TRY's FINALLY body, for one).
+
+``raise_result`` and ``result_from_signal`` translate at the boundary with
+code that still speaks RTResult (tree visitors, Function.execute, builtins).
+"""
+
+from .rt_result import RTResult
+
+
+class ControlSignal(Exception):
+    pass
+
+
+class ErrorSignal(ControlSignal):
+    def __init__(self, error):
+        self.error = error
+
+
+class ReturnSignal(ControlSignal):
+    def __init__(self, value):
+        self.value = value
+
+
+class BreakSignal(ControlSignal):
+    pass
+
+
+class ContinueSignal(ControlSignal):
+    pass
+
+
+RETURN = ReturnSignal(None)
+BREAK = BreakSignal()
+CONTINUE = ContinueSignal()
+
+
+def fail(error):
+    raise ErrorSignal(error)
+
+
+def raise_return(value):
+    RETURN.value = value
+    raise RETURN.with_traceback(None)
+
+
+def raise_break():
+    raise BREAK.with_traceback(None)
+
+
+def raise_continue():
+    raise CONTINUE.with_traceback(None)
+
+
+def raise_result(res):
+    if res.error:
+        raise ErrorSignal(res.error)
+
+    if res.should_continue:
+        raise_continue()
+
+    if res.should_break:
+        raise_break()
+
+    if res.should_return:
+        raise_return(res.return_value)
+
+
+def result_from_signal(signal):
+    if type(signal) is ErrorSignal:
+        return RTResult().failure(signal.error)
+
+    if type(signal) is ReturnSignal:
+        return RTResult().success_return(signal.value)
+
+    if type(signal) is BreakSignal:
+        return RTResult().success_break()
+
+    return RTResult().success_continue()
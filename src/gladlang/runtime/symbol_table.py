@@ -1,20 +1,69 @@
-"""SymbolTable – manages variable scopes, constants, visibility, and thread-safe access."""
+"""SymbolTable – manages variable scopes, constants, visibility, and thread-safe access.
+
+A table is either locked (the default) or unlocked. Locked tables take a
+per-table Lock around every access, and get / update take one per table
+they walk through. Unlocked tables are UnlockedSymbolTable instances,
+chosen once when the table is created, whose accessors work on the plain
+dicts and never enter a context manager.
+
+Single-threaded contract: an unlocked table and everything reachable from
+it (its ancestors, the values in it, the interpreter running it) must only
+be used by one thread at a time. To run programs on several threads, give
+each thread its own interpreter and global scope, e.g. one
+``run(..., thread_safe=False)`` call per thread, instead of sharing scopes.
+
+The mode is chosen per scope chain: ``SymbolTable(parent)`` builds a table
+of the same kind as ``parent``, so function, loop and block scopes follow
+the global scope. A table without a parent uses ``locking`` when given and
+_THREADING_ENABLED otherwise.
+
+Global access cache: every table knows the ``root`` of its chain. A
+VarAccessNode the resolver classified as global keeps a one-entry cache of
+(root, root.version, value), filled only when the value comes from the
+root itself. Before filling, get_global() adds the name to the root's
+``watched`` map. Rebinding a watched name (in the root, or by a shadowing
+definition in any table below it) bumps ``version``, which invalidates
+every cached entry of that root. The name is then marked volatile and is
+not cached again, so globals that a program keeps reassigning cost one
+invalidation instead of one per write. Builtins, functions and classes
+stay cached.
+"""
 
 from threading import Lock
 from gladlang.core.util.locking import _NoLock
 
+_NO_LOCK = _NoLock()
+
 
 class SymbolTable:
     _THREADING_ENABLED = True
 
-    def __init__(self, parent=None):
+    locking = True
+    version = 0
+    watched = None
+
+    def __new__(cls, parent=None, locking=None):
+        if cls is SymbolTable:
+            if locking is None:
+                if parent is not None:
+                    locking = parent.locking
+                else:
+                    locking = SymbolTable._THREADING_ENABLED
+
+            if not locking:
+                cls = UnlockedSymbolTable
+
+        return object.__new__(cls)
+
+    def __init__(self, parent=None, locking=None):
         self.symbols = {}
         self.parent = parent
         self.finals = set()
         self.visibilities = {}
         self.defining_classes = {}
-        self._lock = Lock() if SymbolTable._THREADING_ENABLED else _NoLock()
+        self._lock = Lock() if self.locking else _NO_LOCK
         self._finals_count = 0
+        self.root = self if parent is None else parent.root
 
     def set(
         self, name, value, visibility="PUBLIC", as_final=False, defining_class=None
@@ -34,6 +83,8 @@ class SymbolTable:
             if defining_class:
                 self.defining_classes[name] = defining_class
 
+        self.rebound(name)
+
     def is_final_in_ancestors(self, name):
         current = self.parent
         while current:
@@ -60,7 +111,8 @@ class SymbolTable:
                 self.finals.add(name)
                 self._finals_count += 1
 
-            return None
+        self.rebound(name)
+        return None
 
     def get(self, name):
         current = self
@@ -76,6 +128,74 @@ class SymbolTable:
 
         return None
 
+    def get_resolved(self, name, depth):
+        if depth is not None:
+            table = self
+            while depth and table is not None:
+                table = table.parent
+                depth -= 1
+
+            if table is not None:
+                value = table.symbols.get(name)
+                if value is not None:
+                    return value
+
+        return self.get(name)
+
+    def get_global(self, name, node):
+        root = self.root
+        cache = node.global_cache
+        if cache is not None and cache[0] is root and cache[1] == root.version:
+            return cache[2]
+
+        watched = root.watch(name)
+        version = root.version
+        value = self.get_resolved(name, node.scope_depth)
+        if watched and value is not None and root.symbols.get(name) is value:
+            node.global_cache = (root, version, value)
+
+        return value
+
+    def watch(self, name):
+        watched = self.watched
+        if watched is not None and watched.get(name) is False:
+            return False
+
+        with self._lock:
+            if self.watched is None:
+                self.watched = {}
+
+            return self.watched.setdefault(name, True)
+
+    def rebound(self, name):
+        root = self.root
+        watched = root.watched
+        if watched and watched.get(name):
+            with root._lock:
+                watched[name] = False
+                root.version += 1
+
+    def update_resolved(self, name, value, depth):
+        if depth is not None:
+            table = self
+            while depth and table is not None:
+                table = table.parent
+                depth -= 1
+
+            if table is not None:
+                with table._lock:
+                    found = name in table.symbols and name not in table.finals
+                    if found:
+                        table.symbols[name] = value
+
+                if found:
+                    if table.parent is None:
+                        table.rebound(name)
+
+                    return None
+
+        return self.update(name, value)
+
     def update(self, name, value):
         current = self
         while current is not None:
@@ -83,12 +203,18 @@ class SymbolTable:
                 if name in current.finals:
                     return f"Cannot reassign constant '{name}'"
 
-                if name in current.symbols:
+                found = name in current.symbols
+                if found:
                     current.symbols[name] = value
-                    return None
 
                 parent = current.parent
 
+            if found:
+                if parent is None:
+                    current.rebound(name)
+
+                return None
+
             current = parent
 
         return f"'{name}' is not defined"
@@ -103,13 +229,26 @@ class SymbolTable:
             self.visibilities.pop(name, None)
             self.defining_classes.pop(name, None)
 
+        self.rebound(name)
+
+    def retain(self, names):
+        with self._lock:
+            for name in [name for name in self.symbols if name not in names]:
+                del self.symbols[name]
+                if name in self.finals:
+                    self.finals.discard(name)
+                    self._finals_count -= 1
+
+                self.visibilities.pop(name, None)
+                self.defining_classes.pop(name, None)
+
     def get_visibility(self, name):
         with self._lock:
             return self.visibilities.get(name, "PUBLIC")
 
     def copy(self):
         with self._lock:
-            new_table = SymbolTable(self.parent)
+            new_table = SymbolTable(self.parent, locking=self.locking)
             new_table.symbols = self.symbols.copy()
             new_table.visibilities = self.visibilities.copy()
             new_table.finals = self.finals.copy()
@@ -117,3 +256,147 @@ class SymbolTable:
             new_table._finals_count = len(new_table.finals)
 
             return new_table
+
+
+class UnlockedSymbolTable(SymbolTable):
+    locking = False
+
+    def set(
+        self, name, value, visibility="PUBLIC", as_final=False, defining_class=None
+    ):
+        self.symbols[name] = value
+        if visibility != "PUBLIC":
+            self.visibilities[name] = visibility
+        elif self.visibilities:
+            self.visibilities.pop(name, None)
+
+        if as_final and name not in self.finals:
+            self.finals.add(name)
+            self._finals_count += 1
+
+        if defining_class:
+            self.defining_classes[name] = defining_class
+
+        self.rebound(name)
+
+    def is_final_in_ancestors(self, name):
+        current = self.parent
+        while current:
+            if name in current.finals:
+                return True
+
+            current = current.parent
+
+        return False
+
+    def set_if_absent(self, name, value, visibility="PUBLIC", as_final=False):
+        if name in self.symbols:
+            return f"Variable '{name}' is already defined"
+
+        if as_final and self.is_final_in_ancestors(name):
+            return f"Cannot declare constant '{name}' because it is already defined as constant in outer scope"
+
+        self.symbols[name] = value
+        if visibility != "PUBLIC":
+            self.visibilities[name] = visibility
+
+        if as_final:
+            self.finals.add(name)
+            self._finals_count += 1
+
+        self.rebound(name)
+        return None
+
+    def get(self, name):
+        current = self
+        while current is not None:
+            value = current.symbols.get(name)
+            if value is not None:
+                return value
+
+            current = current.parent
+
+        return None
+
+    def watch(self, name):
+        watched = self.watched
+        if watched is None:
+            watched = self.watched = {}
+
+        return watched.setdefault(name, True)
+
+    def rebound(self, name):
+        root = self.root
+        watched = root.watched
+        if watched and watched.get(name):
+            watched[name] = False
+            root.version += 1
+
+    def update_resolved(self, name, value, depth):
+        if depth is not None:
+            table = self
+            while depth and table is not None:
+                table = table.parent
+                depth -= 1
+
+            if table is not None:
+                if name in table.symbols and name not in table.finals:
+                    table.symbols[name] = value
+                    if table.parent is None:
+                        table.rebound(name)
+
+                    return None
+
+        return self.update(name, value)
+
+    def update(self, name, value):
+        current = self
+        while current is not None:
+            if name in current.finals:
+                return f"Cannot reassign constant '{name}'"
+
+            symbols = current.symbols
+            if name in symbols:
+                symbols[name] = value
+                if current.parent is None:
+                    current.rebound(name)
+
+                return None
+
+            current = current.parent
+
+        return f"'{name}' is not defined"
+
+    def remove(self, name):
+        self.symbols.pop(name, None)
+        if name in self.finals:
+            self.finals.discard(name)
+            self._finals_count = max(0, self._finals_count - 1)
+
+        self.visibilities.pop(name, None)
+        self.defining_classes.pop(name, None)
+        self.rebound(name)
+
+    def retain(self, names):
+        symbols = self.symbols
+        for name in [name for name in symbols if name not in names]:
+            del symbols[name]
+            if name in self.finals:
+                self.finals.discard(name)
+                self._finals_count -= 1
+
+            self.visibilities.pop(name, None)
+            self.defining_classes.pop(name, None)
+
+    def get_visibility(self, name):
+        return self.visibilities.get(name, "PUBLIC")
+
+    def copy(self):
+        new_table = UnlockedSymbolTable(self.parent)
+        new_table.symbols = self.symbols.copy()
+        new_table.visibilities = self.visibilities.copy()
+        new_table.finals = self.finals.copy()
+        new_table.defining_classes = self.defining_classes.copy()
+        new_table._finals_count = len(new_table.finals)
+
+        return new_table
@@ -1,9 +1,10 @@
 """Runtime value system – all GladLang data types and their operations."""
 
-from .primitives.number import Number
-from .primitives.string import String
-from .primitives.list import List
+from .primitives.number import Number, FrozenNumber
+from .primitives.string import String, StringView
+from .primitives.list import List, ListView
 from .primitives.dict import Dict
+from .primitives.num_array import NumArray
 from .nulls.frozen_null import FrozenNull
 from .nulls.mutable_null import MutableNull
 from .nulls.tailcall import TailCall
@@ -22,12 +23,19 @@ Number.false = FrozenNull(0, is_null=False)
 Number.true = FrozenNull(1, is_null=False)
 Number.null = FrozenNull(0, is_null=True)
 
+Number.false_result = FrozenNull(0, is_null=False)
+Number.true_result = FrozenNull(1, is_null=False)
+
 
 __all__ = [
     "Number",
+    "FrozenNumber",
     "String",
+    "StringView",
     "List",
+    "ListView",
     "Dict",
+    "NumArray",
     "FrozenNull",
     "MutableNull",
     "TailCall",
@@ -13,6 +13,8 @@ class Class(BaseFunction):
         "static_symbol_table",
         "mro",
         "_method_cache",
+        "_cache_epochs",
+        "epoch",
     )
 
     def __init__(self, name, superclasses, methods, static_symbol_table=None, mro=None):
@@ -24,6 +26,8 @@ class Class(BaseFunction):
         )
         self.mro = mro if mro else [self]
         self._method_cache = {}
+        self._cache_epochs = None
+        self.epoch = 0
 
     def instantiate(
         self,
@@ -109,7 +113,7 @@ class Class(BaseFunction):
             if err:
                 return None, RTError(name_tok.pos_start, name_tok.pos_end, err, context)
 
-            self._method_cache.clear()
+            self.invalidate()
 
             return value, None
         else:
@@ -120,9 +124,13 @@ class Class(BaseFunction):
                 as_final=as_final,
                 defining_class=self,
             )
-            self._method_cache.clear()
+            self.invalidate()
             return value, None
 
+    def invalidate(self):
+        self._method_cache.clear()
+        self.epoch += 1
+
     def get_attr(self, name_tok, context=None, allow_instance=False):
         method_name = name_tok.value
         active_class = (
@@ -131,6 +139,11 @@ class Class(BaseFunction):
 
         cache_key = (method_name, allow_instance)
 
+        epochs = tuple(cls.epoch for cls in self.mro)
+        if epochs != self._cache_epochs:
+            self._method_cache.clear()
+            self._cache_epochs = epochs
+
         if cache_key in self._method_cache:
             cached_value, cached_vis, cached_def, cached_kind = self._method_cache[
                 cache_key
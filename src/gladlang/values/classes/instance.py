@@ -8,23 +8,13 @@ from gladlang.values.value import Value
 
 
 class Instance(Value):
-    __slots__ = ("class_ref", "symbol_table", "pos_start", "pos_end", "context")
+    __slots__ = ("class_ref", "symbol_table")
 
     def __init__(self, class_ref):
         self.class_ref = class_ref
-        self.symbol_table = SymbolTable()
-        self.pos_start = None
-        self.pos_end = None
-        self.context = None
-
-    def set_pos(self, pos_start=None, pos_end=None):
-        self.pos_start = pos_start
-        self.pos_end = pos_end
-        return self
-
-    def set_context(self, context=None):
-        self.context = context
-        return self
+        self.symbol_table = SymbolTable(
+            locking=class_ref.static_symbol_table.locking
+        )
 
     def is_true(self):
         return True
@@ -252,18 +242,18 @@ class Instance(Value):
 
     def get_comparison_eq(self, other, visited=None):
         if isinstance(other, Instance):
-            return Number(1 if self is other else 0).set_context(self.context), None
+            return Number(1 if self is other else 0), None
 
         return None, self._illegal(other)
 
     def get_comparison_ne(self, other):
         if isinstance(other, Instance):
-            return Number(1 if self is not other else 0).set_context(self.context), None
+            return Number(1 if self is not other else 0), None
 
         return None, self._illegal(other)
 
     def get_comparison_is(self, other):
-        return Number(1 if self is other else 0).set_context(self.context), None
+        return Number(1 if self is other else 0), None
 
     def get_comparison_instanceof(self, other):
         from gladlang.values.classes.class_ import Class
@@ -271,9 +261,7 @@ class Instance(Value):
 
         if isinstance(other, Class):
             return (
-                Number(1 if other in self.class_ref.mro else 0).set_context(
-                    self.context
-                ),
+                Number(1 if other in self.class_ref.mro else 0),
                 None,
             )
 
@@ -292,17 +280,13 @@ class Instance(Value):
 
     def anded_by(self, other):
         return (
-            Number(1 if (self.is_true() and other.is_true()) else 0).set_context(
-                self.context
-            ),
+            Number(1 if (self.is_true() and other.is_true()) else 0),
             None,
         )
 
     def ored_by(self, other):
         return (
-            Number(1 if (self.is_true() or other.is_true()) else 0).set_context(
-                self.context
-            ),
+            Number(1 if (self.is_true() or other.is_true()) else 0),
             None,
         )
 
@@ -330,8 +314,6 @@ class Instance(Value):
                 ] = self.symbol_table.defining_classes[name]
 
         copy.symbol_table._finals_count = len(copy.symbol_table.finals)
-        copy.set_context(self.context)
-        copy.set_pos(self.pos_start, self.pos_end)
 
         return copy
 
@@ -188,7 +188,7 @@ class Super(Value):
         )
 
     def get_comparison_is(self, other):
-        return Number(1 if self is other else 0).set_context(self.context), None
+        return Number(1 if self is other else 0), None
 
     def _illegal(self, other=None):
         if not other:
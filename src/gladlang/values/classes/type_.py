@@ -34,11 +34,11 @@ class Type(Value):
         )
 
     def get_comparison_is(self, other):
-        return Number(1 if self is other else 0).set_context(self.context), None
+        return Number(1 if self is other else 0), None
 
     def get_comparison_eq(self, other, visited=None):
         if isinstance(other, Type):
-            return Number(1 if self is other else 0).set_context(self.context), None
+            return Number(1 if self is other else 0), None
 
         return None, self._illegal(other)
 
@@ -52,17 +52,13 @@ class Type(Value):
 
     def anded_by(self, other):
         return (
-            Number(1 if (self.is_true() and other.is_true()) else 0).set_context(
-                self.context
-            ),
+            Number(1 if (self.is_true() and other.is_true()) else 0),
             None,
         )
 
     def ored_by(self, other):
         return (
-            Number(1 if (self.is_true() or other.is_true()) else 0).set_context(
-                self.context
-            ),
+            Number(1 if (self.is_true() or other.is_true()) else 0),
             None,
         )
 
@@ -31,7 +31,7 @@ class Enum(Value):
         name = name_tok.value
         if name in self.elements_dict:
             val = self.elements_dict[name]
-            return val.copy().set_pos(name_tok.pos_start, name_tok.pos_end), None
+            return val.copy(), None
 
         return None, RTError(
             name_tok.pos_start,
@@ -50,18 +50,18 @@ class Enum(Value):
 
     def get_comparison_eq(self, other, visited=None):
         if isinstance(other, Enum):
-            return Number(1 if self is other else 0).set_context(self.context), None
+            return Number(1 if self is other else 0), None
 
         return None, self._illegal(other)
 
     def get_comparison_ne(self, other):
         if isinstance(other, Enum):
-            return Number(1 if self is not other else 0).set_context(self.context), None
+            return Number(1 if self is not other else 0), None
 
         return None, self._illegal(other)
 
     def get_comparison_is(self, other):
-        return Number(1 if self is other else 0).set_context(self.context), None
+        return Number(1 if self is other else 0), None
 
     def get_comparison_instanceof(self, other):
         from gladlang.values.classes.type_ import Type
@@ -88,17 +88,13 @@ class Enum(Value):
 
     def anded_by(self, other):
         return (
-            Number(1 if (self.is_true() and other.is_true()) else 0).set_context(
-                self.context
-            ),
+            Number(1 if (self.is_true() and other.is_true()) else 0),
             None,
         )
 
     def ored_by(self, other):
         return (
-            Number(1 if (self.is_true() or other.is_true()) else 0).set_context(
-                self.context
-            ),
+            Number(1 if (self.is_true() or other.is_true()) else 0),
             None,
         )
 
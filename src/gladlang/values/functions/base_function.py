@@ -25,9 +25,14 @@ class BaseFunction(Value):
         self.context = context
         return self
 
-    def generate_new_context(self, calling_context=None):
+    def generate_new_context(self, calling_context=None, pool=None):
         parent = calling_context if calling_context is not None else self.context
 
+        if pool is not None and self.context is not None:
+            return pool.acquire(
+                self.name, parent, self.pos_start, self.context.symbol_table
+            )
+
         new_context = Context(self.name, parent, self.pos_start)
 
         if self.context is None:
@@ -39,18 +44,18 @@ class BaseFunction(Value):
 
     def get_comparison_eq(self, other, visited=None):
         if isinstance(other, BaseFunction):
-            return Number(1 if self is other else 0).set_context(self.context), None
+            return Number(1 if self is other else 0), None
 
         return None, self.illegal_operation(other)
 
     def get_comparison_ne(self, other):
         if isinstance(other, BaseFunction):
-            return Number(1 if self is not other else 0).set_context(self.context), None
+            return Number(1 if self is not other else 0), None
 
         return None, self.illegal_operation(other)
 
     def get_comparison_is(self, other):
-        return Number(1 if self is other else 0).set_context(self.context), None
+        return Number(1 if self is other else 0), None
 
     def get_comparison_instanceof(self, other):
         from gladlang.values.classes.type_ import Type
@@ -77,11 +82,11 @@ class BaseFunction(Value):
 
     def anded_by(self, other):
         is_true = self.is_true() and other.is_true()
-        return Number(1 if is_true else 0).set_context(self.context), None
+        return Number(1 if is_true else 0), None
 
     def ored_by(self, other):
         is_true = self.is_true() or other.is_true()
-        return Number(1 if is_true else 0).set_context(self.context), None
+        return Number(1 if is_true else 0), None
 
     def check_args(self, arg_names, args, calling_context=None):
         res = RTResult()
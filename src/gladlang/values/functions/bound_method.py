@@ -77,8 +77,12 @@ class BoundMethod(BaseFunction):
             if not hasattr(current_func, "body_node"):
                 return current_func.execute(current_args, interpreter, calling_context)
 
+            pool = None
+            if getattr(current_func.body_node, "frame_local", False):
+                pool = getattr(interpreter, "frame_pool", None)
+
             new_context = current_func.generate_new_context(
-                calling_context if base_depth is None else None
+                calling_context if base_depth is None else None, pool
             )
 
             new_context.active_class = getattr(current_func, "defining_class", None)
@@ -101,7 +105,7 @@ class BoundMethod(BaseFunction):
                 base_depth = new_context.depth
                 new_context.parent_entry_pos = self.pos_start
 
-            if new_context.depth > 2000:
+            if new_context.depth > interpreter.max_depth:
                 self._call_count = 0
                 return res.failure(
                     RTError(
@@ -126,11 +130,25 @@ class BoundMethod(BaseFunction):
                 self._call_count = 0
                 return res
 
+            budget = getattr(interpreter, "budget", None)
+            if budget is not None and budget.charge(current_func.body_node):
+                self._call_count = 0
+                return res.failure(
+                    interpreter.budget_error(current_func.body_node, new_context)
+                )
+
             value_result = interpreter.visit(current_func.body_node, new_context)
             if value_result.error:
                 self._call_count = 0
                 return value_result
 
+            if pool is not None:
+                pool.release(new_context)
+            else:
+                captured = getattr(current_func.body_node, "captured_names", None)
+                if captured is not None:
+                    new_context.symbol_table.retain(captured)
+
             if value_result.should_return:
                 ret_val = value_result.return_value
 
@@ -8,7 +8,9 @@ from gladlang.values.functions.base_function import BaseFunction
 from gladlang.values.primitives.number import Number
 from gladlang.values.primitives.string import String
 from gladlang.values.primitives.list import List
+from gladlang.values.primitives.num_array import NumArray
 from gladlang.values.primitives.dict import Dict
+from gladlang.values.primitives.vector import VECTOR_BUILTINS
 
 
 class BuiltInFunction(BaseFunction):
@@ -83,7 +85,7 @@ class BuiltInFunction(BaseFunction):
                     RTError(
                         self.pos_start,
                         self.pos_end,
-                        f"Argument for INT must be a Number or String, got {type(arg).__name__}",
+                        f"Argument for INT must be a Number or String, got {arg.type_name()}",
                         ctx,
                     )
                 )
@@ -122,7 +124,7 @@ class BuiltInFunction(BaseFunction):
                     RTError(
                         self.pos_start,
                         self.pos_end,
-                        f"Argument for FLOAT must be a Number or String, got {type(arg).__name__}",
+                        f"Argument for FLOAT must be a Number or String, got {arg.type_name()}",
                         ctx,
                     )
                 )
@@ -169,9 +171,9 @@ class BuiltInFunction(BaseFunction):
 
             arg = args[0]
             if isinstance(arg, String):
-                return res.success(Number(len(arg.value)))
+                return res.success(Number(arg.length))
             elif isinstance(arg, List):
-                return res.success(Number(len(arg.elements)))
+                return res.success(Number(arg.size()))
             elif isinstance(arg, Dict):
                 return res.success(Number(len(arg.elements)))
             elif isinstance(arg, Number):
@@ -196,7 +198,7 @@ class BuiltInFunction(BaseFunction):
                         RTError(
                             self.pos_start,
                             self.pos_end,
-                            f"LEN is not defined for type '{type(arg).__name__}'",
+                            f"LEN is not defined for type '{arg.type_name()}'",
                             ctx,
                         )
                     )
@@ -205,11 +207,48 @@ class BuiltInFunction(BaseFunction):
                     RTError(
                         self.pos_start,
                         self.pos_end,
-                        f"LEN is not supported for type '{type(arg).__name__}'",
+                        f"LEN is not supported for type '{arg.type_name()}'",
                         ctx,
                     )
                 )
 
+        elif self.name == "NUMARRAY":
+            res.register(
+                self.check_args(["values"], args, calling_context=calling_context)
+            )
+            if res.error:
+                return res
+
+            arg = args[0]
+            num_array = NumArray.from_list(arg) if isinstance(arg, List) else None
+            if num_array is None:
+                return res.failure(
+                    RTError(
+                        self.pos_start,
+                        self.pos_end,
+                        "NUMARRAY expects a List of all-integer or all-float Numbers",
+                        ctx,
+                    )
+                )
+
+            return res.success(num_array)
+
+        elif self.name in VECTOR_BUILTINS:
+            arg_names, operation = VECTOR_BUILTINS[self.name]
+            res.register(
+                self.check_args(arg_names, args, calling_context=calling_context)
+            )
+            if res.error:
+                return res
+
+            result, message = operation(args)
+            if message:
+                return res.failure(
+                    RTError(self.pos_start, self.pos_end, message, ctx)
+                )
+
+            return res.success(result)
+
         return res.failure(
             RTError(
                 self.pos_start,
@@ -45,6 +45,7 @@ class Function(BaseFunction):
 
         from gladlang.values.nulls.tailcall import TailCall
         from gladlang.values.functions.bound_method import BoundMethod
+        from gladlang.values.functions.function_group import FunctionGroup
 
         current_func = self
         current_args = args
@@ -52,8 +53,6 @@ class Function(BaseFunction):
         final_result = None
 
         while True:
-            from gladlang.values.functions.function_group import FunctionGroup
-
             if isinstance(current_func, FunctionGroup):
                 arity = len(current_args)
                 if arity in current_func.functions:
@@ -68,42 +67,42 @@ class Function(BaseFunction):
                         )
                     )
 
-            if not hasattr(current_func, "body_node"):
+            if type(current_func) is not Function:
                 return current_func.execute(current_args, interpreter, calling_context)
 
+            pool = None
+            if getattr(current_func.body_node, "frame_local", False):
+                pool = getattr(interpreter, "frame_pool", None)
+
             new_context = current_func.generate_new_context(
-                calling_context if base_depth is None else None
+                calling_context if base_depth is None else None, pool
             )
 
-            new_context.active_class = getattr(current_func, "defining_class", None)
-            new_context.is_static = getattr(current_func, "is_static", False)
+            new_context.active_class = current_func.defining_class
+            new_context.is_static = current_func.is_static
 
-            if hasattr(current_func, "_call_count"):
-                current_func._call_count += 1
+            current_func._call_count += 1
 
-                if current_func._call_count > Function.MAX_TOTAL_RECURSION:
-                    self._call_count = 0
+            if current_func._call_count > Function.MAX_TOTAL_RECURSION:
+                self._call_count = 0
 
-                    if (
-                        hasattr(current_func, "_call_count")
-                        and current_func is not self
-                    ):
-                        current_func._call_count = 0
+                if current_func is not self:
+                    current_func._call_count = 0
 
-                    return res.failure(
-                        RTError(
-                            current_func.pos_start,
-                            current_func.pos_end,
-                            f"Total recursion calls exceeded limit ({Function.MAX_TOTAL_RECURSION})",
-                            new_context,
-                        )
+                return res.failure(
+                    RTError(
+                        current_func.pos_start,
+                        current_func.pos_end,
+                        f"Total recursion calls exceeded limit ({Function.MAX_TOTAL_RECURSION})",
+                        new_context,
                     )
+                )
 
             if base_depth is None:
                 base_depth = new_context.depth
                 new_context.parent_entry_pos = self.pos_start
 
-            if new_context.depth > 2000:
+            if new_context.depth > interpreter.max_depth:
                 self._call_count = 0
 
                 if current_func is not self:
@@ -122,7 +121,7 @@ class Function(BaseFunction):
 
             res.register(
                 current_func.check_and_populate_args(
-                    getattr(current_func, "arg_names", None), current_args, new_context
+                    current_func.arg_names, current_args, new_context
                 )
             )
 
@@ -134,6 +133,17 @@ class Function(BaseFunction):
 
                 return res
 
+            budget = getattr(interpreter, "budget", None)
+            if budget is not None and budget.charge(current_func.body_node):
+                self._call_count = 0
+
+                if current_func is not self:
+                    current_func._call_count = 0
+
+                return res.failure(
+                    interpreter.budget_error(current_func.body_node, new_context)
+                )
+
             value_result = interpreter.visit(current_func.body_node, new_context)
 
             if value_result.error:
@@ -144,6 +154,13 @@ class Function(BaseFunction):
 
                 return value_result
 
+            if pool is not None:
+                pool.release(new_context)
+            else:
+                captured = getattr(current_func.body_node, "captured_names", None)
+                if captured is not None:
+                    new_context.symbol_table.retain(captured)
+
             if value_result.should_return:
                 ret_val = value_result.return_value
                 if isinstance(ret_val, TailCall):
@@ -1,6 +1,6 @@
 """FrozenNull – immutable NULL, TRUE, FALSE singletons (can't be modified)."""
 
-from gladlang.values.primitives.number import Number
+from gladlang.values.primitives.number import Number, bool_number
 
 
 class FrozenNull(Number):
@@ -10,31 +10,22 @@ class FrozenNull(Number):
         super().__init__(value)
         self._is_null = is_null
 
-    def set_pos(self, pos_start=None, pos_end=None):
-        return self
-
-    def set_context(self, context=None):
-        return self
-
     def get_comparison_eq(self, other, visited=None):
         from gladlang.values.nulls.mutable_null import MutableNull
 
         if isinstance(other, (FrozenNull, MutableNull)):
             return (
-                Number(
-                    int(self._is_null == other._is_null and self.value == other.value)
-                ).set_context(self.context),
+                bool_number(
+                    self._is_null == other._is_null and self.value == other.value
+                ),
                 None,
             )
 
         if isinstance(other, Number):
             if self._is_null:
-                return Number(0).set_context(self.context), None
+                return bool_number(False), None
 
-            return (
-                Number(int(self.value == other.value)).set_context(self.context),
-                None,
-            )
+            return bool_number(self.value == other.value), None
 
         return super().get_comparison_eq(other, visited)
 
@@ -43,7 +34,7 @@ class FrozenNull(Number):
         if error:
             return None, error
 
-        return Number(1 - int(eq_result.is_true())).set_context(self.context), None
+        return bool_number(not eq_result.is_true()), None
 
     def copy(self):
         from gladlang.values.nulls.mutable_null import MutableNull
@@ -1,6 +1,6 @@
 """MutableNull – copy of FrozenNull that can be changed (used for variable assignment)."""
 
-from gladlang.values.primitives.number import Number
+from gladlang.values.primitives.number import Number, bool_number
 
 
 class MutableNull(Number):
@@ -15,20 +15,17 @@ class MutableNull(Number):
 
         if isinstance(other, (FrozenNull, MutableNull)):
             return (
-                Number(
-                    int(self._is_null == other._is_null and self.value == other.value)
-                ).set_context(self.context),
+                bool_number(
+                    self._is_null == other._is_null and self.value == other.value
+                ),
                 None,
             )
 
         if isinstance(other, Number):
             if self._is_null:
-                return Number(0).set_context(self.context), None
+                return bool_number(False), None
 
-            return (
-                Number(int(self.value == other.value)).set_context(self.context),
-                None,
-            )
+            return bool_number(self.value == other.value), None
 
         return super().get_comparison_eq(other, visited)
 
@@ -37,10 +34,7 @@ class MutableNull(Number):
         if error:
             return None, error
 
-        return Number(1 - int(eq_result.is_true())).set_context(self.context), None
+        return bool_number(not eq_result.is_true()), None
 
     def copy(self):
-        c = MutableNull(self.value, self._is_null)
-        c.set_pos(self.pos_start, self.pos_end)
-        c.set_context(self.context)
-        return c
+        return MutableNull(self.value, self._is_null)
@@ -1,8 +1,9 @@
-"""Primitive types – Number, String, List, Dict."""
+"""Primitive types – Number, String, List, Dict, NumArray."""
 
 from .number import Number
 from .string import String
 from .list import List
 from .dict import Dict
+from .num_array import NumArray
 
-__all__ = ["Number", "String", "List", "Dict"]
+__all__ = ["Number", "String", "List", "Dict", "NumArray"]
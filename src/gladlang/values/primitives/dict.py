@@ -1,29 +1,71 @@
-"""Dict – key-value store with size limit and deep copy semantics."""
+"""Dict – key-value store with size limit and deep copy semantics.
+
+Copies share storage the same way List copies do. A dict whose values are
+all immutable (see list.SHARED_ELEMENT_TYPES) is copied in O(1) and detaches
+on its first set_element_at. Merges reference immutable values instead of
+cloning them.
+
+Keys are stored as their Value.hash_key(): a Number's value, a String's
+str, and a tuple for a List of Numbers, Strings and such Lists.
+Keys are therefore hash-consistent with ``==``: 1, 1.0 and TRUE are the
+same key, as are 0, 0.0, -0.0, FALSE and NULL, and [x, y] can be used as a
+composite key without formatting a string. A List that contains itself has
+no hash_key and is rejected like any other invalid key. A List key is a
+snapshot, so changing the List afterwards does not affect the entry.
+Writes store String keys interned (stored_key), and string literals are
+interned by the literal pool, so a lookup with a literal usually matches
+by identity without comparing characters; lookups themselves never intern.
+key_value turns a stored key back into a Value for iteration and printing.
+
+iterate() walks the keys lazily in the same way List.iterate() walks
+elements: a write during the loop copies the keys not yet reached.
+"""
+
+import weakref
+from sys import intern
 
 from gladlang.core.errors import RTError
 from gladlang.values.primitives.number import Number
+from gladlang.values.primitives.string import String
+from gladlang.values.primitives.list import (
+    List,
+    StorageIterator,
+    SHARED_ELEMENT_TYPES,
+    VIEW_TYPES,
+)
 from gladlang.values.value import Value
 
+KEY_ERROR = "Key must be a Number, a String, or a List of those"
+
+
+def stored_key(value):
+    key = value.hash_key()
+    if type(key) is str:
+        return intern(key)
+
+    return key
+
+
+def key_value(key):
+    if type(key) is str:
+        return String(key)
+
+    if type(key) is tuple:
+        return List([key_value(k) for k in key])
+
+    return Number(key)
+
 
 class Dict(Value):
     MAX_DICT_SIZE = 1_000_000
 
-    __slots__ = ("elements", "pos_start", "pos_end", "context")
+    __slots__ = ("elements", "_shared", "_pure", "_views")
 
     def __init__(self, elements):
         self.elements = elements
-        self.pos_start = None
-        self.pos_end = None
-        self.context = None
-
-    def set_pos(self, pos_start=None, pos_end=None):
-        self.pos_start = pos_start
-        self.pos_end = pos_end
-        return self
-
-    def set_context(self, context=None):
-        self.context = context
-        return self
+        self._shared = False
+        self._pure = None
+        self._views = None
 
     def is_true(self):
         return len(self.elements) > 0
@@ -36,20 +78,42 @@ class Dict(Value):
         if self_id in _visited:
             return _visited[self_id]
 
-        new_dict = Dict({})
-        _visited[self_id] = new_dict
+        if self.is_pure():
+            new_dict = Dict(self.elements)
+            new_dict._pure = True
+            new_dict._shared = self._shared = True
+            _visited[self_id] = new_dict
+        else:
+            new_dict = Dict({})
+            _visited[self_id] = new_dict
+            new_dict.elements = self.copy_elements(_visited)
+
+        return new_dict
+
+    def is_pure(self):
+        pure = self._pure
+        if pure is None:
+            pure = self._pure = all(
+                type(v) in SHARED_ELEMENT_TYPES for v in self.elements.values()
+            )
+
+        return pure
 
-        from gladlang.values.primitives.list import List
+    def copy_elements(self, _visited):
+        if self.is_pure():
+            return dict(self.elements)
 
-        new_dict.elements = {
-            k: (v.copy(_visited) if isinstance(v, (List, Dict)) else v.copy())
+        return {
+            k: (
+                v
+                if type(v) in SHARED_ELEMENT_TYPES
+                else v.copy(_visited)
+                if isinstance(v, (List, Dict))
+                else v.copy()
+            )
             for k, v in self.elements.items()
         }
 
-        new_dict.set_pos(self.pos_start, self.pos_end)
-        new_dict.set_context(self.context)
-        return new_dict
-
     def added_to(self, other):
         if isinstance(other, Dict):
             new_len = len(self.elements) + len(other.elements)
@@ -61,59 +125,50 @@ class Dict(Value):
                     self.context,
                 )
 
-            from gladlang.values.primitives.list import List
-
             _visited = {}
 
-            def safe_copy(v):
-                if isinstance(v, (List, Dict)):
-                    return v.copy(_visited)
-
-                return v.copy()
-
-            merged = {k: safe_copy(v) for k, v in self.elements.items()}
-            merged.update({k: safe_copy(v) for k, v in other.elements.items()})
+            merged = self.copy_elements(_visited)
+            merged.update(other.copy_elements(_visited))
 
             new_dict = Dict(merged)
-            new_dict.set_context(self.context)
+            if self._pure and other._pure:
+                new_dict._pure = True
 
             return new_dict, None
         return None, self._illegal(other)
 
     def get_element_at(self, key):
-        from gladlang.values.primitives.string import String
-
-        if not isinstance(key, (Number, String)):
+        hash_key = key.hash_key()
+        if hash_key is None:
             return None, RTError(
                 self.pos_start,
                 self.pos_end,
-                "Key must be a Number or String",
+                KEY_ERROR,
                 self.context,
             )
 
-        val = self.elements.get(key.value)
+        val = self.elements.get(hash_key)
         if val is None:
             return None, RTError(
                 self.pos_start,
                 self.pos_end,
-                f"Key '{key.value}' not found",
+                f"Key '{key}' not found",
                 self.context,
             )
 
         return val, None
 
     def set_element_at(self, key, value):
-        from gladlang.values.primitives.string import String
-
-        if not isinstance(key, (Number, String)):
+        key = stored_key(key)
+        if key is None:
             return None, RTError(
                 self.pos_start,
                 self.pos_end,
-                "Key must be a Number or String",
+                KEY_ERROR,
                 self.context,
             )
 
-        if key.value not in self.elements and len(self.elements) >= Dict.MAX_DICT_SIZE:
+        if key not in self.elements and len(self.elements) >= Dict.MAX_DICT_SIZE:
             return None, RTError(
                 self.pos_start,
                 self.pos_end,
@@ -121,41 +176,70 @@ class Dict(Value):
                 self.context,
             )
 
-        self.elements[key.value] = value
+        if self._shared:
+            self.elements = dict(self.elements)
+            self._shared = False
+            self._views = None
+        elif self._views:
+            self.settle_tracked()
+
+        self.elements[key] = value
+        if type(value) in VIEW_TYPES:
+            value.materialize()
+
+        if self._pure and type(value) not in SHARED_ELEMENT_TYPES:
+            self._pure = False
+
         return value, None
 
+    def iterate(self):
+        return map(key_value, self.track(StorageIterator(self.elements)))
+
+    def track(self, view):
+        if self._views is None:
+            self._views = weakref.WeakSet()
+
+        self._views.add(view)
+        return view
+
+    def settle_tracked(self):
+        for view in self._views:
+            view.materialize()
+
+        self._views = None
+
     def get_comparison_eq(self, other, visited=None):
         if not isinstance(other, Dict):
             return None, self._illegal(other)
 
         if len(self.elements) != len(other.elements):
-            return Number(0).set_context(self.context), None
+            return Number(0), None
 
         if visited is None:
             visited = set()
 
         pair = (id(self), id(other))
         if pair in visited:
-            return Number(1).set_context(self.context), None
+            return Number(1), None
 
         visited.add(pair)
 
         try:
             for key, value in self.elements.items():
                 if key not in other.elements:
-                    return Number(0).set_context(self.context), None
+                    return Number(0), None
 
                 result, error = value.get_comparison_eq(other.elements[key], visited)
                 if error:
                     return None, error
 
                 if not result.is_true():
-                    return Number(0).set_context(self.context), None
+                    return Number(0), None
 
         finally:
             visited.remove(pair)
 
-        return Number(1).set_context(self.context), None
+        return Number(1), None
 
     def get_comparison_ne(self, other):
         if not isinstance(other, Dict):
@@ -165,12 +249,10 @@ class Dict(Value):
         if error:
             return None, error
 
-        return (Number(0) if result.is_true() else Number(1)).set_context(
-            self.context
-        ), None
+        return Number(0 if result.is_true() else 1), None
 
     def get_comparison_is(self, other):
-        return Number(1 if self is other else 0).set_context(self.context), None
+        return Number(1 if self is other else 0), None
 
     def get_comparison_instanceof(self, other):
         from gladlang.values.classes.type_ import Type
@@ -196,17 +278,13 @@ class Dict(Value):
 
     def anded_by(self, other):
         return (
-            Number(1 if (self.is_true() and other.is_true()) else 0).set_context(
-                self.context
-            ),
+            Number(1 if (self.is_true() and other.is_true()) else 0),
             None,
         )
 
     def ored_by(self, other):
         return (
-            Number(1 if (self.is_true() or other.is_true()) else 0).set_context(
-                self.context
-            ),
+            Number(1 if (self.is_true() or other.is_true()) else 0),
             None,
         )
 
@@ -237,8 +315,6 @@ class Dict(Value):
         return self.to_string([])
 
     def to_string(self, visited):
-        from gladlang.values.primitives.list import List
-
         if self in visited:
             return "{...}"
 
@@ -252,7 +328,8 @@ class Dict(Value):
                 else repr(value)
             )
 
-            kv_strings.append(f"{repr(key)}: {val_str}")
+            key_str = repr(key_value(key)) if type(key) is tuple else repr(key)
+            kv_strings.append(f"{key_str}: {val_str}")
 
         s = f"{{{', '.join(kv_strings)}}}"
         visited.pop()
@@ -1,36 +1,64 @@
-"""List – ordered collection with concatenation, repetition, indexing, and size limit."""
+"""List – ordered collection with concatenation, repetition, indexing, and size limit.
+
+copy() keeps deep-copy semantics but shares storage where it can. Numbers,
+Strings and frozen nulls are immutable, so copies reference them instead
+of cloning them. A list whose elements are all such values (``_pure``,
+computed on first copy and kept up to date by set_element_at) is copied in
+O(1). The copy shares the elements list and both sides are marked
+``_shared``. The first set_element_at on either side replaces its storage
+with a private copy before writing.
+
+Slicing a pure list returns a ListView once the window holds at least
+VIEW_MIN_SIZE elements. The view keeps a reference to the source's storage
+and an index range instead of copying the window. Indexing, LEN, iteration,
+printing and further slicing read straight from that range. Any other
+access to ``elements`` materialises the view into its own list, and so do
+mutation and being stored into a List or Dict (see settle_views). The
+source tracks its live views weakly and materialises them before its
+next in-place write.
+
+FOR loops and comprehensions iterate a List or Dict through iterate(),
+which walks the live storage with a StorageIterator instead of copying it
+up front. The iterator is tracked like a view. An in-place write during
+the loop first makes it copy the items it has not reached yet, so a loop
+always sees the collection as it was when the loop started, and the copy
+is only paid when the body actually writes. A loop that ends early with
+BREAK never copies anything.
+"""
+
+import weakref
+from itertools import islice
 
 from gladlang.core.errors import RTError
-from gladlang.values.primitives.number import Number
+from gladlang.values.primitives.number import Number, FrozenNumber
+from gladlang.values.primitives.string import String, StringView
+from gladlang.values.nulls.frozen_null import FrozenNull
 from gladlang.values.value import Value
 
 
 class List(Value):
     MAX_LIST_SIZE = 1_000_000
+    VIEW_MIN_SIZE = 64
 
-    __slots__ = ("elements", "pos_start", "pos_end", "context")
+    __slots__ = (
+        "elements",
+        "_shared",
+        "_pure",
+        "_views",
+    )
 
     def __init__(self, elements):
         self.elements = elements
-        self.pos_start = None
-        self.pos_end = None
-        self.context = None
-
-    def set_pos(self, pos_start=None, pos_end=None):
-        self.pos_start = pos_start
-        self.pos_end = pos_end
-        return self
-
-    def set_context(self, context=None):
-        self.context = context
-        return self
+        self._shared = False
+        self._pure = None
+        self._views = None
 
     def is_true(self):
         return len(self.elements) > 0
 
     def added_to(self, other):
         if isinstance(other, List):
-            new_len = len(self.elements) + len(other.elements)
+            new_len = self.size() + other.size()
             if new_len > List.MAX_LIST_SIZE:
                 return None, RTError(
                     other.pos_start,
@@ -39,10 +67,8 @@ class List(Value):
                     self.context,
                 )
 
-            new_list = List(self.elements + other.elements)
-            new_list.set_context(self.context)
+            return self.concatenated(other), None
 
-            return new_list, None
         return None, self._illegal(other)
 
     def multed_by(self, other):
@@ -65,7 +91,7 @@ class List(Value):
                     self.context,
                 )
 
-            result_len = len(self.elements) * multiplier
+            result_len = self.size() * multiplier
             if result_len > List.MAX_LIST_SIZE:
                 return None, RTError(
                     other.pos_start,
@@ -74,10 +100,8 @@ class List(Value):
                     self.context,
                 )
 
-            new_list = List(self.elements * multiplier)
-            new_list.set_context(self.context)
+            return self.repeated(multiplier), None
 
-            return new_list, None
         return None, self._illegal(other)
 
     def get_element_at(self, index):
@@ -108,8 +132,21 @@ class List(Value):
                 self.context,
             )
 
+        if self._shared:
+            self.elements = self.elements[:]
+            self._shared = False
+            self._views = None
+        elif self._views:
+            self.settle_tracked()
+
         try:
             self.elements[int(index.value)] = value
+            if type(value) in VIEW_TYPES:
+                value.materialize()
+
+            if self._pure and type(value) not in SHARED_ELEMENT_TYPES:
+                self._pure = False
+
             return value, None
         except IndexError:
             return None, RTError(
@@ -123,34 +160,36 @@ class List(Value):
         if not isinstance(other, List):
             return None, self._illegal(other)
 
-        if len(self.elements) != len(other.elements):
-            return Number(0).set_context(self.context), None
+        elements = self.elements
+        other_elements = other.elements
+        if len(elements) != len(other_elements):
+            return Number(0), None
 
         if visited is None:
             visited = set()
 
         pair = (id(self), id(other))
         if pair in visited:
-            return Number(1).set_context(self.context), None
+            return Number(1), None
 
         visited.add(pair)
 
         try:
-            for i in range(len(self.elements)):
-                result, error = self.elements[i].get_comparison_eq(
-                    other.elements[i], visited
+            for i in range(len(elements)):
+                result, error = elements[i].get_comparison_eq(
+                    other_elements[i], visited
                 )
 
                 if error:
                     return None, error
 
                 if not result.is_true():
-                    return Number(0).set_context(self.context), None
+                    return Number(0), None
 
         finally:
             visited.remove(pair)
 
-        return Number(1).set_context(self.context), None
+        return Number(1), None
 
     def get_comparison_ne(self, other):
         if not isinstance(other, List):
@@ -160,12 +199,10 @@ class List(Value):
         if error:
             return None, error
 
-        return (Number(0) if result.is_true() else Number(1)).set_context(
-            self.context
-        ), None
+        return Number(0 if result.is_true() else 1), None
 
     def get_comparison_is(self, other):
-        return Number(1 if self is other else 0).set_context(self.context), None
+        return Number(1 if self is other else 0), None
 
     def get_comparison_instanceof(self, other):
         from gladlang.values.classes.type_ import Type
@@ -192,17 +229,13 @@ class List(Value):
 
     def anded_by(self, other):
         return (
-            Number(1 if (self.is_true() and other.is_true()) else 0).set_context(
-                self.context
-            ),
+            Number(1 if (self.is_true() and other.is_true()) else 0),
             None,
         )
 
     def ored_by(self, other):
         return (
-            Number(1 if (self.is_true() or other.is_true()) else 0).set_context(
-                self.context
-            ),
+            Number(1 if (self.is_true() or other.is_true()) else 0),
             None,
         )
 
@@ -216,18 +249,110 @@ class List(Value):
         if self_id in _visited:
             return _visited[self_id]
 
-        new_list = List([])
-        _visited[self_id] = new_list
-
-        new_list.elements = [
-            e.copy(_visited) if isinstance(e, (List, Dict)) else e.copy()
-            for e in self.elements
-        ]
+        if self.is_pure():
+            new_list = List(self.elements)
+            new_list._pure = True
+            new_list._shared = self._shared = True
+            _visited[self_id] = new_list
+        else:
+            new_list = List([])
+            _visited[self_id] = new_list
+
+            shared = SHARED_ELEMENT_TYPES
+            new_list.elements = [
+                e
+                if type(e) in shared
+                else e.copy(_visited)
+                if isinstance(e, (List, Dict))
+                else e.copy()
+                for e in self.elements
+            ]
 
-        new_list.set_pos(self.pos_start, self.pos_end)
-        new_list.set_context(self.context)
         return new_list
 
+    def is_pure(self):
+        pure = self._pure
+        if pure is None:
+            shared = SHARED_ELEMENT_TYPES
+            pure = self._pure = all(type(e) in shared for e in self.elements)
+
+        return pure
+
+    def size(self):
+        return len(self.elements)
+
+    def concatenated(self, other):
+        return List(self.elements + other.elements)
+
+    def repeated(self, multiplier):
+        return List(self.elements * multiplier)
+
+    def snapshot(self):
+        return self.elements[:]
+
+    def raw_numbers(self):
+        elements = self.snapshot()
+        if not NUMBER_TYPES.issuperset(map(type, elements)):
+            return None
+
+        return [e.value for e in elements]
+
+    def hash_key(self, _visited=None):
+        raw = self.raw_numbers()
+        if raw is not None:
+            return tuple(raw)
+
+        if _visited is None:
+            _visited = set()
+
+        self_id = id(self)
+        if self_id in _visited:
+            return None
+
+        _visited.add(self_id)
+        keys = []
+        for element in self.snapshot():
+            if isinstance(element, List):
+                key = element.hash_key(_visited)
+            else:
+                key = element.hash_key()
+
+            if key is None:
+                return None
+
+            keys.append(key)
+
+        _visited.discard(self_id)
+        return tuple(keys)
+
+    def get_slice(self, start, end):
+        elements = self.elements
+        begin, stop, _ = slice(start, end).indices(len(elements))
+        if stop - begin >= List.VIEW_MIN_SIZE and self.is_pure():
+            return self.make_view(elements, begin, stop)
+
+        shared = SHARED_ELEMENT_TYPES
+        return List([e if type(e) in shared else e.copy() for e in elements[start:end]])
+
+    def make_view(self, base, start, stop):
+        return self.track(ListView(self, base, start, stop))
+
+    def iterate(self):
+        return self.track(StorageIterator(self.elements))
+
+    def track(self, view):
+        if self._views is None:
+            self._views = weakref.WeakSet()
+
+        self._views.add(view)
+        return view
+
+    def settle_tracked(self):
+        for view in self._views:
+            view.materialize()
+
+        self._views = None
+
     def execute(self, args, interpreter=None, calling_context=None):
         from gladlang.runtime.rt_result import RTResult
 
@@ -266,3 +391,150 @@ class List(Value):
 
         visited.pop()
         return s
+
+
+_ELEMENTS = List.elements
+
+
+class StorageIterator:
+    __slots__ = ("_iterator", "__weakref__")
+
+    def __init__(self, storage):
+        self._iterator = iter(storage)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._iterator)
+
+    def materialize(self):
+        self._iterator = iter(list(self._iterator))
+        return self
+
+
+class ListView(List):
+    __slots__ = ("_owner", "_base", "_start", "_stop", "__weakref__")
+
+    def __init__(self, owner, base, start, stop):
+        _ELEMENTS.__set__(self, None)
+        self._shared = False
+        self._pure = True
+        self._views = None
+        self._owner = owner
+        self._base = base
+        self._start = start
+        self._stop = stop
+
+    @property
+    def elements(self):
+        if self._base is not None:
+            self.materialize()
+
+        return _ELEMENTS.__get__(self, ListView)
+
+    @elements.setter
+    def elements(self, elements):
+        _ELEMENTS.__set__(self, elements)
+        self._owner = None
+        self._base = None
+
+    def materialize(self):
+        base = self._base
+        if base is not None:
+            self.elements = base[self._start : self._stop]
+
+        return self
+
+    def is_true(self):
+        if self._base is None:
+            return List.is_true(self)
+
+        return self._stop > self._start
+
+    def size(self):
+        if self._base is None:
+            return List.size(self)
+
+        return self._stop - self._start
+
+    def snapshot(self):
+        if self._base is None:
+            return List.snapshot(self)
+
+        return self._base[self._start : self._stop]
+
+    def iterate(self):
+        if self._base is None:
+            return List.iterate(self)
+
+        items = islice(self._base, self._start, self._stop)
+        return self._owner.track(StorageIterator(items))
+
+    def get_element_at(self, index):
+        base = self._base
+        if base is None or not isinstance(index, Number):
+            return List.get_element_at(self, index)
+
+        i = int(index.value)
+        length = self._stop - self._start
+        if -length <= i < length:
+            return base[self._start + i % length], None
+
+        return None, RTError(
+            self.pos_start,
+            self.pos_end,
+            f"List index {index.value} out of bounds",
+            self.context,
+        )
+
+    def get_slice(self, start, end):
+        base = self._base
+        if base is None:
+            return List.get_slice(self, start, end)
+
+        begin, stop, _ = slice(start, end).indices(self._stop - self._start)
+        begin += self._start
+        stop = max(begin, stop + self._start)
+        if stop - begin >= List.VIEW_MIN_SIZE:
+            return self._owner.make_view(base, begin, stop)
+
+        return List(base[begin:stop])
+
+    def copy(self, _visited=None):
+        if self._base is None:
+            return List.copy(self, _visited)
+
+        if _visited is not None and id(self) in _visited:
+            return _visited[id(self)]
+
+        new_view = self._owner.make_view(self._base, self._start, self._stop)
+        if _visited is not None:
+            _visited[id(self)] = new_view
+
+        return new_view
+
+    def type_name(self):
+        return "List"
+
+    def to_string(self, visited):
+        if self._base is None:
+            return List.to_string(self, visited)
+
+        items = islice(self._base, self._start, self._stop)
+        return f'[{", ".join([repr(x) for x in items])}]'
+
+
+SHARED_ELEMENT_TYPES = frozenset(
+    (Number, FrozenNumber, FrozenNull, String, StringView)
+)
+NUMBER_TYPES = frozenset((Number, FrozenNumber))
+VIEW_TYPES = frozenset((ListView, StringView))
+
+
+def settle_views(values):
+    for value in values:
+        if type(value) in VIEW_TYPES:
+            value.materialize()
+
+    return values
@@ -0,0 +1,206 @@
+"""NumArray – List of homogeneous ints or floats stored unboxed in an array.array buffer.
+
+NUMARRAY(list) builds one from a List whose elements are all integers that
+fit in 64 bits (typecode ``q``) or all floats (typecode ``d``). Each element
+costs 8 bytes instead of a Number object. Indexing, LEN, FOR iteration,
+slicing, ``+`` with another NumArray of the same kind and ``*`` stay
+unboxed and box a Number only for the element they return.
+
+Boxing uses one function per typecode (``BOXERS``), applied by ``map`` so a
+loop over the buffer has no per-element method dispatch. FOR iteration walks
+a copy of the buffer, which costs 8 bytes per element and keeps the
+snapshot semantics of List.iterate without tracking the loop. Everything
+else that reads ``elements`` (printing, comparison, unpacking, ``+`` with a
+plain List) gets a freshly boxed list. Storing a value the
+buffer cannot hold, such as a String or a float into an integer array,
+converts the NumArray into an ordinary boxed list first. NumArray is a List,
+so INSTANCEOF List and MAX_LIST_SIZE apply unchanged.
+"""
+
+from array import array
+
+from gladlang.core.errors import RTError
+from gladlang.values.primitives.number import Number, int_number
+from gladlang.values.primitives.list import List, NUMBER_TYPES
+
+ELEMENT_KINDS = {"q": int, "d": float}
+BOXERS = {"q": int_number, "d": Number}
+
+_ELEMENTS = List.elements
+
+
+class NumArray(List):
+    __slots__ = ("_data",)
+
+    def __init__(self, data):
+        _ELEMENTS.__set__(self, None)
+        self._shared = False
+        self._pure = True
+        self._views = None
+        self._data = data
+
+    @classmethod
+    def from_list(cls, list_val):
+        if type(list_val) is NumArray and list_val._data is not None:
+            return cls(list_val._data[:])
+
+        values = list_val.raw_numbers()
+        if values is None:
+            return None
+
+        return cls.from_values(values)
+
+    @classmethod
+    def from_values(cls, values):
+        kinds = set(map(type, values))
+        if kinds <= {int}:
+            try:
+                return cls(array("q", values))
+            except OverflowError:
+                return None
+
+        if kinds == {float}:
+            return cls(array("d", values))
+
+        return None
+
+    @property
+    def elements(self):
+        if self._data is not None:
+            return self.boxed()
+
+        return _ELEMENTS.__get__(self, NumArray)
+
+    @elements.setter
+    def elements(self, elements):
+        _ELEMENTS.__set__(self, elements)
+        self._data = None
+
+    def boxed(self):
+        data = self._data
+        return list(map(BOXERS[data.typecode], data))
+
+    def materialize(self):
+        if self._data is not None:
+            self.elements = self.boxed()
+
+        return self
+
+    def is_true(self):
+        if self._data is None:
+            return List.is_true(self)
+
+        return len(self._data) > 0
+
+    def size(self):
+        if self._data is None:
+            return List.size(self)
+
+        return len(self._data)
+
+    def snapshot(self):
+        data = self._data
+        if data is None:
+            return List.snapshot(self)
+
+        return map(BOXERS[data.typecode], data[:])
+
+    def raw_numbers(self):
+        if self._data is None:
+            return List.raw_numbers(self)
+
+        return self._data
+
+    def iterate(self):
+        if self._data is None:
+            return List.iterate(self)
+
+        data = self._data
+        return map(BOXERS[data.typecode], data[:])
+
+    def concatenated(self, other):
+        data = self._data
+        if (
+            data is not None
+            and type(other) is NumArray
+            and other._data is not None
+            and other._data.typecode == data.typecode
+        ):
+            return NumArray(data + other._data)
+
+        return List.concatenated(self, other)
+
+    def repeated(self, multiplier):
+        if self._data is None:
+            return List.repeated(self, multiplier)
+
+        return NumArray(self._data * multiplier)
+
+    def get_slice(self, start, end):
+        if self._data is None:
+            return List.get_slice(self, start, end)
+
+        return NumArray(self._data[start:end])
+
+    def get_element_at(self, index):
+        data = self._data
+        if data is None or not isinstance(index, Number):
+            return List.get_element_at(self, index)
+
+        try:
+            return BOXERS[data.typecode](data[int(index.value)]), None
+        except IndexError:
+            return None, RTError(
+                self.pos_start,
+                self.pos_end,
+                f"List index {index.value} out of bounds",
+                self.context,
+            )
+
+    def set_element_at(self, index, value):
+        data = self._data
+        if data is None or not isinstance(index, Number):
+            return List.set_element_at(self, index, value)
+
+        if (
+            type(value) in NUMBER_TYPES
+            and type(value.value) is ELEMENT_KINDS[data.typecode]
+        ):
+            if self._views:
+                self.settle_tracked()
+
+            try:
+                data[int(index.value)] = value.value
+                return value, None
+            except IndexError:
+                return None, RTError(
+                    self.pos_start,
+                    self.pos_end,
+                    f"List index {index.value} out of bounds",
+                    self.context,
+                )
+            except OverflowError:
+                pass
+
+        self.materialize()
+        return List.set_element_at(self, index, value)
+
+    def get_comparison_eq(self, other, visited=None):
+        data = self._data
+        if data is not None and type(other) is NumArray and other._data is not None:
+            return Number(int(data == other._data)), None
+
+        return List.get_comparison_eq(self, other, visited)
+
+    def copy(self, _visited=None):
+        if self._data is None:
+            return List.copy(self, _visited)
+
+        if _visited is not None and id(self) in _visited:
+            return _visited[id(self)]
+
+        new_array = NumArray(self._data[:])
+        if _visited is not None:
+            _visited[id(self)] = new_array
+
+        return new_array
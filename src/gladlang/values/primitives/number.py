@@ -1,42 +1,40 @@
-"""Number – numeric type (int/float) with arithmetic, bitwise, and comparison operations."""
+"""Number – numeric type (int/float) with arithmetic, bitwise, and comparison operations.
+
+Comparison, logic and integer results between SMALL_INT_MIN and
+SMALL_INT_MAX are shared FrozenNumber instances. Integer results of +, -,
+*, // and % go through int_result(), which skips the MAX_INT_BITS check
+inside the machine-word range, since they cannot come near it.
+
+Because of that sharing, ``IS`` on Numbers compares values instead of
+objects: two Numbers are the same when their values are equal and of the
+same kind (int or float), and NULL is only ever NULL. ``1 IS 1`` and
+``5000 IS 5000`` both hold, ``1 IS 1.0`` and ``NULL IS 0`` do not.
+"""
 
 import math
 from gladlang.core.errors import RTError
 from gladlang.values.value import Value
 
+SMALL_INT_MIN = -128
+SMALL_INT_MAX = 1024
+MACHINE_INT_MAX = (1 << 63) - 1
+
 
 class Number(Value):
     MAX_INT_BITS = 100_000
 
-    __slots__ = ("value", "pos_start", "pos_end", "context")
+    __slots__ = ("value",)
 
     def __init__(self, value):
         self.value = value
-        self.pos_start = None
-        self.pos_end = None
-        self.context = None
-
-    def set_pos(self, pos_start=None, pos_end=None):
-        self.pos_start = pos_start
-        self.pos_end = pos_end
-        return self
-
-    def set_context(self, context=None):
-        self.context = context
-        return self
 
     def added_to(self, other):
         if isinstance(other, Number):
             result = self.value + other.value
-            if isinstance(result, int) and result.bit_length() > Number.MAX_INT_BITS:
-                return None, RTError(
-                    other.pos_start,
-                    other.pos_end,
-                    "Arithmetic result too large (exceeds integer size limit)",
-                    self.context,
-                )
+            if type(result) is int:
+                return int_result(result, self, other)
 
-            if isinstance(result, float) and math.isinf(result):
+            if math.isinf(result):
                 return None, RTError(
                     other.pos_start,
                     other.pos_end,
@@ -44,27 +42,22 @@ class Number(Value):
                     self.context,
                 )
 
-            return Number(result).set_context(self.context), None
+            return Number(result), None
 
         from gladlang.values.primitives.string import String
 
         if isinstance(other, String):
-            return String(str(self.value) + other.value).set_context(self.context), None
+            return String(str(self.value) + other.value), None
 
         return None, self._illegal(other)
 
     def subbed_by(self, other):
         if isinstance(other, Number):
             result = self.value - other.value
-            if isinstance(result, int) and result.bit_length() > Number.MAX_INT_BITS:
-                return None, RTError(
-                    other.pos_start,
-                    other.pos_end,
-                    "Arithmetic result too large (exceeds integer size limit)",
-                    self.context,
-                )
+            if type(result) is int:
+                return int_result(result, self, other)
 
-            if isinstance(result, float) and math.isinf(result):
+            if math.isinf(result):
                 return None, RTError(
                     other.pos_start,
                     other.pos_end,
@@ -72,22 +65,17 @@ class Number(Value):
                     self.context,
                 )
 
-            return Number(result).set_context(self.context), None
+            return Number(result), None
 
         return None, self._illegal(other)
 
     def multed_by(self, other):
         if isinstance(other, Number):
             result = self.value * other.value
-            if isinstance(result, int) and result.bit_length() > Number.MAX_INT_BITS:
-                return None, RTError(
-                    other.pos_start,
-                    other.pos_end,
-                    "Arithmetic result too large (exceeds integer size limit)",
-                    self.context,
-                )
+            if type(result) is int:
+                return int_result(result, self, other)
 
-            if isinstance(result, float) and math.isinf(result):
+            if math.isinf(result):
                 return None, RTError(
                     other.pos_start,
                     other.pos_end,
@@ -95,7 +83,7 @@ class Number(Value):
                     self.context,
                 )
 
-            return Number(result).set_context(self.context), None
+            return Number(result), None
 
         return None, self._illegal(other)
 
@@ -124,7 +112,7 @@ class Number(Value):
                     self.context,
                 )
 
-            return Number(result).set_context(self.context), None
+            return Number(result), None
 
         return None, self._illegal(other)
 
@@ -136,15 +124,10 @@ class Number(Value):
                 )
 
             result = self.value % other.value
-            if isinstance(result, int) and result.bit_length() > Number.MAX_INT_BITS:
-                return None, RTError(
-                    other.pos_start,
-                    other.pos_end,
-                    "Arithmetic result too large (exceeds integer size limit)",
-                    self.context,
-                )
+            if type(result) is int:
+                return int_result(result, self, other)
 
-            return Number(result).set_context(self.context), None
+            return Number(result), None
 
         return None, self._illegal(other)
 
@@ -156,15 +139,10 @@ class Number(Value):
                 )
 
             result = self.value // other.value
-            if isinstance(result, int) and result.bit_length() > Number.MAX_INT_BITS:
-                return None, RTError(
-                    other.pos_start,
-                    other.pos_end,
-                    "Arithmetic result too large (exceeds integer size limit)",
-                    self.context,
-                )
+            if type(result) is int:
+                return int_result(result, self, other)
 
-            return Number(result).set_context(self.context), None
+            return Number(result), None
 
         return None, self._illegal(other)
 
@@ -219,75 +197,78 @@ class Number(Value):
                     self.context,
                 )
 
-            return Number(result).set_context(self.context), None
+            return Number(result), None
 
         return None, self._illegal(other)
 
     def get_comparison_is(self, other):
-        return Number(1 if self is other else 0).set_context(self.context), None
+        if self is other:
+            return _bools[True], None
+
+        if not isinstance(other, Number):
+            return _bools[False], None
+
+        value, other_value = self.value, other.value
+        return (
+            _bools[
+                type(value) is type(other_value)
+                and value == other_value
+                and getattr(self, "_is_null", False)
+                == getattr(other, "_is_null", False)
+            ],
+            None,
+        )
 
     def get_comparison_eq(self, other, visited=None):
         if isinstance(other, Number):
-            return (
-                Number(int(self.value == other.value)).set_context(self.context),
-                None,
-            )
+            return _bools[self.value == other.value], None
 
         return None, self._illegal(other)
 
     def get_comparison_ne(self, other):
         if isinstance(other, Number):
-            return (
-                Number(int(self.value != other.value)).set_context(self.context),
-                None,
-            )
+            return _bools[self.value != other.value], None
 
         return None, self._illegal(other)
 
     def get_comparison_lt(self, other):
         if isinstance(other, Number):
-            return Number(int(self.value < other.value)).set_context(self.context), None
+            return _bools[self.value < other.value], None
 
         return None, self._illegal(other)
 
     def get_comparison_gt(self, other):
         if isinstance(other, Number):
-            return Number(int(self.value > other.value)).set_context(self.context), None
+            return _bools[self.value > other.value], None
 
         return None, self._illegal(other)
 
     def get_comparison_lte(self, other):
         if isinstance(other, Number):
-            return (
-                Number(int(self.value <= other.value)).set_context(self.context),
-                None,
-            )
+            return _bools[self.value <= other.value], None
 
         return None, self._illegal(other)
 
     def get_comparison_gte(self, other):
         if isinstance(other, Number):
-            return (
-                Number(int(self.value >= other.value)).set_context(self.context),
-                None,
-            )
+            return _bools[self.value >= other.value], None
 
         return None, self._illegal(other)
 
     def anded_by(self, other):
         if isinstance(other, Number):
-            return Number(1 if (self.is_true() and other.is_true()) else 0), None
+            return _bools[self.is_true() and other.is_true()], None
 
         return None, self._illegal(other)
 
     def ored_by(self, other):
         if isinstance(other, Number):
-            return Number(1 if (self.is_true() or other.is_true()) else 0), None
+            return _bools[self.is_true() or other.is_true()], None
 
         return None, self._illegal(other)
 
     def notted(self):
-        return (Number(0), None) if self.is_true() else (Number(1), None)
+        return _bools[not self.is_true()], None
 
     def bitted_and_by(self, other):
         if isinstance(other, Number):
@@ -295,7 +276,7 @@ class Number(Value):
             if raw & 0x80000000:
                 raw -= 0x100000000
 
-            return Number(raw).set_context(self.context), None
+            return int_number(raw), None
 
         return None, self._illegal(other)
 
@@ -305,7 +286,7 @@ class Number(Value):
             if raw & 0x80000000:
                 raw -= 0x100000000
 
-            return Number(raw).set_context(self.context), None
+            return int_number(raw), None
 
         return None, self._illegal(other)
 
@@ -315,7 +296,7 @@ class Number(Value):
             if raw & 0x80000000:
                 raw -= 0x100000000
 
-            return Number(raw).set_context(self.context), None
+            return int_number(raw), None
 
         return None, self._illegal(other)
 
@@ -328,13 +309,13 @@ class Number(Value):
                 )
 
             if shift_amount >= 32:
-                return Number(0).set_context(self.context), None
+                return Number(0), None
 
             raw = (int(self.value) << shift_amount) & 0xFFFFFFFF
             if raw & 0x80000000:
                 raw -= 0x100000000
 
-            return Number(raw).set_context(self.context), None
+            return int_number(raw), None
 
         return None, self._illegal(other)
 
@@ -347,15 +328,13 @@ class Number(Value):
                 )
 
             if shift_amount >= 32:
-                return (Number(-1) if int(self.value) < 0 else Number(0)).set_context(
-                    self.context
-                ), None
+                return (Number(-1) if int(self.value) < 0 else Number(0)), None
 
             raw = int(self.value) >> shift_amount
             masked = raw & 0xFFFFFFFF
             result = masked - 0x100000000 if masked & 0x80000000 else masked
 
-            return Number(result).set_context(self.context), None
+            return int_number(result), None
 
         return None, self._illegal(other)
 
@@ -364,7 +343,7 @@ class Number(Value):
         if raw & 0x80000000:
             raw -= 0x100000000
 
-        return Number(raw).set_context(self.context), None
+        return int_number(raw), None
 
     def get_comparison_instanceof(self, other):
         from gladlang.values.classes.type_ import Type
@@ -389,14 +368,14 @@ class Number(Value):
             self.context,
         )
 
+    def hash_key(self):
+        return self.value
+
     def is_true(self):
         return self.value != 0
 
     def copy(self):
-        c = Number(self.value)
-        c.set_pos(self.pos_start, self.pos_end)
-        c.set_context(self.context)
-        return c
+        return Number(self.value)
 
     def execute(self, args, interpreter=None, calling_context=None):
         from gladlang.runtime.rt_result import RTResult
@@ -404,16 +383,19 @@ class Number(Value):
         return RTResult().failure(self._illegal())
 
     def get_attr(self, name_tok, context=None):
-        return None, self._illegal()
+        return None, self._illegal_at(name_tok, context)
 
     def set_attr(self, name_tok, value, context=None, visibility=None, as_final=False):
-        return None, self._illegal()
+        return None, self._illegal_at(name_tok, context)
 
     def get_element_at(self, index):
-        return None, self._illegal()
+        return None, self._illegal_at(index, index.context or self.context)
 
     def set_element_at(self, index, value):
-        return None, self._illegal()
+        return None, self._illegal_at(index, index.context or self.context)
+
+    def _illegal_at(self, source, context):
+        return RTError(source.pos_start, source.pos_end, "Illegal operation", context)
 
     def _illegal(self, other=None):
         if not other:
@@ -428,6 +410,57 @@ class Number(Value):
         return str(self.value)
 
 
+class FrozenNumber(Number):
+    __slots__ = ()
+
+    def copy(self):
+        return Number(self.value)
+
+    def type_name(self):
+        return "Number"
+
+
+def int_result(result, left, right):
+    if -MACHINE_INT_MAX <= result <= MACHINE_INT_MAX:
+        if SMALL_INT_MIN <= result <= SMALL_INT_MAX:
+            return _small_ints[result - SMALL_INT_MIN], None
+
+        return Number(result), None
+
+    if result.bit_length() > Number.MAX_INT_BITS:
+        return None, RTError(
+            right.pos_start,
+            right.pos_end,
+            "Arithmetic result too large (exceeds integer size limit)",
+            left.context,
+        )
+
+    return Number(result), None
+
+
+def int_number(value):
+    if SMALL_INT_MIN <= value <= SMALL_INT_MAX:
+        return _small_ints[value - SMALL_INT_MIN]
+
+    return Number(value)
+
+
+def shared_int(value):
+    if type(value) is int and SMALL_INT_MIN <= value <= SMALL_INT_MAX:
+        return _small_ints[value - SMALL_INT_MIN]
+
+    return None
+
+
+def bool_number(flag):
+    return _bools[bool(flag)]
+
+
+_small_ints = [FrozenNumber(n) for n in range(SMALL_INT_MIN, SMALL_INT_MAX + 1)]
+_bools = (_small_ints[-SMALL_INT_MIN], _small_ints[1 - SMALL_INT_MIN])
+
 Number.false = None
 Number.true = None
 Number.null = None
+Number.false_result = None
+Number.true_result = None
@@ -1,4 +1,24 @@
-"""String – immutable character sequence with concatenation, repetition, and indexing."""
+"""String – immutable character sequence with concatenation, repetition, and indexing.
+
+Concatenation results of at least ROPE_MIN_SIZE characters are ropes: the
+pieces are kept in a list and joined the first time ``value`` is read
+(indexing, comparison, printing, slicing, hashing as a Dict key). A rope
+that is extended again appends to the list it shares with its left operand
+when it owns that list's tail, so building a string with ``s = s + ...`` in
+a loop costs amortised O(1) per step instead of copying ``s`` each time.
+``length`` is always exact, so the MAX_STRING_SIZE checks never flatten.
+
+Slices of at least VIEW_MIN_SIZE characters are StringViews. A view
+refers to its source str and an offset, and it copies the window only
+when ``value`` is needed. Indexing, LEN, iteration and printing do not
+need it.
+
+Literals are interned and Dict keys are shared, so whether two equal
+strings are one object depends on how they were made. ``IS`` therefore
+compares contents, like ``==``, and never depends on that pooling.
+"""
+
+from itertools import islice
 
 from gladlang.core.errors import RTError
 from gladlang.values.primitives.number import Number
@@ -7,27 +27,64 @@ from gladlang.values.value import Value
 
 class String(Value):
     MAX_STRING_SIZE = 10_000_000
+    ROPE_MIN_SIZE = 256
+    VIEW_MIN_SIZE = 256
 
-    __slots__ = ("value", "pos_start", "pos_end", "context")
+    __slots__ = (
+        "_value",
+        "_parts",
+        "_count",
+        "length",
+    )
 
     def __init__(self, value):
-        self.value = value
-        self.pos_start = None
-        self.pos_end = None
-        self.context = None
-
-    def set_pos(self, pos_start=None, pos_end=None):
-        self.pos_start = pos_start
-        self.pos_end = pos_end
-        return self
-
-    def set_context(self, context=None):
-        self.context = context
-        return self
+        self._value = value
+        self._parts = None
+        self._count = 0
+        self.length = len(value)
+
+    @property
+    def value(self):
+        value = self._value
+        if value is None:
+            parts = self._parts
+            if self._count == len(parts):
+                value = "".join(parts)
+            else:
+                value = "".join(parts[: self._count])
+
+            self._value = value
+            self._parts = None
+
+        return value
+
+    @value.setter
+    def value(self, value):
+        self._value = value
+        self._parts = None
+        self._count = 0
+        self.length = len(value)
+
+    def _concat(self, suffix, new_len):
+        if new_len < String.ROPE_MIN_SIZE:
+            return String(self.value + suffix)
+
+        parts = self._parts
+        if parts is None or self._count != len(parts):
+            parts = [self.value]
+
+        parts.append(suffix)
+
+        result = String.__new__(String)
+        result._value = None
+        result._parts = parts
+        result._count = len(parts)
+        result.length = new_len
+        return result
 
     def added_to(self, other):
         if isinstance(other, String):
-            new_len = len(self.value) + len(other.value)
+            new_len = self.length + other.length
             if new_len > String.MAX_STRING_SIZE:
                 return None, RTError(
                     other.pos_start,
@@ -36,11 +93,11 @@ class String(Value):
                     self.context,
                 )
 
-            return String(self.value + other.value).set_context(self.context), None
+            return self._concat(other.value, new_len), None
 
         elif isinstance(other, Number):
             suffix = str(other.value)
-            new_len = len(self.value) + len(suffix)
+            new_len = self.length + len(suffix)
             if new_len > String.MAX_STRING_SIZE:
                 return None, RTError(
                     other.pos_start,
@@ -49,7 +106,7 @@ class String(Value):
                     self.context,
                 )
 
-            return String(self.value + suffix).set_context(self.context), None
+            return self._concat(suffix, new_len), None
 
         return None, self._illegal(other)
 
@@ -73,7 +130,7 @@ class String(Value):
                     self.context,
                 )
 
-            new_len = len(self.value) * multiplier
+            new_len = self.length * multiplier
             if new_len > String.MAX_STRING_SIZE:
                 return None, RTError(
                     other.pos_start,
@@ -82,14 +139,14 @@ class String(Value):
                     self.context,
                 )
 
-            return String(self.value * multiplier).set_context(self.context), None
+            return String(self.value * multiplier), None
 
         return None, self._illegal(other)
 
     def get_comparison_eq(self, other, visited=None):
         if isinstance(other, String):
             return (
-                Number(int(self.value == other.value)).set_context(self.context),
+                Number(int(self.value == other.value)),
                 None,
             )
 
@@ -98,7 +155,7 @@ class String(Value):
     def get_comparison_ne(self, other):
         if isinstance(other, String):
             return (
-                Number(int(self.value != other.value)).set_context(self.context),
+                Number(int(self.value != other.value)),
                 None,
             )
 
@@ -106,20 +163,20 @@ class String(Value):
 
     def get_comparison_lt(self, other):
         if isinstance(other, String):
-            return Number(int(self.value < other.value)).set_context(self.context), None
+            return Number(int(self.value < other.value)), None
 
         return None, self._illegal(other)
 
     def get_comparison_gt(self, other):
         if isinstance(other, String):
-            return Number(int(self.value > other.value)).set_context(self.context), None
+            return Number(int(self.value > other.value)), None
 
         return None, self._illegal(other)
 
     def get_comparison_lte(self, other):
         if isinstance(other, String):
             return (
-                Number(int(self.value <= other.value)).set_context(self.context),
+                Number(int(self.value <= other.value)),
                 None,
             )
 
@@ -128,14 +185,19 @@ class String(Value):
     def get_comparison_gte(self, other):
         if isinstance(other, String):
             return (
-                Number(int(self.value >= other.value)).set_context(self.context),
+                Number(int(self.value >= other.value)),
                 None,
             )
 
         return None, self._illegal(other)
 
     def get_comparison_is(self, other):
-        return Number(1 if self is other else 0).set_context(self.context), None
+        same = self is other or (
+            isinstance(other, String)
+            and self.length == other.length
+            and self.value == other.value
+        )
+        return Number(int(same)), None
 
     def get_comparison_instanceof(self, other):
         from gladlang.values.classes.type_ import Type
@@ -171,7 +233,7 @@ class String(Value):
 
         try:
             val = self.value[int(index.value)]
-            return String(val).set_context(self.context), None
+            return String(val), None
         except IndexError:
             return None, RTError(
                 self.pos_start,
@@ -180,21 +242,41 @@ class String(Value):
                 self.context,
             )
 
+    def get_slice(self, start, end):
+        value = self.value
+        begin, stop, _ = slice(start, end).indices(len(value))
+        if stop - begin >= String.VIEW_MIN_SIZE:
+            return StringView(value, begin, stop)
+
+        return String(value[start:end])
+
+    def chars(self):
+        return self.value
+
     def anded_by(self, other):
         is_true = self.is_true() and other.is_true()
-        return Number(1 if is_true else 0).set_context(self.context), None
+        return Number(1 if is_true else 0), None
 
     def ored_by(self, other):
         is_true = self.is_true() or other.is_true()
-        return Number(1 if is_true else 0).set_context(self.context), None
+        return Number(1 if is_true else 0), None
 
     def is_true(self):
-        return len(self.value) > 0
+        return self.length > 0
+
+    def hash_key(self):
+        return self.value
 
     def copy(self):
-        c = String(self.value)
-        c.set_pos(self.pos_start, self.pos_end)
-        c.set_context(self.context)
+        if self._value is None:
+            c = String.__new__(String)
+            c._value = None
+            c._parts = self._parts
+            c._count = self._count
+            c.length = self.length
+        else:
+            c = String(self._value)
+
         return c
 
     def execute(self, args, interpreter=None, calling_context=None):
@@ -225,3 +307,87 @@ class String(Value):
 
     def __repr__(self):
         return self.value
+
+
+class StringView(String):
+    __slots__ = ("_base", "_start")
+
+    def __init__(self, base, start, stop):
+        self._value = None
+        self._parts = None
+        self._count = 0
+        self.length = stop - start
+        self._base = base
+        self._start = start
+
+    @property
+    def value(self):
+        value = self._value
+        if value is None:
+            value = self._base[self._start : self._start + self.length]
+            self._value = value
+            self._base = None
+
+        return value
+
+    @value.setter
+    def value(self, value):
+        String.value.fset(self, value)
+        self._base = None
+
+    def materialize(self):
+        self.value
+        return self
+
+    def type_name(self):
+        return "String"
+
+    def get_element_at(self, index):
+        base = self._base
+        if base is None or not isinstance(index, Number):
+            return String.get_element_at(self, index)
+
+        i = int(index.value)
+        length = self.length
+        if -length <= i < length:
+            char = base[self._start + i % length]
+            return String(char), None
+
+        return None, RTError(
+            self.pos_start,
+            self.pos_end,
+            f"String index {index.value} out of bounds",
+            self.context,
+        )
+
+    def get_slice(self, start, end):
+        base = self._base
+        if base is None:
+            return String.get_slice(self, start, end)
+
+        begin, stop, _ = slice(start, end).indices(self.length)
+        begin += self._start
+        stop = max(begin, stop + self._start)
+        if stop - begin >= String.VIEW_MIN_SIZE:
+            return StringView(base, begin, stop)
+
+        return String(base[begin:stop])
+
+    def chars(self):
+        if self._base is None:
+            return self._value
+
+        return islice(self._base, self._start, self._start + self.length)
+
+    def copy(self):
+        if self._base is None:
+            return String.copy(self)
+
+        c = StringView(self._base, self._start, self._start + self.length)
+        return c
+
+    def __repr__(self):
+        if self._base is None:
+            return self._value
+
+        return self._base[self._start : self._start + self.length]
@@ -0,0 +1,182 @@
+"""Vector built-ins – element-wise arithmetic over numeric Lists in one native pass.
+
+Each operation reads the raw numbers of its List arguments once (a NumArray
+hands over its buffer without boxing) and runs the whole computation with
+map / reduce / min / max. Results get the same limits as Number: an
+integer longer than Number.MAX_INT_BITS or an infinite float is an error,
+while NaN passes through as it does in Number's + - and *.
+
+Element-wise results are NumArrays when an argument was a NumArray and
+the result still fits one, and plain Lists otherwise.
+"""
+
+import math
+import operator
+from functools import reduce
+from itertools import repeat
+
+from gladlang.values.primitives.number import Number, int_number
+from gladlang.values.primitives.list import List
+from gladlang.values.primitives.num_array import NumArray
+
+TOO_LARGE = "Arithmetic result too large (exceeds integer size limit)"
+INFINITE = "Arithmetic result is infinite (float overflow)"
+
+
+def box(raw):
+    if type(raw) is int:
+        return int_number(raw)
+
+    return Number(raw)
+
+
+def check_result(raw):
+    if type(raw) is float:
+        if math.isinf(raw):
+            return INFINITE
+    elif raw.bit_length() > Number.MAX_INT_BITS:
+        return TOO_LARGE
+
+    return None
+
+
+def check_values(values):
+    kinds = set(map(type, values))
+
+    if float in kinds:
+        floats = values if len(kinds) == 1 else [v for v in values if type(v) is float]
+        if any(map(math.isinf, floats)):
+            return INFINITE
+
+    if int in kinds:
+        ints = values if len(kinds) == 1 else [v for v in values if type(v) is int]
+        if max(map(abs, ints)).bit_length() > Number.MAX_INT_BITS:
+            return TOO_LARGE
+
+    return None
+
+
+def numbers_of(name, value):
+    values = value.raw_numbers() if isinstance(value, List) else None
+    if values is None:
+        return None, f"{name} expects a List of Numbers"
+
+    return values, None
+
+
+def pair_of(name, first, second):
+    a, message = numbers_of(name, first)
+    if message:
+        return None, None, message
+
+    b, message = numbers_of(name, second)
+    if message:
+        return None, None, message
+
+    if len(a) != len(b):
+        return None, None, (
+            f"{name} expects Lists of equal length (got {len(a)} and {len(b)})"
+        )
+
+    return a, b, None
+
+
+def scalar_of(name, value):
+    if not isinstance(value, Number):
+        return None, f"{name} expects a Number as its second argument"
+
+    return value.value, None
+
+
+def number_result(raw):
+    message = check_result(raw)
+    if message:
+        return None, message
+
+    return box(raw), None
+
+
+def list_result(values, sources):
+    message = check_values(values)
+    if message:
+        return None, message
+
+    if any(type(source) is NumArray for source in sources):
+        num_array = NumArray.from_values(values)
+        if num_array is not None:
+            return num_array, None
+
+    return List([box(raw) for raw in values]), None
+
+
+def vsum(args):
+    values, message = numbers_of("VSUM", args[0])
+    if message:
+        return None, message
+
+    return number_result(reduce(operator.add, values, 0))
+
+
+def vmin(args):
+    return extreme("VMIN", min, args[0])
+
+
+def vmax(args):
+    return extreme("VMAX", max, args[0])
+
+
+def extreme(name, pick, value):
+    values, message = numbers_of(name, value)
+    if message:
+        return None, message
+
+    if not len(values):
+        return None, f"{name} of an empty List"
+
+    return box(pick(values)), None
+
+
+def vdot(args):
+    a, b, message = pair_of("VDOT", args[0], args[1])
+    if message:
+        return None, message
+
+    return number_result(reduce(operator.add, map(operator.mul, a, b), 0))
+
+
+def elementwise(name, op):
+    def run(args):
+        a, b, message = pair_of(name, args[0], args[1])
+        if message:
+            return None, message
+
+        return list_result(list(map(op, a, b)), args)
+
+    return run
+
+
+def mapped(name, op):
+    def run(args):
+        values, message = numbers_of(name, args[0])
+        if message:
+            return None, message
+
+        scalar, message = scalar_of(name, args[1])
+        if message:
+            return None, message
+
+        return list_result(list(map(op, values, repeat(scalar))), args[:1])
+
+    return run
+
+
+VECTOR_BUILTINS = {
+    "VSUM": (["values"], vsum),
+    "VMIN": (["values"], vmin),
+    "VMAX": (["values"], vmax),
+    "VDOT": (["a", "b"], vdot),
+    "VADD": (["a", "b"], elementwise("VADD", operator.add)),
+    "VMUL": (["a", "b"], elementwise("VMUL", operator.mul)),
+    "VMAP_ADD": (["values", "n"], mapped("VMAP_ADD", operator.add)),
+    "VMAP_MUL": (["values", "n"], mapped("VMAP_MUL", operator.mul)),
+}
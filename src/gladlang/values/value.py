@@ -1,23 +1,39 @@
-"""Base Value class – defines the interface for all GladLang runtime objects."""
+"""Base Value class – defines the interface for all GladLang runtime objects.
+
+Data values (Numbers, Strings, Lists, Dicts, instances) hold only their
+payload. They have no position or context, set_pos / set_context are
+no-ops, and the errors they return are unpositioned. The engine that
+surfaces such an error fills in the node and context of the failing
+operation with RTError.locate. Values that need a position or a context
+at runtime (functions, classes, types, enums, SUPER) declare the slots
+and override set_pos / set_context.
+
+hash_key() returns the Python object a Dict stores for this value as a
+key, or None when the value cannot be a key. Values that are equal under
+``==`` have equal hash keys.
+
+type_name() is the type error messages show. Subclasses that only change
+how a value is stored (pooled Numbers, slice views) report the type they
+stand in for.
+"""
 
 
 class Value:
-    __slots__ = ("pos_start", "pos_end", "context")
+    __slots__ = ()
 
-    def __init__(self):
-        self.pos_start = None
-        self.pos_end = None
-        self.context = None
+    pos_start = None
+    pos_end = None
+    context = None
 
     def set_pos(self, pos_start=None, pos_end=None):
-        self.pos_start = pos_start
-        self.pos_end = pos_end
         return self
 
     def set_context(self, context=None):
-        self.context = context
         return self
 
+    def type_name(self):
+        return type(self).__name__
+
     def added_to(self, other):
         return None, self.illegal_operation(other)
 
@@ -50,9 +66,9 @@ class Value:
             return None, error
 
         if result.is_true():
-            return Number(0).set_context(self.context), None
+            return Number(0), None
         else:
-            return Number(1).set_context(self.context), None
+            return Number(1), None
 
     def get_comparison_lt(self, other):
         return None, self.illegal_operation(other)
@@ -69,7 +85,7 @@ class Value:
     def get_comparison_is(self, other):
         from gladlang.values.primitives.number import Number
 
-        return Number(1 if self is other else 0).set_context(self.context), None
+        return Number(1 if self is other else 0), None
 
     def get_comparison_instanceof(self, other):
         from gladlang.values.primitives.number import Number
@@ -119,14 +135,14 @@ class Value:
 
         is_true = self.is_true() and other.is_true()
 
-        return Number(1 if is_true else 0).set_context(self.context), None
+        return Number(1 if is_true else 0), None
 
     def ored_by(self, other):
         from gladlang.values.primitives.number import Number
 
         is_true = self.is_true() or other.is_true()
 
-        return Number(1 if is_true else 0).set_context(self.context), None
+        return Number(1 if is_true else 0), None
 
     def notted(self):
         return None, self.illegal_operation()
@@ -151,6 +167,9 @@ class Value:
     def is_true(self):
         return True
 
+    def hash_key(self):
+        return None
+
     def copy(self):
         raise Exception("No copy method defined")
 